@@ -1,34 +1,46 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.task_repository import TaskRepository
+from app.repositories.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from app.services.async_project_service import AsyncProjectService
+from app.services.async_task_service import AsyncTaskService
+from app.services.export_service import ExportService
 from app.services.project_service import ProjectService
 from app.services.task_service import TaskService
 
 
 def get_session() -> Generator[Session, None, None]:
-    """Provide a database session for FastAPI dependencies."""
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+    """
+    Provide a database session for FastAPI dependencies.
 
+    The whole request runs in one unit of work: it is committed once after
+    the handler returns, or rolled back if the handler raises. Depend on it
+    with `scope="function"` so the commit happens before the response is
+    sent and a failed commit is reported to the client.
+    """
+    with UnitOfWork() as uow:
+        yield uow.session
 
-def get_project_service(session: Session = Depends(get_session)) -> ProjectService:
+
+def get_project_service(
+    session: Session = Depends(get_session, scope="function"),
+) -> ProjectService:
     """Provide a ProjectService instance for request handlers."""
     project_repo = ProjectRepository(session=session)
     # Same limit used in the CLI entrypoint
     return ProjectService(project_repo=project_repo, max_projects=20)
 
 
-def get_task_service(session: Session = Depends(get_session)) -> TaskService:
+def get_task_service(
+    session: Session = Depends(get_session, scope="function"),
+) -> TaskService:
     """Provide a TaskService instance for request handlers."""
     project_repo = ProjectRepository(session=session)
     task_repo = TaskRepository(session=session)
@@ -37,3 +49,38 @@ def get_task_service(session: Session = Depends(get_session)) -> TaskService:
         project_repo=project_repo,
         max_tasks_per_project=20,
     )
+
+
+def get_export_service(
+    session: Session = Depends(get_session),
+) -> ExportService:
+    """
+    Provide an ExportService for streaming responses.
+
+    Unlike the other dependencies this keeps the default request scope:
+    the session must stay open until the streamed body has been sent.
+    """
+    return ExportService(
+        project_repo=ProjectRepository(session=session),
+        task_repo=TaskRepository(session=session),
+    )
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of get_session, wrapping the request in an AsyncUnitOfWork."""
+    async with AsyncUnitOfWork() as uow:
+        yield uow.session
+
+
+def get_async_project_service(
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> AsyncProjectService:
+    """Provide an AsyncProjectService instance for async request handlers."""
+    return AsyncProjectService(session=session, max_projects=20)
+
+
+def get_async_task_service(
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> AsyncTaskService:
+    """Provide an AsyncTaskService instance for async request handlers."""
+    return AsyncTaskService(session=session, max_tasks_per_project=20)
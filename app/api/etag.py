@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that determine a representation.
+
+    Callers pass a resource kind, its version stamp and every query
+    parameter that changes the response body (limit, cursor, ...).
+    """
+    raw = "\x1f".join(str(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.sha1(raw).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header lists `etag` (or is `*`)."""
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """An empty 304 response carrying the current ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
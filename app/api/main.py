@@ -1,16 +1,86 @@
 from __future__ import annotations
 
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api.metrics import MetricsMiddleware, router as metrics_router
+from app.api.query_debug import QueryDebugMiddleware
+from app.api.routes import (
+    async_projects,
+    async_tasks,
+    export,
+    internal,
+    projects,
+    search,
+    task_query,
+    tasks,
+)
+from app.commands.deadline_scheduler import DeadlineScheduler
+from app.db.pool import warm_pool
+from app.db.session import DB_POOL_SIZE, DB_POOL_WARMUP, engine
+
+logger = logging.getLogger(__name__)
+
+# Serve projects/tasks from the asyncio stack instead of the threadpool
+API_ASYNC = os.getenv("API_ASYNC", "false").lower() == "true"
+# Run the deadline scheduler inside the API process, where it hears about
+# new deadlines as soon as they are committed. Enable it on one replica.
+AUTOCLOSE_IN_API = os.getenv("AUTOCLOSE_IN_API", "false").lower() == "true"
+# Record request and SQL metrics and serve them at /metrics
+API_METRICS = os.getenv("API_METRICS", "true").lower() == "true"
+# Report each request's SQL statements in X-DB-* headers and the log
+API_DEBUG_QUERIES = os.getenv("API_DEBUG_QUERIES", "false").lower() == "true"
 
-from app.api.routes import projects, tasks
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Open the pool's connections up front so the first requests don't pay
+    for it, and run the deadline scheduler if AUTOCLOSE_IN_API is set.
+    """
+    if DB_POOL_WARMUP:
+        try:
+            opened = await run_in_threadpool(warm_pool, engine, DB_POOL_SIZE)
+            logger.info("Warmed database pool with %d connection(s)", opened)
+        except SQLAlchemyError as exc:
+            # The API can still start; connections will be opened on demand.
+            logger.warning("Could not warm database pool: %s", exc)
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
+    scheduler = DeadlineScheduler() if AUTOCLOSE_IN_API else None
+    if scheduler is not None:
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            scheduler.stop(timeout=5)
+
+
+def create_app(
+    async_routes: bool = API_ASYNC,
+    metrics: bool = API_METRICS,
+    debug_queries: bool = API_DEBUG_QUERIES,
+) -> FastAPI:
+    """
+    Create and configure the FastAPI application.
+
+    With `async_routes` the project and task endpoints are `async def`
+    handlers on the AsyncSession stack; otherwise they are the sync
+    handlers that FastAPI runs in its threadpool. With `metrics` every
+    request is measured and the Prometheus metrics are served at /metrics;
+    with `debug_queries` responses report their SQL statements in headers.
+    """
     app = FastAPI(
         title="ToDo List Web API",
         version="0.1.0",
         description="Web API for managing projects and tasks.",
+        lifespan=lifespan,
     )
 
     @app.get("/api/v1/health", tags=["health"])
@@ -18,8 +88,22 @@ def create_app() -> FastAPI:
         return {"status": "ok"}
 
     # Register versioned API routers
-    app.include_router(projects.router, prefix="/api/v1")
-    app.include_router(tasks.router, prefix="/api/v1")
+    if async_routes:
+        app.include_router(async_projects.router, prefix="/api/v1")
+        app.include_router(async_tasks.router, prefix="/api/v1")
+    else:
+        app.include_router(projects.router, prefix="/api/v1")
+        app.include_router(tasks.router, prefix="/api/v1")
+    app.include_router(task_query.router, prefix="/api/v1")
+    app.include_router(search.router, prefix="/api/v1")
+    app.include_router(export.router, prefix="/api/v1")
+    app.include_router(internal.router, prefix="/api/v1")
+
+    if metrics:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
+    if debug_queries:
+        app.add_middleware(QueryDebugMiddleware)
 
     return app
 
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Dict
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from sqlalchemy.pool import QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.pool import InstrumentedQueuePool
+from app.db.query_tracker import track_queries
+from app.db.session import engine
+from app.metrics import CONTENT_TYPE, LabelValues, registry
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+DB_STATEMENTS = registry.counter(
+    "db_statements_total",
+    "SQL statements executed while serving each route.",
+    ("route",),
+)
+DB_STATEMENT_SECONDS = registry.counter(
+    "db_statement_seconds_total",
+    "Time spent executing SQL statements while serving each route.",
+    ("route",),
+)
+DB_REQUEST_STATEMENTS = registry.histogram(
+    "db_statements_per_request",
+    "SQL statements executed per request, by route template.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+
+# Route label for requests that matched no route, so unknown paths can't
+# grow the label set without bound.
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _pool_values() -> Dict[LabelValues, float]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    values = {
+        ("size",): pool.size(),
+        ("checked_out",): pool.checkedout(),
+        ("checked_in",): pool.checkedin(),
+        ("overflow",): pool.overflow(),
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats = pool.stats.snapshot()
+        values[("max_in_use",)] = stats["max_in_use"]
+    return values
+
+
+def _pool_stat(key: str, scale: float = 1.0) -> Callable[[], Dict[LabelValues, float]]:
+    def read() -> Dict[LabelValues, float]:
+        pool = engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            return {}
+        return {(): pool.stats.snapshot()[key] * scale}
+
+    return read
+
+
+registry.gauge(
+    "db_pool_connections",
+    "Connection pool of the primary database, read at scrape time.",
+    ("state",),
+    callback=_pool_values,
+)
+registry.counter(
+    "db_pool_timeouts_total",
+    "Checkouts from the primary database pool that timed out.",
+    callback=_pool_stat("timeouts"),
+)
+registry.gauge(
+    "db_pool_max_wait_seconds",
+    "Longest wait for a connection from the primary database pool.",
+    callback=_pool_stat("max_wait_ms", scale=0.001),
+)
+
+
+def route_label(scope: Scope) -> str:
+    """
+    The route template that matched a request, with its include prefix.
+
+    Newer FastAPI versions leave the prefix given to `include_router` off
+    the matched route's path. It is recovered from the request path: the
+    template rendered with the path parameters is its suffix.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status and SQL statements of every HTTP request.
+
+    A plain ASGI middleware rather than BaseHTTPMiddleware, which would
+    add a task and a memory stream per request. Requests are labelled by
+    their route template, e.g. `/api/v1/projects/{project_id}`, which is
+    only known once the router has matched them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            with track_queries() as statements:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            label = route_label(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method=method, route=label, status=status_code)
+            HTTP_DURATION.observe(elapsed, method=method, route=label)
+            DB_REQUEST_STATEMENTS.observe(statements.count, route=label)
+            if statements.count:
+                DB_STATEMENTS.inc(statements.count, route=label)
+                DB_STATEMENT_SECONDS.inc(statements.seconds, route=label)
+
+
+router = APIRouter(tags=["internal"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """All metrics in the Prometheus text exposition format."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
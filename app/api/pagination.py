@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+from typing import Any, Optional
+
+from fastapi import HTTPException, Query, status
+
+# Page size limits for list endpoints, configurable through the environment
+DEFAULT_PAGE_LIMIT = int(os.getenv("API_PAGE_LIMIT_DEFAULT", "50"))
+MAX_PAGE_LIMIT = int(os.getenv("API_PAGE_LIMIT_MAX", "500"))
+
+
+def encode_cursor(key: Any) -> Optional[str]:
+    """Encode a keyset position as an opaque URL-safe cursor string."""
+    if key is None:
+        return None
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Any:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises a 400 HTTPException if the cursor is malformed.
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode a cursor whose keyset position is a single integer id."""
+    key = decode_cursor(cursor)
+    if key is not None and (not isinstance(key, int) or isinstance(key, bool)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return key
+
+
+def limit_query() -> Any:
+    """Query parameter declaration shared by all paginated endpoints."""
+    return Query(
+        DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description="Maximum number of items to return",
+    )
+
+
+def cursor_query() -> Any:
+    """Query parameter declaration for the opaque `next_cursor` of a previous page."""
+    return Query(
+        None,
+        description="Opaque cursor returned as `next_cursor` by the previous page",
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.metrics import route_label
+from app.db.query_tracker import (
+    QUERY_REPEAT_THRESHOLD,
+    log_query_stats,
+    track_queries,
+)
+
+
+class QueryDebugMiddleware:
+    """
+    Report each request's SQL statements in response headers (debug only).
+
+    - X-DB-Query-Count: statements executed before the response started
+    - X-DB-Query-Time-Ms: their total execution time
+    - X-DB-Repeated-Queries: how many statement shapes ran at least
+      QUERY_REPEAT_THRESHOLD times, a hint of an N+1 pattern
+
+    Each request is also logged; repeated shapes as warnings. Statements
+    run after the response has started, e.g. by background tasks, are
+    logged but not in the headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    repeated = len(stats.repeated(QUERY_REPEAT_THRESHOLD))
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (b"x-db-query-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                        (b"x-db-repeated-queries", str(repeated).encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                stats.name = f"{scope['method']} {route_label(scope)}"
+                log_query_stats(stats)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.api.etag import etag_matches, make_etag, not_modified
+from app.api.fast_json import (
+    FastJSONResponse,
+    fields_of,
+    item_content,
+    page_content,
+)
+from app.api.pagination import encode_cursor
+from app.api.schemas import (
+    ProjectRead,
+    ProjectStats,
+    TaskBatchItemError,
+    TaskBatchResult,
+    TaskBulkStatusResult,
+    TaskRead,
+    TaskStatsTotals,
+)
+from app.repositories.pagination import Page
+from app.repositories.read_models import (
+    ProjectStatsView,
+    ProjectView,
+    TaskStatsTotalsView,
+    TaskView,
+)
+from app.services.task_service import BatchCreateResult
+
+# Response and ETag building shared by the sync and async routers, so the
+# two stacks can only differ in how they reach the database.
+
+PROJECT_FIELDS = fields_of(ProjectRead)
+STATS_FIELDS = fields_of(ProjectStats)
+TOTALS_FIELDS = fields_of(TaskStatsTotals)
+TASK_FIELDS = fields_of(TaskRead)
+
+
+def project_page_response(
+    request: Request,
+    page: Page[ProjectView],
+    limit: int,
+    cursor: Optional[str],
+) -> Response:
+    """
+    A page of projects, or 304 if the client's copy is current.
+
+    The ETag covers the id and version of every project on the page and
+    the next page's position, so it changes whenever the body would.
+    """
+    etag = make_etag(
+        "projects",
+        limit,
+        cursor,
+        page.next_key,
+        *(f"{project.id}:{project.version}" for project in page.items),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return FastJSONResponse(
+        page_content(page.items, PROJECT_FIELDS, encode_cursor(page.next_key)),
+        headers={"ETag": etag},
+    )
+
+
+def project_stats_page_response(
+    page: Page[ProjectStatsView],
+    totals: Optional[TaskStatsTotalsView],
+) -> Response:
+    """A page of project statistics; `totals` is None after the first page."""
+    content = page_content(page.items, STATS_FIELDS, encode_cursor(page.next_key))
+    content["totals"] = None if totals is None else item_content(totals, TOTALS_FIELDS)
+    return FastJSONResponse(content)
+
+
+def project_etag(project_id: int, version: int) -> str:
+    return make_etag("project", project_id, version)
+
+
+def task_page_etag(
+    project_id: int,
+    version: int,
+    limit: int,
+    cursor: Optional[str],
+) -> str:
+    """Every task mutation bumps the project's version, which covers the page."""
+    return make_etag("tasks", project_id, version, limit, cursor)
+
+
+def task_etag(project_id: int, task_id: int, version: int) -> str:
+    return make_etag("task", project_id, task_id, version)
+
+
+def if_none_match(request: Request, etag: str) -> Optional[Response]:
+    """The 304 answer if the request's If-None-Match lists `etag`, else None."""
+    return not_modified(etag) if etag_matches(request, etag) else None
+
+
+def item_response(
+    item: Any,
+    fields: Sequence[str],
+    etag: Optional[str] = None,
+) -> Response:
+    headers = {"ETag": etag} if etag is not None else None
+    return FastJSONResponse(item_content(item, fields), headers=headers)
+
+
+def task_page_response(page: Page[TaskView], etag: str) -> Response:
+    return FastJSONResponse(
+        page_content(page.items, TASK_FIELDS, encode_cursor(page.next_key)),
+        headers={"ETag": etag},
+    )
+
+
+def project_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Project not found",
+    )
+
+
+def task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Task not found for this project",
+    )
+
+
+def batch_result(result: BatchCreateResult, mode: str) -> TaskBatchResult:
+    """
+    The response to a batch create.
+
+    In all_or_nothing mode any invalid item fails the whole request with
+    400 and the per-item errors.
+    """
+    errors = [
+        TaskBatchItemError(index=error.index, detail=error.message)
+        for error in result.errors
+    ]
+    if errors and mode == "all_or_nothing":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "No tasks were created because some items are invalid.",
+                "errors": [error.model_dump() for error in errors],
+            },
+        )
+    return TaskBatchResult(created=result.created, errors=errors)
+
+
+def bulk_status_result(
+    updated: Sequence[Any],
+    task_ids: Iterable[int],
+) -> TaskBulkStatusResult:
+    """The response to a bulk status change; ids that matched nothing are listed."""
+    updated_ids = {task.id for task in updated}
+    not_found = sorted(set(task_ids) - updated_ids)
+    return TaskBulkStatusResult(updated=updated, not_found=not_found)
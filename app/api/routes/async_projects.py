@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Request,
+    Response,
+    status,
+)
+
+from app.api.dependencies import get_async_project_service
+from app.api.pagination import cursor_query, decode_id_cursor, limit_query
+from app.api.responses import (
+    PROJECT_FIELDS,
+    STATS_FIELDS,
+    if_none_match,
+    item_response,
+    project_etag,
+    project_not_found,
+    project_page_response,
+    project_stats_page_response,
+)
+from app.api.schemas import (
+    ProjectCreate,
+    ProjectPage,
+    ProjectRead,
+    ProjectStats,
+    ProjectStatsPage,
+    ProjectUpdate,
+)
+from app.commands.delete_project import (
+    PROJECT_DELETE_BACKGROUND_THRESHOLD,
+    delete_project_in_chunks,
+)
+from app.exceptions import NotFoundError
+from app.services.async_project_service import AsyncProjectService
+
+router = APIRouter(
+    prefix="/projects",
+    tags=["projects"],
+)
+
+
+@router.get(
+    "",
+    response_model=ProjectPage,
+    summary="List projects",
+)
+async def list_projects(
+    request: Request,
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> Response:
+    """Return one page of projects ordered by id; see the sync handler."""
+    page = await service.get_projects_view_page(
+        limit=limit,
+        after_id=decode_id_cursor(cursor),
+    )
+    return project_page_response(request, page, limit, cursor)
+
+
+@router.get(
+    "/stats",
+    response_model=ProjectStatsPage,
+    summary="Task statistics of all projects",
+)
+async def get_projects_stats(
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> Response:
+    """Return one page of project statistics; see the sync handler."""
+    after_id = decode_id_cursor(cursor)
+    page = await service.get_projects_stats_page(limit=limit, after_id=after_id)
+    totals = await service.get_stats_totals() if after_id is None else None
+    return project_stats_page_response(page, totals)
+
+
+@router.get(
+    "/{project_id}/stats",
+    response_model=ProjectStats,
+    summary="Task statistics of a project",
+)
+async def get_project_stats(
+    project_id: int,
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> Response:
+    """Return one project's task statistics, computed in a single query."""
+    try:
+        stats = await service.get_project_stats(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return item_response(stats, STATS_FIELDS)
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectRead,
+    summary="Get a project",
+)
+async def get_project(
+    project_id: int,
+    request: Request,
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> Response:
+    """Return one project; answers If-None-Match from its version stamp alone."""
+    try:
+        etag = project_etag(project_id, await service.get_project_version(project_id))
+        not_modified = if_none_match(request, etag)
+        if not_modified is not None:
+            return not_modified
+        project = await service.get_project(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return item_response(project, PROJECT_FIELDS, etag)
+
+
+@router.post(
+    "",
+    response_model=ProjectRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a new project",
+)
+async def create_project(
+    payload: ProjectCreate,
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectRead:
+    """Create a new project."""
+    return await service.create_project(
+        name=payload.name,
+        description=payload.description,
+    )
+
+
+@router.put(
+    "/{project_id}",
+    response_model=ProjectRead,
+    summary="Update an existing project",
+)
+async def update_project(
+    project_id: int,
+    payload: ProjectUpdate,
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectRead:
+    """Update an existing project."""
+    return await service.edit_project(
+        project_id=project_id,
+        new_name=payload.name,
+        new_description=payload.description,
+    )
+
+
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete a project",
+)
+async def delete_project(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> Response:
+    """
+    Delete a project by id; its tasks go with it through ON DELETE CASCADE.
+
+    With PROJECT_DELETE_BACKGROUND_THRESHOLD set, a project with more tasks
+    than that is answered with 202 and deleted after the response in
+    chunked transactions, so no single transaction locks all its tasks.
+    """
+    try:
+        if PROJECT_DELETE_BACKGROUND_THRESHOLD:
+            project = await service.get_project(project_id)
+            if project.task_count > PROJECT_DELETE_BACKGROUND_THRESHOLD:
+                background_tasks.add_task(delete_project_in_chunks, project_id)
+                return Response(status_code=status.HTTP_202_ACCEPTED)
+        await service.delete_project(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_async_session
+from app.api.pagination import cursor_query, decode_id_cursor, limit_query
+from app.api.responses import (
+    TASK_FIELDS,
+    batch_result,
+    bulk_status_result,
+    if_none_match,
+    item_response,
+    project_not_found,
+    task_etag,
+    task_not_found,
+    task_page_etag,
+    task_page_response,
+)
+from app.api.schemas import (
+    TaskBatchCreate,
+    TaskBatchResult,
+    TaskBulkStatusResult,
+    TaskBulkStatusUpdate,
+    TaskCreate,
+    TaskPage,
+    TaskRead,
+    TaskUpdate,
+)
+from app.exceptions import NotFoundError
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.services.async_task_service import AsyncTaskService
+from app.services.task_service import NewTask
+
+router = APIRouter(prefix="/projects", tags=["tasks"])
+
+
+def _get_task_service(session: AsyncSession) -> AsyncTaskService:
+    return AsyncTaskService(session=session, max_tasks_per_project=20)
+
+
+async def _get_project_version(session: AsyncSession, project_id: int) -> int:
+    """Read a project's version stamp, answering 404 if it doesn't exist."""
+    try:
+        return await AsyncProjectRepository(session=session).get_version(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+
+@router.get("/{project_id}/tasks", response_model=TaskPage)
+async def list_project_tasks(
+    project_id: int,
+    request: Request,
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> Response:
+    """Return one page of tasks for the given project; see the sync handler."""
+    after_id = decode_id_cursor(cursor)
+    version = await _get_project_version(session, project_id)
+
+    etag = task_page_etag(project_id, version, limit, cursor)
+    not_modified = if_none_match(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    page = await AsyncTaskRepository(session=session).list_by_project_view_page(
+        project_id,
+        limit=limit,
+        after_id=after_id,
+    )
+    return task_page_response(page, etag)
+
+
+@router.get("/{project_id}/tasks/{task_id}", response_model=TaskRead)
+async def get_task(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> Response:
+    """Return one task of the given project; see the sync handler."""
+    version = await _get_project_version(session, project_id)
+
+    etag = task_etag(project_id, task_id, version)
+    not_modified = if_none_match(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        task = await AsyncTaskRepository(session=session).get_view(task_id)
+    except NotFoundError:
+        task = None
+
+    if task is None or task.project_id != project_id:
+        raise task_not_found()
+
+    return item_response(task, TASK_FIELDS, etag)
+
+
+@router.post(
+    "/{project_id}/tasks",
+    response_model=TaskRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_task_for_project(
+    project_id: int,
+    payload: TaskCreate,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> TaskRead:
+    service = _get_task_service(session)
+
+    try:
+        task = await service.create_task(
+            project_id=project_id,
+            title=payload.title,
+            description=payload.description,
+            deadline=payload.deadline,
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return task
+
+
+@router.post(
+    "/{project_id}/tasks:batch",
+    response_model=TaskBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_batch(
+    project_id: int,
+    payload: TaskBatchCreate,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> TaskBatchResult:
+    """Create many tasks in one request; see the sync handler for the modes."""
+    service = _get_task_service(session)
+    items = [
+        NewTask(
+            title=item.title,
+            description=item.description,
+            deadline=item.deadline,
+        )
+        for item in payload.items
+    ]
+
+    try:
+        result = await service.create_tasks_batch(
+            project_id=project_id,
+            items=items,
+            partial=payload.mode == "partial",
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return batch_result(result, payload.mode)
+
+
+@router.post(
+    "/{project_id}/tasks:batch-status",
+    response_model=TaskBulkStatusResult,
+)
+async def change_tasks_status(
+    project_id: int,
+    payload: TaskBulkStatusUpdate,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> TaskBulkStatusResult:
+    """Move many tasks of a project to the same status in one statement."""
+    service = _get_task_service(session)
+
+    try:
+        updated = await service.change_status_many(
+            task_ids=payload.task_ids,
+            new_status=payload.status,
+            project_id=project_id,
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return bulk_status_result(updated, payload.task_ids)
+
+
+@router.patch(
+    "/{project_id}/tasks/{task_id}",
+    response_model=TaskRead,
+)
+async def update_task(
+    project_id: int,
+    task_id: int,
+    payload: TaskUpdate,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> Response:
+    """Apply a partial update to one task of the given project; see the sync handler."""
+    service = _get_task_service(session)
+
+    try:
+        task = await service.patch_project_task(
+            project_id,
+            task_id,
+            title=payload.title,
+            description=payload.description,
+            deadline=payload.deadline,
+            status=payload.status,
+        )
+    except NotFoundError:
+        raise task_not_found()
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return item_response(task, TASK_FIELDS)
+
+
+@router.delete(
+    "/{project_id}/tasks/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_task(
+    project_id: int,
+    task_id: int,
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+) -> None:
+    """Delete one task of the given project with a single scoped DELETE."""
+    service = _get_task_service(session)
+
+    try:
+        await service.delete_project_task(project_id, task_id)
+    except NotFoundError:
+        raise task_not_found()
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return None
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_export_service
+from app.services.export_service import ExportService, gzip_chunks
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="Export all projects and tasks as NDJSON",
+)
+def export_all(
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Stream every project, then every task, as newline-delimited JSON.
+
+    Rows are read with server-side cursors and sent batch by batch, so
+    the export never has to fit in memory.
+    """
+    chunks = service.iter_ndjson()
+    if gzip:
+        return StreamingResponse(
+            gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": 'attachment; filename="export.ndjson.gz"'},
+        )
+    return StreamingResponse(
+        chunks,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="export.ndjson"'},
+    )
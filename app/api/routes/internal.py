@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.db.pool import get_pool_stats
+from app.db.session import engine
+from app.repositories.cache import project_cache
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/pool", summary="Connection pool statistics")
+def pool_stats() -> Dict[str, Any]:
+    """Return the database pool configuration, usage and wait statistics."""
+    return get_pool_stats(engine)
+
+
+@router.get("/cache", summary="Project lookup cache statistics")
+def cache_stats() -> Dict[str, Any]:
+    """Return the size, hit/miss counters and settings of the project cache."""
+    return project_cache.stats()
@@ -1,11 +1,41 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Request,
+    Response,
+    status,
+)
 
 from app.api.dependencies import get_project_service
-from app.api.schemas import ProjectCreate, ProjectRead, ProjectUpdate
+from app.api.pagination import cursor_query, decode_id_cursor, limit_query
+from app.api.responses import (
+    PROJECT_FIELDS,
+    STATS_FIELDS,
+    if_none_match,
+    item_response,
+    project_etag,
+    project_not_found,
+    project_page_response,
+    project_stats_page_response,
+)
+from app.api.schemas import (
+    ProjectCreate,
+    ProjectPage,
+    ProjectRead,
+    ProjectStats,
+    ProjectStatsPage,
+    ProjectUpdate,
+)
+from app.commands.delete_project import (
+    PROJECT_DELETE_BACKGROUND_THRESHOLD,
+    delete_project_in_chunks,
+)
+from app.exceptions import NotFoundError
 from app.services.project_service import ProjectService
 
 router = APIRouter(
@@ -16,14 +46,94 @@ router = APIRouter(
 
 @router.get(
     "",
-    response_model=List[ProjectRead],
-    summary="List all projects",
+    response_model=ProjectPage,
+    summary="List projects",
 )
 def list_projects(
+    request: Request,
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    service: ProjectService = Depends(get_project_service),
+) -> Response:
+    """
+    Return one page of projects ordered by id.
+
+    The ETag covers the id and version of every project on the page and
+    the next page's position, so an unchanged page is answered with 304
+    before it is serialized. Rows are selected as ProjectView read models
+    and encoded straight to JSON without building ProjectRead models.
+    """
+    page = service.get_projects_view_page(
+        limit=limit,
+        after_id=decode_id_cursor(cursor),
+    )
+    return project_page_response(request, page, limit, cursor)
+
+
+@router.get(
+    "/stats",
+    response_model=ProjectStatsPage,
+    summary="Task statistics of all projects",
+)
+def get_projects_stats(
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    service: ProjectService = Depends(get_project_service),
+) -> Response:
+    """
+    Return task statistics of one page of projects ordered by id.
+
+    Status counts come from the projects' counters; overdue counts and
+    next deadlines are aggregated over the page's open tasks in the same
+    query. The first page also carries the totals over all projects, from
+    one more query; later pages leave them out so paging through all
+    projects doesn't rescan every project and open task per page.
+    """
+    after_id = decode_id_cursor(cursor)
+    page = service.get_projects_stats_page(limit=limit, after_id=after_id)
+    totals = service.get_stats_totals() if after_id is None else None
+    return project_stats_page_response(page, totals)
+
+
+@router.get(
+    "/{project_id}/stats",
+    response_model=ProjectStats,
+    summary="Task statistics of a project",
+)
+def get_project_stats(
+    project_id: int,
     service: ProjectService = Depends(get_project_service),
-) -> List[ProjectRead]:
-    """Return all projects ordered by id."""
-    return service.get_all_projects()
+) -> Response:
+    """Return one project's task statistics, computed in a single query."""
+    try:
+        stats = service.get_project_stats(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return item_response(stats, STATS_FIELDS)
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectRead,
+    summary="Get a project",
+)
+def get_project(
+    project_id: int,
+    request: Request,
+    service: ProjectService = Depends(get_project_service),
+) -> Response:
+    """Return one project; answers If-None-Match from its version stamp alone."""
+    try:
+        etag = project_etag(project_id, service.get_project_version(project_id))
+        not_modified = if_none_match(request, etag)
+        if not_modified is not None:
+            return not_modified
+        project = service.get_project(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return item_response(project, PROJECT_FIELDS, etag)
 
 
 @router.post(
@@ -68,7 +178,24 @@ def update_project(
 )
 def delete_project(
     project_id: int,
+    background_tasks: BackgroundTasks,
     service: ProjectService = Depends(get_project_service),
-) -> None:
-    """Delete a project by id."""
-    service.delete_project(project_id)
+) -> Response:
+    """
+    Delete a project by id; its tasks go with it through ON DELETE CASCADE.
+
+    With PROJECT_DELETE_BACKGROUND_THRESHOLD set, a project with more tasks
+    than that is answered with 202 and deleted after the response in
+    chunked transactions, so no single transaction locks all its tasks.
+    """
+    try:
+        if PROJECT_DELETE_BACKGROUND_THRESHOLD:
+            project = service.get_project(project_id)
+            if project.task_count > PROJECT_DELETE_BACKGROUND_THRESHOLD:
+                background_tasks.add_task(delete_project_in_chunks, project_id)
+                return Response(status_code=status.HTTP_202_ACCEPTED)
+        service.delete_project(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
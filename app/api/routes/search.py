@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_session
+from app.api.fast_json import FastJSONResponse, fields_of, page_content
+from app.api.pagination import (
+    cursor_query,
+    decode_cursor,
+    encode_cursor,
+    limit_query,
+)
+from app.api.schemas import TaskPage, TaskRead
+from app.repositories.task_repository import TaskRepository
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+TASK_FIELDS = fields_of(TaskRead)
+
+
+def _decode_key(cursor: Optional[str]) -> Optional[List[Any]]:
+    """Decode a `next_cursor` of this endpoint back into a (rank, id) key."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return None
+    try:
+        rank, task_id = key
+        return [float(rank), int(task_id)]
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
+@router.get(
+    "/search",
+    response_model=TaskPage,
+    summary="Search tasks by text",
+)
+def search_tasks(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Words to look for in task titles and descriptions",
+    ),
+    project_id: Optional[int] = Query(
+        None,
+        description="Only search the tasks of this project",
+    ),
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    session: Session = Depends(get_session, scope="function"),
+) -> Response:
+    """
+    Return the tasks matching `q`, best match first.
+
+    Matches in titles rank above matches in descriptions. The search runs
+    on the database's full-text index, so clients no longer need to
+    download task lists to filter them.
+    """
+    page = TaskRepository(session=session).search(
+        q,
+        project_id=project_id,
+        limit=limit,
+        after=_decode_key(cursor),
+    )
+    return FastJSONResponse(
+        page_content(page.items, TASK_FIELDS, encode_cursor(page.next_key))
+    )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_session
+from app.api.fast_json import FastJSONResponse, fields_of, page_content
+from app.api.pagination import (
+    cursor_query,
+    decode_cursor,
+    encode_cursor,
+    limit_query,
+)
+from app.api.schemas import TaskPage, TaskRead
+from app.repositories.task_query import TaskFilter
+from app.repositories.task_repository import TaskRepository
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+TASK_FIELDS = fields_of(TaskRead)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Stored datetimes are naive UTC; convert aware query values to match."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _encode_key(key: Optional[tuple]) -> Optional[str]:
+    if key is None:
+        return None
+    return encode_cursor(
+        [part.isoformat() if isinstance(part, datetime) else part for part in key]
+    )
+
+
+def _decode_key(cursor: Optional[str], sort: str) -> Optional[List[Any]]:
+    """Decode a `next_cursor` of this endpoint back into a (sort value, id) key."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return None
+    try:
+        if sort == "id":
+            (task_id,) = key
+            return [int(task_id)]
+        value, task_id = key
+        return [datetime.fromisoformat(value), int(task_id)]
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
+@router.get(
+    "",
+    response_model=TaskPage,
+    summary="Query tasks across projects",
+)
+def query_tasks(
+    status_: List[Literal["todo", "doing", "done"]] = Query(
+        [],
+        alias="status",
+        description="Only tasks in one of these statuses (repeatable)",
+    ),
+    project_id: List[int] = Query(
+        [],
+        description="Only tasks of one of these projects (repeatable)",
+    ),
+    deadline_from: Optional[datetime] = Query(None, description="Deadline at or after"),
+    deadline_before: Optional[datetime] = Query(None, description="Deadline before"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after"),
+    created_before: Optional[datetime] = Query(None, description="Created before"),
+    overdue: bool = Query(False, description="Only open tasks past their deadline"),
+    sort: Literal["id", "deadline", "created_at"] = Query(
+        "id",
+        description="Sort key; ties are broken by id. Sorting by deadline "
+        "leaves out tasks without one.",
+    ),
+    order: Literal["asc", "desc"] = Query("asc"),
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    session: Session = Depends(get_session, scope="function"),
+) -> Response:
+    """
+    Return one page of tasks from any project matching all given filters.
+
+    Pages are keyset-paginated on the sort key and id, so answering
+    "all doing tasks due this week" takes one request per page instead of
+    one per project. A deadline range must be sorted by deadline and a
+    creation range by created_at, and at most MAX_QUERY_PROJECTS projects
+    can be given (422 otherwise).
+    """
+    filters = TaskFilter(
+        statuses=tuple(status_),
+        project_ids=tuple(project_id),
+        deadline_from=_naive_utc(deadline_from),
+        deadline_before=_naive_utc(deadline_before),
+        created_from=_naive_utc(created_from),
+        created_before=_naive_utc(created_before),
+        overdue=overdue,
+    )
+    try:
+        page = TaskRepository(session=session).query(
+            filters,
+            sort=sort,
+            descending=order == "desc",
+            limit=limit,
+            after=_decode_key(cursor, sort),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        ) from exc
+    return FastJSONResponse(
+        page_content(page.items, TASK_FIELDS, _encode_key(page.next_key))
+    )
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Optional
 from app.exceptions import NotFoundError  # Import NotFoundError from the correct module
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_session
-from app.api.schemas import TaskCreate, TaskRead, TaskUpdate
-from app.models.task import TaskORM
+from app.api.pagination import cursor_query, decode_id_cursor, limit_query
+from app.api.responses import (
+    TASK_FIELDS,
+    batch_result,
+    bulk_status_result,
+    if_none_match,
+    item_response,
+    project_not_found,
+    task_etag,
+    task_not_found,
+    task_page_etag,
+    task_page_response,
+)
+from app.api.schemas import (
+    TaskBatchCreate,
+    TaskBatchResult,
+    TaskBulkStatusResult,
+    TaskBulkStatusUpdate,
+    TaskCreate,
+    TaskPage,
+    TaskRead,
+    TaskUpdate,
+)
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.task_repository import TaskRepository
-from app.services.task_service import TaskService
+from app.services.task_service import NewTask, TaskService
 
 router = APIRouter(prefix="/projects", tags=["tasks"])
 
@@ -27,35 +47,80 @@ def _get_task_service(session: Session) -> TaskService:
     )
 
 
-@router.get("/{project_id}/tasks", response_model=List[TaskRead])
+@router.get("/{project_id}/tasks", response_model=TaskPage)
 def list_project_tasks(
     project_id: int,
-    session: Session = Depends(get_session),
-) -> List[TaskRead]:
+    request: Request,
+    limit: int = limit_query(),
+    cursor: Optional[str] = cursor_query(),
+    session: Session = Depends(get_session, scope="function"),
+) -> Response:
     """
-    Return all tasks for the given project.
+    Return one page of tasks for the given project.
 
-    First we ensure the project exists, otherwise we return 404.
-    Then we load all tasks for that project ordered by id.
+    First we read the project's version stamp, which also ensures the
+    project exists (404 otherwise). If the client's If-None-Match matches
+    the page's ETag we answer 304 without touching the tasks table; else
+    we load the next `limit` tasks after the cursor, ordered by id, and
+    encode their TaskView read models straight to JSON without building
+    TaskRead models.
     """
+    after_id = decode_id_cursor(cursor)
     project_repo = ProjectRepository(session=session)
 
-    # Ensure project exists; ProjectRepository raises NotFoundError if not.
+    # ProjectRepository raises NotFoundError if the project doesn't exist.
     try:
-        project_repo.get_by_id(project_id)
+        version = project_repo.get_version(project_id)
     except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
+        raise project_not_found()
+
+    etag = task_page_etag(project_id, version, limit, cursor)
+    not_modified = if_none_match(request, etag)
+    if not_modified is not None:
+        return not_modified
 
-    stmt = (
-        select(TaskORM)
-        .where(TaskORM.project_id == project_id)
-        .order_by(TaskORM.id)
+    task_repo = TaskRepository(session=session)
+    page = task_repo.list_by_project_view_page(
+        project_id,
+        limit=limit,
+        after_id=after_id,
     )
-    tasks = session.execute(stmt).scalars().all()
-    return tasks
+    return task_page_response(page, etag)
+
+
+@router.get("/{project_id}/tasks/{task_id}", response_model=TaskRead)
+def get_task(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    session: Session = Depends(get_session, scope="function"),
+) -> Response:
+    """
+    Return one task of the given project.
+
+    Every task mutation bumps the project's version, so the ETag is derived
+    from it and a matching If-None-Match is answered from the projects
+    table alone.
+    """
+    try:
+        version = ProjectRepository(session=session).get_version(project_id)
+    except NotFoundError:
+        raise project_not_found()
+
+    etag = task_etag(project_id, task_id, version)
+    not_modified = if_none_match(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        task = TaskRepository(session=session).get_view(task_id)
+    except NotFoundError:
+        task = None
+
+    if task is None or task.project_id != project_id:
+        raise task_not_found()
+
+    return item_response(task, TASK_FIELDS, etag)
 
 
 @router.post(
@@ -66,7 +131,7 @@ def list_project_tasks(
 def create_task_for_project(
     project_id: int,
     payload: TaskCreate,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_session, scope="function"),
 ) -> TaskRead:
     service = _get_task_service(session)
 
@@ -86,58 +151,65 @@ def create_task_for_project(
     return task
 
 
-@router.patch(
-    "/{project_id}/tasks/{task_id}",
-    response_model=TaskRead,
+@router.post(
+    "/{project_id}/tasks:batch",
+    response_model=TaskBatchResult,
+    status_code=status.HTTP_201_CREATED,
 )
-def update_task(
+def create_tasks_batch(
     project_id: int,
-    task_id: int,
-    payload: TaskUpdate,
-    session: Session = Depends(get_session),
-) -> TaskRead:
+    payload: TaskBatchCreate,
+    session: Session = Depends(get_session, scope="function"),
+) -> TaskBatchResult:
+    """
+    Create many tasks in one request.
+
+    In all_or_nothing mode any invalid item fails the whole request with
+    400 and the per-item errors; in partial mode the valid items are
+    created and the invalid ones are listed in `errors`.
+    """
     service = _get_task_service(session)
-    task_repo = TaskRepository(session=session)
+    items = [
+        NewTask(
+            title=item.title,
+            description=item.description,
+            deadline=item.deadline,
+        )
+        for item in payload.items
+    ]
 
-    # Ensure the task exists and belongs to the given project
     try:
-        task = task_repo.get_by_id(task_id)
-    except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found for this project",
+        result = service.create_tasks_batch(
+            project_id=project_id,
+            items=items,
+            partial=payload.mode == "partial",
         )
-
-    if task.project_id != project_id:
+    except Exception as exc:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found for this project",
-        )
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
-    # Compute effective values for a partial update
-    new_title = payload.title if payload.title is not None else task.title
-    new_description = (
-        payload.description if payload.description is not None else task.description
-    )
+    return batch_result(result, payload.mode)
 
-    if payload.deadline is not None:
-        new_deadline = payload.deadline
-    else:
-        new_deadline = task.deadline
 
-    # Convert deadline to 'YYYY-MM-DD' string expected by TaskService
-    if new_deadline is None:
-        new_deadline_str: str | None = None
-    else:
-        new_deadline_str = new_deadline.strftime("%Y-%m-%d")
+@router.post(
+    "/{project_id}/tasks:batch-status",
+    response_model=TaskBulkStatusResult,
+)
+def change_tasks_status(
+    project_id: int,
+    payload: TaskBulkStatusUpdate,
+    session: Session = Depends(get_session, scope="function"),
+) -> TaskBulkStatusResult:
+    """Move many tasks of a project to the same status in one statement."""
+    service = _get_task_service(session)
 
-    # First update title / description / deadline via the service layer
     try:
-        updated_task = service.edit_task(
-            task_id=task_id,
-            new_title=new_title,
-            new_description=new_description,
-            new_deadline_str=new_deadline_str,
+        updated = service.change_status_many(
+            task_ids=payload.task_ids,
+            new_status=payload.status,
+            project_id=project_id,
         )
     except Exception as exc:
         raise HTTPException(
@@ -145,61 +217,67 @@ def update_task(
             detail=str(exc),
         ) from exc
 
-    # Optionally update status if the client provided it
-    if payload.status is not None and payload.status != updated_task.status:
-        try:
-            updated_task = service.change_task_status(
-                task_id=task_id,
-                new_status=payload.status,
-            )
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=str(exc),
-            ) from exc
-
-    return updated_task
+    return bulk_status_result(updated, payload.task_ids)
 
-@router.delete(
+
+@router.patch(
     "/{project_id}/tasks/{task_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=TaskRead,
 )
-def delete_task(
+def update_task(
     project_id: int,
     task_id: int,
-    session: Session = Depends(get_session),
-) -> None:
+    payload: TaskUpdate,
+    session: Session = Depends(get_session, scope="function"),
+) -> Response:
+    """
+    Apply a partial update to one task of the given project.
+
+    The task is matched by id and project in the UPDATE itself, which
+    returns the new row, so the task isn't loaded first.
+    """
     service = _get_task_service(session)
-    task_repo = TaskRepository(session=session)
 
-    # Ensure the task exists and belongs to this project
     try:
-        task = task_repo.get_by_id(task_id)
+        task = service.patch_project_task(
+            project_id,
+            task_id,
+            title=payload.title,
+            description=payload.description,
+            deadline=payload.deadline,
+            status=payload.status,
+        )
     except NotFoundError:
+        raise task_not_found()
+    except Exception as exc:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found for this project",
-        )
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return item_response(task, TASK_FIELDS)
 
-    if task.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found for this project",
-        )
 
-    # Delegate deletion to the service layer
+@router.delete(
+    "/{project_id}/tasks/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def delete_task(
+    project_id: int,
+    task_id: int,
+    session: Session = Depends(get_session, scope="function"),
+) -> None:
+    """Delete one task of the given project with a single scoped DELETE."""
+    service = _get_task_service(session)
+
     try:
-        service.delete_task(task_id=task_id)
+        service.delete_project_task(project_id, task_id)
     except NotFoundError:
-        # In case the repository/service raises again
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found for this project",
-        )
+        raise task_not_found()
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
 
-    return None
\ No newline at end of file
+    return None
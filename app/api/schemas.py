@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -52,11 +52,58 @@ class ProjectRead(BaseModel):
     name: str
     description: str
     created_at: datetime
+    task_count: int = 0
+    todo_count: int = 0
+    doing_count: int = 0
+    done_count: int = 0
 
     class Config:
         from_attributes = True
 
 
+class ProjectPage(BaseModel):
+    """One page of projects plus the cursor for the next page."""
+    items: List[ProjectRead]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, or null on the last page",
+    )
+
+
+class TaskStatsTotals(BaseModel):
+    """Task counts by status, overdue open tasks and the next open deadline."""
+    task_count: int = 0
+    todo_count: int = 0
+    doing_count: int = 0
+    done_count: int = 0
+    overdue_count: int = Field(
+        0,
+        description="Open tasks whose deadline has passed",
+    )
+    next_deadline: Optional[datetime] = Field(
+        None,
+        description="Earliest deadline of an open task that is not yet overdue",
+    )
+
+
+class ProjectStats(TaskStatsTotals):
+    """Task statistics of one project."""
+    project_id: int
+
+
+class ProjectStatsPage(BaseModel):
+    """One page of project statistics, plus the totals over all projects."""
+    items: List[ProjectStats]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, or null on the last page",
+    )
+    totals: Optional[TaskStatsTotals] = Field(
+        None,
+        description="Statistics summed over all projects; only on the first page",
+    )
+
+
 # -----------------------------
 # Task schemas
 # -----------------------------
@@ -121,3 +168,67 @@ class TaskRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TaskPage(BaseModel):
+    """One page of tasks plus the cursor for the next page."""
+    items: List[TaskRead]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, or null on the last page",
+    )
+
+
+MAX_TASK_BATCH_SIZE = 1000
+
+
+class TaskBatchCreate(BaseModel):
+    """Payload model for creating many tasks in one request."""
+    items: List[TaskCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_TASK_BATCH_SIZE,
+        description="Tasks to create, in order",
+    )
+    mode: Literal["all_or_nothing", "partial"] = Field(
+        "all_or_nothing",
+        description=(
+            "all_or_nothing: create nothing if any item is invalid; "
+            "partial: create the valid items and report the rest"
+        ),
+    )
+
+
+class TaskBatchItemError(BaseModel):
+    """Validation error for one item of a batch request."""
+    index: int
+    detail: str
+
+
+class TaskBatchResult(BaseModel):
+    """Response model for a batch create request."""
+    created: List[TaskRead]
+    errors: List[TaskBatchItemError] = []
+
+
+class TaskBulkStatusUpdate(BaseModel):
+    """Payload model for moving many tasks to one status."""
+    task_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_TASK_BATCH_SIZE,
+        description="Ids of the tasks to update",
+    )
+    status: str = Field(
+        ...,
+        description="New status for all tasks (for example: todo, doing, done)",
+    )
+
+
+class TaskBulkStatusResult(BaseModel):
+    """Response model for a bulk status change."""
+    updated: List[TaskRead]
+    not_found: List[int] = Field(
+        default_factory=list,
+        description="Requested ids that are not tasks of this project",
+    )
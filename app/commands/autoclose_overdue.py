@@ -1,15 +1,76 @@
 from __future__ import annotations
 
 import os
+import time
+from collections.abc import Sequence
 from datetime import datetime
+from typing import List, Tuple
 
 from dotenv import load_dotenv
 
-from app.db.session import SessionLocal
+from app.db.query_tracker import tracked_job
 from app.exceptions import AppError
-from app.repositories.project_repository import ProjectRepository
-from app.repositories.task_repository import TaskRepository
-from app.services.task_service import TaskService
+from app.metrics import registry
+from app.repositories.unit_of_work import UnitOfWork
+
+AUTOCLOSE_RUN_SECONDS = registry.histogram(
+    "autoclose_run_duration_seconds",
+    "Duration of auto-close runs, by job.",
+    ("job",),
+)
+AUTOCLOSE_CLOSED = registry.counter(
+    "autoclose_tasks_closed_total",
+    "Overdue tasks closed by auto-close, by job.",
+    ("job",),
+)
+AUTOCLOSE_LAG = registry.histogram(
+    "autoclose_lag_seconds",
+    "Time from a task's deadline until auto-close closed it, by job.",
+    ("job",),
+    buckets=(1, 5, 15, 60, 300, 900, 3600, 21600, 86400),
+)
+
+
+def record_autoclose_chunk(
+    job: str,
+    closed: Sequence[Tuple[int, datetime]],
+    closed_at: datetime,
+) -> None:
+    """Count a committed chunk of (id, deadline) pairs and their close lag."""
+    AUTOCLOSE_CLOSED.inc(len(closed), job=job)
+    for _, deadline in closed:
+        AUTOCLOSE_LAG.observe((closed_at - deadline).total_seconds(), job=job)
+
+
+def close_overdue_in_chunks(
+    now: datetime,
+    batch_size: int,
+    job: str = "once",
+) -> List[int]:
+    """
+    Close all overdue tasks, committing one unit of work per chunk.
+
+    Committing per chunk keeps row locks short while a large backlog is
+    drained, and skipping rows locked by another runner lets overlapping
+    runs share it. Returns the ids of the closed tasks. The run is
+    recorded in the autoclose_* metrics under `job`, and its statements
+    are logged by the query tracker.
+    """
+    start = time.perf_counter()
+    closed_ids: List[int] = []
+    with tracked_job(f"autoclose:{job}"):
+        while True:
+            with UnitOfWork() as uow:
+                closed = uow.tasks.close_overdue_chunk_deadlines(
+                    now, batch_size, skip_locked=True
+                )
+            if not closed:
+                break
+            record_autoclose_chunk(job, closed, datetime.utcnow())
+            closed_ids.extend(task_id for task_id, _ in closed)
+
+    AUTOCLOSE_RUN_SECONDS.observe(time.perf_counter() - start, job=job)
+    return closed_ids
 
 
 def run_autoclose_overdue() -> int:
@@ -23,27 +84,12 @@ def run_autoclose_overdue() -> int:
     """
     load_dotenv()
 
-    max_tasks_per_project = int(os.getenv("MAX_TASKS_PER_PROJECT", "20"))
+    batch_size = int(os.getenv("AUTOCLOSE_BATCH_SIZE", "1000"))
     now = datetime.utcnow()
 
-    closed_count = 0
-
-    # Use a single DB session for the whole operation
-    with SessionLocal() as session:
-        project_repo = ProjectRepository(session=session)
-        task_repo = TaskRepository(session=session)
-        task_service = TaskService(
-            task_repo=task_repo,
-            project_repo=project_repo,
-            max_tasks_per_project=max_tasks_per_project,
-        )
-
-        overdue_tasks = task_repo.list_overdue_open_tasks(now)
-
-        for task in overdue_tasks:
-            task_service.change_task_status(task_id=task.id, new_status="done")
-            closed_count += 1
+    closed_ids = close_overdue_in_chunks(now, batch_size)
 
+    closed_count = len(closed_ids)
     print(
         f"[autoclose_overdue] Closed {closed_count} task(s) "
         f"at {now.isoformat()} (UTC)."
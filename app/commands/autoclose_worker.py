@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import suppress
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.commands.autoclose_overdue import (
+    AUTOCLOSE_RUN_SECONDS,
+    record_autoclose_chunk,
+)
+from app.db.query_tracker import tracked_job
+from app.db.session import SessionLocal, engine as default_engine
+from app.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+AUTOCLOSE_BATCH_SIZE = int(os.getenv("AUTOCLOSE_BATCH_SIZE", "1000"))
+AUTOCLOSE_INTERVAL_MINUTES = float(os.getenv("AUTOCLOSE_INTERVAL_MINUTES", "5"))
+# Only the worker holding this advisory lock runs; the others stand by.
+AUTOCLOSE_LEADER_LOCK_ID = int(os.getenv("AUTOCLOSE_LEADER_LOCK_ID", "7301"))
+
+# Fallback for databases without advisory locks: one lock per id, shared
+# by the workers of this process only.
+_local_locks: Dict[int, threading.Lock] = {}
+_local_locks_guard = threading.Lock()
+
+
+def _local_lock(lock_id: int) -> threading.Lock:
+    with _local_locks_guard:
+        return _local_locks.setdefault(lock_id, threading.Lock())
+
+
+class LeaderLock:
+    """
+    Non-blocking leader election between auto-close workers.
+
+    On PostgreSQL this is a session-level advisory lock, held on a
+    dedicated connection for as long as the worker leads; if the worker
+    dies, its connection closes and another worker can take over. Other
+    databases fall back to a lock that only covers this process.
+    """
+
+    def __init__(
+        self,
+        lock_id: int = AUTOCLOSE_LEADER_LOCK_ID,
+        engine: Engine = default_engine,
+    ) -> None:
+        self._lock_id = lock_id
+        self._engine = engine
+        self._connection: Optional[Connection] = None
+        self._local: Optional[threading.Lock] = None
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None or self._local is not None
+
+    def try_acquire(self) -> bool:
+        """
+        Become the leader if nobody else is; True if this worker leads.
+
+        A leader checks each time that it still holds the lock: if its
+        connection dropped, PostgreSQL released the lock and another
+        worker may have taken over, so it steps down and runs for
+        election again on the next call.
+        """
+        if self._local is not None:
+            return True
+        if self._connection is not None:
+            if self._still_held():
+                return True
+            self._drop_connection()
+            return False
+
+        if self._engine.dialect.name != "postgresql":
+            lock = _local_lock(self._lock_id)
+            if lock.acquire(blocking=False):
+                self._local = lock
+            return self.held
+
+        connection = self._engine.connect()
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"),
+            {"lock_id": self._lock_id},
+        ).scalar_one()
+        connection.commit()
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+        return acquired
+
+    def _still_held(self) -> bool:
+        # A bigint advisory key is stored as classid (high half) and objid
+        # (low half) with objsubid 1.
+        try:
+            held = self._connection.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_locks "
+                    "WHERE locktype = 'advisory' AND granted "
+                    "AND pid = pg_backend_pid() AND objsubid = 1 "
+                    "AND classid::bigint = :classid AND objid::bigint = :objid)"
+                ),
+                {
+                    "classid": (self._lock_id >> 32) & 0xFFFFFFFF,
+                    "objid": self._lock_id & 0xFFFFFFFF,
+                },
+            ).scalar_one()
+            self._connection.commit()
+        except SQLAlchemyError:
+            return False
+        return held
+
+    def _drop_connection(self) -> None:
+        """Discard the leader connection without returning it to the pool."""
+        connection, self._connection = self._connection, None
+        with suppress(SQLAlchemyError):
+            connection.invalidate()
+            connection.close()
+
+    def release(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.execute(
+                    text("SELECT pg_advisory_unlock(:lock_id)"),
+                    {"lock_id": self._lock_id},
+                )
+                self._connection.commit()
+            finally:
+                self._connection.close()
+                self._connection = None
+        if self._local is not None:
+            self._local.release()
+            self._local = None
+
+
+def claim_and_close_overdue(
+    now: datetime,
+    batch_size: int = AUTOCLOSE_BATCH_SIZE,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> List[int]:
+    """
+    Close overdue tasks chunk by chunk, safely alongside other workers.
+
+    Each chunk is claimed with SELECT ... FOR UPDATE SKIP LOCKED, closed
+    and committed, so concurrent workers split the backlog between them
+    and never wait on each other's rows. The session is cleared after
+    each chunk, so no more than one chunk of tasks is ever held in its
+    identity map. Returns the ids this worker closed.
+    """
+    start = time.perf_counter()
+    closed_ids: List[int] = []
+    with tracked_job("autoclose:worker"), session_factory() as session:
+        tasks = TaskRepository(session=session)
+        while True:
+            closed = tasks.close_overdue_chunk_deadlines(
+                now, batch_size, skip_locked=True
+            )
+            session.commit()
+            session.expunge_all()
+            if not closed:
+                break
+            record_autoclose_chunk("worker", closed, datetime.utcnow())
+            closed_ids.extend(task_id for task_id, _ in closed)
+
+    AUTOCLOSE_RUN_SECONDS.observe(time.perf_counter() - start, job="worker")
+    return closed_ids
+
+
+class AutocloseWorker:
+    """
+    Periodically drain the overdue backlog; many may run at once.
+
+    Without a leader lock every worker drains concurrently and SKIP
+    LOCKED keeps them on disjoint chunks. With one, only the current
+    leader runs and the others retry the election every interval.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = AUTOCLOSE_INTERVAL_MINUTES * 60,
+        batch_size: int = AUTOCLOSE_BATCH_SIZE,
+        leader_lock: Optional[LeaderLock] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._leader_lock = leader_lock
+        self._session_factory = session_factory
+        self._stop = threading.Event()
+
+    def run_once(self) -> Optional[List[int]]:
+        """Drain the backlog if allowed to; None when another worker leads."""
+        if self._leader_lock is not None and not self._leader_lock.try_acquire():
+            return None
+        return claim_and_close_overdue(
+            datetime.utcnow(),
+            self._batch_size,
+            session_factory=self._session_factory,
+        )
+
+    def run_forever(self) -> None:
+        """
+        Run every interval until `stop` is called.
+
+        A database error fails only the current run: it is logged and the
+        worker tries again at the next interval.
+        """
+        try:
+            while not self._stop.is_set():
+                try:
+                    closed_ids = self.run_once()
+                except SQLAlchemyError:
+                    logger.exception(
+                        "Auto-close run failed; retrying in %.0fs",
+                        self._interval_seconds,
+                    )
+                else:
+                    if closed_ids:
+                        logger.info("Closed %d overdue tasks.", len(closed_ids))
+                self._stop.wait(self._interval_seconds)
+        finally:
+            if self._leader_lock is not None:
+                self._leader_lock.release()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.commands.autoclose_overdue import (
+    AUTOCLOSE_RUN_SECONDS,
+    record_autoclose_chunk,
+)
+from app.db.query_tracker import tracked_job
+from app.db.session import SessionLocal
+from app.repositories import deadline_events
+from app.repositories.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+AUTOCLOSE_BATCH_SIZE = int(os.getenv("AUTOCLOSE_BATCH_SIZE", "1000"))
+# Deadlines written by other processes are only seen when the horizon is
+# re-read; this bounds how late they can be picked up. 0 disables it.
+AUTOCLOSE_REFRESH_INTERVAL = timedelta(
+    minutes=float(os.getenv("AUTOCLOSE_REFRESH_MINUTES", "5"))
+)
+# After a database error the scheduler retries with exponential backoff,
+# from the first delay up to the maximum, in seconds.
+RETRY_FIRST_SECONDS = 1.0
+RETRY_MAX_SECONDS = 60.0
+
+
+class DeadlineScheduler:
+    """
+    Close overdue tasks when their deadlines pass, instead of polling.
+
+    Upcoming deadlines are kept in a min-heap fed by a `MIN(deadline)`
+    query over open tasks and by the deadlines that committed task
+    mutations publish through `deadline_events`. The scheduler sleeps
+    until the earliest one has passed, closes everything overdue, then
+    re-reads the horizon; while nothing is due it issues no queries,
+    except for the optional periodic refresh.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = AUTOCLOSE_BATCH_SIZE,
+        refresh_interval: Optional[timedelta] = AUTOCLOSE_REFRESH_INTERVAL,
+        session_factory: Callable[[], Session] = SessionLocal,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        retry_first_seconds: float = RETRY_FIRST_SECONDS,
+        retry_max_seconds: float = RETRY_MAX_SECONDS,
+    ) -> None:
+        self._batch_size = batch_size
+        self._refresh_interval = refresh_interval or None
+        self._session_factory = session_factory
+        self._clock = clock
+        self._retry_first_seconds = retry_first_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._heap: List[datetime] = []
+        self._next_refresh: Optional[datetime] = None
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self, deadline: datetime) -> None:
+        """
+        Wake the scheduler for `deadline` if it is earlier than what it waits for.
+
+        Later deadlines need no entry: the horizon is re-read after every run.
+        """
+        with self._condition:
+            if not self._heap or deadline < self._heap[0]:
+                heapq.heappush(self._heap, deadline)
+                self._condition.notify()
+
+    def next_wakeup(self) -> Optional[datetime]:
+        """When the scheduler will next wake up by itself, or None if never."""
+        with self._condition:
+            candidates = [self._heap[0]] if self._heap else []
+        if self._next_refresh is not None:
+            candidates.append(self._next_refresh)
+        return min(candidates, default=None)
+
+    def refresh(self) -> None:
+        """Re-read the earliest open deadline with one query."""
+        with UnitOfWork(self._session_factory) as uow:
+            deadline = uow.tasks.next_open_deadline()
+        if deadline is not None:
+            self.notify(deadline)
+        if self._refresh_interval is not None:
+            self._next_refresh = self._clock() + self._refresh_interval
+
+    def run_due(self) -> int:
+        """
+        Close overdue tasks if a deadline in the heap has passed.
+
+        Returns the number of closed tasks; does nothing, and queries
+        nothing, while the earliest deadline is still ahead.
+        """
+        now = self._clock()
+        with self._condition:
+            if not self._heap or self._heap[0] >= now:
+                return 0
+            while self._heap and self._heap[0] < now:
+                heapq.heappop(self._heap)
+
+        start = time.perf_counter()
+        closed = 0
+        with tracked_job("autoclose:deadline"):
+            while True:
+                with UnitOfWork(self._session_factory) as uow:
+                    chunk = uow.tasks.close_overdue_chunk_deadlines(
+                        now, self._batch_size
+                    )
+                if not chunk:
+                    break
+                record_autoclose_chunk("deadline", chunk, self._clock())
+                closed += len(chunk)
+
+            self.refresh()
+        AUTOCLOSE_RUN_SECONDS.observe(time.perf_counter() - start, job="deadline")
+        return closed
+
+    def _refresh_due(self) -> bool:
+        return self._next_refresh is not None and self._clock() >= self._next_refresh
+
+    def run_forever(self) -> None:
+        """
+        Run until `stop` is called, reacting to committed task mutations.
+
+        Database errors don't end the thread: they are logged, and the
+        horizon is re-read after a backoff, so deadlines dropped by a
+        failed run are picked up again once the database is back.
+        """
+        deadline_events.subscribe(self.notify)
+        try:
+            stale = True
+            retry_seconds = self._retry_first_seconds
+            while True:
+                failed = False
+                try:
+                    if stale or self._refresh_due():
+                        self.refresh()
+                        stale = False
+                    closed = self.run_due()
+                    if closed:
+                        logger.info("Closed %d overdue task(s)", closed)
+                    retry_seconds = self._retry_first_seconds
+                except SQLAlchemyError:
+                    logger.exception(
+                        "Deadline auto-close failed; retrying in %.0fs", retry_seconds
+                    )
+                    failed = stale = True
+
+                # Under the lock, so a notify() can't slip in before the wait.
+                with self._condition:
+                    if self._stopped:
+                        return
+                    if failed:
+                        # Only stop() cuts the backoff short, not notify().
+                        stopped = self._condition.wait_for(
+                            lambda: self._stopped, retry_seconds
+                        )
+                        if stopped:
+                            return
+                        retry_seconds = min(retry_seconds * 2, self._retry_max_seconds)
+                        continue
+                    wakeup = self.next_wakeup()
+                    if wakeup is None:
+                        self._condition.wait()
+                    else:
+                        timeout = (wakeup - self._clock()).total_seconds()
+                        if timeout > 0:
+                            self._condition.wait(timeout)
+        finally:
+            deadline_events.unsubscribe(self.notify)
+
+    def start(self) -> threading.Thread:
+        """Run the scheduler in a daemon thread of this process."""
+        self._thread = threading.Thread(
+            target=self.run_forever,
+            name="deadline-scheduler",
+            daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Callable
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.db.query_tracker import tracked_job
+from app.db.session import SessionLocal
+from app.exceptions import AppError, NotFoundError
+from app.repositories.unit_of_work import UnitOfWork
+
+PROJECT_DELETE_BATCH_SIZE = int(os.getenv("PROJECT_DELETE_BATCH_SIZE", "5000"))
+# Projects with more tasks are deleted in the background; 0 disables it.
+PROJECT_DELETE_BACKGROUND_THRESHOLD = int(
+    os.getenv("PROJECT_DELETE_BACKGROUND_THRESHOLD", "0")
+)
+
+
+def delete_project_in_chunks(
+    project_id: int,
+    batch_size: int = PROJECT_DELETE_BATCH_SIZE,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """
+    Delete a project's tasks in chunks, then the project itself.
+
+    Each chunk is its own unit of work, so no transaction holds locks on
+    more than `batch_size` task rows. A project that is already gone, for
+    example removed by a concurrent run, is not an error. Returns the
+    number of deleted tasks.
+    """
+    deleted = 0
+    while True:
+        with UnitOfWork(session_factory) as uow:
+            count = uow.tasks.delete_project_chunk(project_id, batch_size)
+        if not count:
+            break
+        deleted += count
+
+    try:
+        with UnitOfWork(session_factory) as uow:
+            uow.projects.delete(project_id)
+    except NotFoundError:
+        pass
+    return deleted
+
+
+def main() -> None:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="Delete a project and its tasks in chunked transactions."
+    )
+    parser.add_argument("project_id", type=int)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=PROJECT_DELETE_BATCH_SIZE,
+        help="tasks deleted per transaction",
+    )
+    args = parser.parse_args()
+
+    with tracked_job("delete_project"):
+        deleted = delete_project_in_chunks(args.project_id, batch_size=args.batch_size)
+    print(
+        f"[delete_project] Deleted project {args.project_id} "
+        f"and {deleted} task(s)."
+    )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except AppError as exc:
+        print(f"[delete_project] Error: {exc}")
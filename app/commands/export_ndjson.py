@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import BinaryIO, Callable
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.db.query_tracker import tracked_job
+from app.db.session import SessionLocal
+from app.exceptions import AppError
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.export_service import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    ExportService,
+    gzip_chunks,
+)
+
+
+def write_export(
+    out: BinaryIO,
+    batch_size: int,
+    compress: bool,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """
+    Write the NDJSON export of all projects and tasks to `out`.
+
+    Streams one batch at a time from a single read-only unit of work.
+    Returns the number of bytes written.
+    """
+    written = 0
+    with UnitOfWork(session_factory) as uow:
+        chunks = ExportService(
+            project_repo=uow.projects,
+            task_repo=uow.tasks,
+            batch_size=batch_size,
+        ).iter_ndjson()
+        if compress:
+            chunks = gzip_chunks(chunks)
+        for chunk in chunks:
+            written += out.write(chunk)
+    return written
+
+
+def main() -> None:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="Export all projects and tasks as NDJSON."
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default="-",
+        help="file to write to (default: stdout)",
+    )
+    parser.add_argument("--gzip", action="store_true", help="gzip the output")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        help="rows fetched per round trip",
+    )
+    args = parser.parse_args()
+
+    with tracked_job("export_ndjson"):
+        if args.output == "-":
+            written = write_export(sys.stdout.buffer, args.batch_size, args.gzip)
+        else:
+            with open(args.output, "wb") as out:
+                written = write_export(out, args.batch_size, args.gzip)
+
+    print(f"[export_ndjson] Wrote {written} bytes.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except AppError as exc:
+        print(f"[export_ndjson] Error: {exc}", file=sys.stderr)
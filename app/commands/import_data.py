@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, List, TextIO
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.db.query_tracker import tracked_job
+from app.db.session import SessionLocal
+from app.exceptions import AppError
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.import_service import (
+    ImportRecord,
+    ImportRecordError,
+    ImportService,
+)
+
+DEFAULT_IMPORT_CHUNK_SIZE = 5000
+
+
+@dataclass
+class ImportReport:
+    """Totals of an import run."""
+    projects: int = 0
+    tasks: int = 0
+    errors: List[ImportRecordError] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.projects + self.tasks + len(self.errors)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """
+    Yield one record per non-blank NDJSON line, numbered from 1.
+
+    Lines that aren't valid JSON are passed on as-is, so the import
+    reports them with the other invalid records.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, line
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """
+    Yield one task record per CSV row, numbered by file line.
+
+    The header names the columns: project, title, description and the
+    optional deadline, status and created_at.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, {"type": "task", **row}
+
+
+def _chunks(
+    records: Iterable[ImportRecord],
+    size: int,
+) -> Iterator[List[ImportRecord]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def import_records(
+    records: Iterable[ImportRecord],
+    chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> ImportReport:
+    """
+    Import a stream of records, committing one unit of work per chunk.
+
+    Only one chunk is held in memory at a time. Invalid records are
+    skipped and listed in the report's errors.
+    """
+    report = ImportReport()
+    source_projects: Dict[Any, str] = {}
+    start = time.perf_counter()
+
+    for chunk in _chunks(records, chunk_size):
+        with UnitOfWork(session_factory) as uow:
+            result = ImportService(
+                project_repo=uow.projects,
+                task_repo=uow.tasks,
+                source_projects=source_projects,
+            ).import_chunk(chunk)
+        report.projects += result.projects
+        report.tasks += result.tasks
+        report.errors.extend(result.errors)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _open_text(path: str) -> TextIO:
+    if path == "-":
+        # A second handle on stdin's descriptor, so closing it leaves stdin open
+        return open(
+            sys.stdin.fileno(), "r", encoding="utf-8", newline="", closefd=False
+        )
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def main() -> None:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="Import projects and tasks from NDJSON or CSV."
+    )
+    parser.add_argument(
+        "input",
+        help="file to read; .gz files are decompressed, - reads stdin",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "csv"),
+        help="input format (default: from the file extension, else ndjson)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_IMPORT_CHUNK_SIZE,
+        help="records validated and committed together",
+    )
+    args = parser.parse_args()
+
+    input_format = args.format
+    if input_format is None:
+        is_csv = args.input.removesuffix(".gz").endswith(".csv")
+        input_format = "csv" if is_csv else "ndjson"
+    reader = read_csv if input_format == "csv" else read_ndjson
+
+    with tracked_job("import_data"), _open_text(args.input) as lines:
+        report = import_records(reader(lines), chunk_size=args.chunk_size)
+
+    for error in report.errors[:20]:
+        print(f"[import_data] line {error.line}: {error.message}", file=sys.stderr)
+    if len(report.errors) > 20:
+        print(f"[import_data] ... {len(report.errors) - 20} more", file=sys.stderr)
+
+    print(
+        f"[import_data] Imported {report.projects} project(s) and "
+        f"{report.tasks} task(s), rejected {len(report.errors)} record(s) "
+        f"in {report.elapsed:.2f}s ({report.rows_per_second:.0f} rows/s)."
+    )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except AppError as exc:
+        print(f"[import_data] Error: {exc}")
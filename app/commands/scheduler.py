@@ -1,41 +1,41 @@
 from __future__ import annotations
 
+import argparse
+import logging
+import os
 import time
 from datetime import datetime
 
 import schedule
+from dotenv import load_dotenv
 
-from app.db.session import get_session
-from app.repositories.project_repository import ProjectRepository
-from app.repositories.task_repository import TaskRepository
-from app.services.task_service import TaskService
+from app.commands.autoclose_overdue import close_overdue_in_chunks
+from app.commands.autoclose_worker import AutocloseWorker, LeaderLock
+from app.commands.deadline_scheduler import DeadlineScheduler
+from app.metrics import start_metrics_server
+
+# "poll" runs a full overdue scan every few minutes; "deadline" sleeps
+# until the next open deadline passes (see DeadlineScheduler); "worker"
+# drains the backlog alongside other replicas (see AutocloseWorker).
+AUTOCLOSE_MODE = os.getenv("AUTOCLOSE_MODE", "poll")
+# Serve the autoclose_* metrics at :<port>/metrics; 0 disables it.
+AUTOCLOSE_METRICS_PORT = int(os.getenv("AUTOCLOSE_METRICS_PORT", "0"))
 
 
 def autoclose_overdue_once() -> None:
     now = datetime.utcnow()
+    batch_size = int(os.getenv("AUTOCLOSE_BATCH_SIZE", "1000"))
 
-    with get_session() as session:
-        project_repo = ProjectRepository(session=session)
-        task_repo = TaskRepository(session=session)
-        service = TaskService(
-            task_repo=task_repo,
-            project_repo=project_repo,
-            max_tasks_per_project=20,
-        )
-
-        overdue_tasks = task_repo.list_overdue_open_tasks(now)
+    closed_ids = close_overdue_in_chunks(now, batch_size, job="poll")
 
-        if not overdue_tasks:
-            print(f"[{now.isoformat()}] No overdue tasks to close.")
-            return
+    if not closed_ids:
+        print(f"[{now.isoformat()}] No overdue tasks to close.")
+        return
 
-        for task in overdue_tasks:
-            service.change_task_status(task_id=task.id, new_status="done")
+    print(f"[{now.isoformat()}] Closed {len(closed_ids)} overdue tasks.")
 
-        print(f"[{now.isoformat()}] Closed {len(overdue_tasks)} overdue tasks.")
 
-
-def main() -> None:
+def run_polling() -> None:
     autoclose_overdue_once()
 
     schedule.every(5).minutes.do(autoclose_overdue_once)
@@ -45,5 +45,42 @@ def main() -> None:
         time.sleep(1)
 
 
+def main() -> None:
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Auto-close overdue tasks.")
+    parser.add_argument(
+        "--mode",
+        choices=("poll", "deadline", "worker"),
+        default=AUTOCLOSE_MODE,
+        help="poll every 5 minutes, wake up when the next deadline passes, "
+        "or run as one of several workers",
+    )
+    parser.add_argument(
+        "--leader",
+        action="store_true",
+        help="in worker mode, only run while holding the leader advisory lock",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=AUTOCLOSE_METRICS_PORT,
+        help="serve Prometheus metrics on this port (0: off)",
+    )
+    args = parser.parse_args()
+
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+
+    if args.mode == "deadline":
+        DeadlineScheduler().run_forever()
+    elif args.mode == "worker":
+        leader_lock = LeaderLock() if args.leader else None
+        AutocloseWorker(leader_lock=leader_lock).run_forever()
+    else:
+        run_polling()
+
+
 if __name__ == "__main__":
     main()
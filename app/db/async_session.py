@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.db.routing import RoutingSession
+from app.db.session import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_POOL_USE_LIFO,
+    DB_REPLICA_URLS,
+)
+
+# asyncio driver used for each synchronous backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the DBAPI driver of a database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for '{backend}' URLs")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+# A full ASYNC_DATABASE_URL takes precedence over the converted DATABASE_URL
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+
+def _pool_options(url: str) -> Dict[str, Any]:
+    """Same pool settings as the synchronous engine; SQLite keeps its defaults."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": DB_POOL_USE_LIFO,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the process-wide async engine.
+
+    Created on first use so the asyncio driver is only required when the
+    async stack is actually enabled.
+    """
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=DB_ECHO,
+        **_pool_options(ASYNC_DATABASE_URL),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_replica_engines() -> tuple[AsyncEngine, ...]:
+    """Return one async engine per configured read replica."""
+    return tuple(
+        create_async_engine(url, echo=DB_ECHO, **_pool_options(url))
+        for url in map(to_async_url, DB_REPLICA_URLS)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the async counterpart of SessionLocal.
+
+    Reads are routed to replicas by the same RoutingSession, which the
+    AsyncSession drives as its sync session.
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        sync_session_class=RoutingSession,
+        replicas=[replica.sync_engine for replica in get_async_replica_engines()],
+        autoflush=False,
+        expire_on_commit=False,
+    )
@@ -1,6 +1,23 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
     pass
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """
+    Turn on foreign key enforcement for SQLite connections.
+
+    SQLite ignores FOREIGN KEY clauses by default; project deletion relies
+    on the tasks' ON DELETE CASCADE, as it does on PostgreSQL.
+    """
+    if "sqlite" not in type(dbapi_connection).__module__:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """
+    Thread-safe counters describing how a connection pool is used.
+
+    `wait` is the time `Pool.connect()` took to hand out a connection: the
+    time spent queueing for a free one plus, for new connections, the time
+    to open it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.timeouts = 0
+            self.in_use = 0
+            self.max_in_use = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.in_use = max(self.in_use - 1, 0)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout wait time, usage and timeouts in `stats`."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        event.listen(self, "connect", self._on_connect)
+        event.listen(self, "checkin", self._on_checkin)
+
+    def connect(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_timeout(time.perf_counter() - start)
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        self.stats.record_connect()
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        self.stats.record_checkin()
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Describe the engine's pool configuration and current usage."""
+    pool = engine.pool
+    info: Dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    if isinstance(pool, QueuePool):
+        info.update(
+            {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "checked_in": pool.checkedin(),
+                "timeout": pool.timeout(),
+            }
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        info["stats"] = pool.stats.snapshot()
+    return info
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """
+    Open up to `connections` connections and return them to the pool.
+
+    Connections are held together so the pool really grows to that size
+    instead of reusing the same connection. Returns how many were opened.
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
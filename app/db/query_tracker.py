@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# A statement shape run this many times in one scope is reported as a
+# likely N+1 pattern.
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "3"))
+
+_START_KEY = "query_tracker_start"
+
+# Expanded IN lists and VALUES rows, for any DBAPI paramstyle
+_PARAM = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})*\s*\)")
+_REPEATED_ROWS = re.compile(r"(\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a SQL statement so runs that differ only in parameters match.
+
+    Parameter lists collapse to `(?...)`, so `IN (?, ?)` and `IN (?, ?, ?)`
+    have the same shape, and so do multi-row VALUES of any length.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PARAM_LIST.sub("(?...)", shape)
+    return _REPEATED_ROWS.sub(r"\1", shape)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one tracked scope."""
+    name: str = ""
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.statements[statement] += 1
+
+    def shapes(self) -> Counter[str]:
+        """Statement counts by normalized shape."""
+        with self._lock:
+            statements = list(self.statements.items())
+        shapes: Counter[str] = Counter()
+        for statement, count in statements:
+            shapes[statement_shape(statement)] += count
+        return shapes
+
+    def repeated(self, threshold: int = QUERY_REPEAT_THRESHOLD) -> Dict[str, int]:
+        """Shapes executed at least `threshold` times, most frequent first."""
+        return {
+            shape: count
+            for shape, count in self.shapes().most_common()
+            if count >= threshold
+        }
+
+    def summary(self) -> str:
+        return f"{self.count} statement(s) in {self.seconds * 1000:.1f} ms"
+
+
+# Trackers of the current request or job; they see only its statements.
+_scoped: ContextVar[Tuple[QueryStats, ...]] = ContextVar("query_trackers", default=())
+# Trackers that see every statement in the process, whatever thread runs
+# it; used by tests, whose requests run on the test client's own thread.
+_global: List[QueryStats] = []
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, *args) -> None:
+    if _scoped.get() or _global:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, *args) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    for stats in _scoped.get() + tuple(_global):
+        stats.record(statement, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context) -> None:
+    connection = context.connection
+    if connection is not None and connection.info.get(_START_KEY):
+        connection.info[_START_KEY].pop()
+
+
+@contextmanager
+def track_queries(name: str = "") -> Iterator[QueryStats]:
+    """
+    Record the statements executed by this context (request, job, ...).
+
+    Trackers nest: each one sees the statements of its own block. Work
+    handed to a threadpool with a copied context, as FastAPI does for
+    sync handlers, is included.
+    """
+    stats = QueryStats(name=name)
+    token = _scoped.set(_scoped.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _scoped.reset(token)
+
+
+@contextmanager
+def track_all_queries(name: str = "") -> Iterator[QueryStats]:
+    """Record every statement executed in the process until the block exits."""
+    stats = QueryStats(name=name)
+    _global.append(stats)
+    try:
+        yield stats
+    finally:
+        _global.remove(stats)
+
+
+def log_query_stats(stats: QueryStats, threshold: int = QUERY_REPEAT_THRESHOLD) -> None:
+    """Log a scope's statement summary, and a warning for repeated shapes."""
+    logger.debug("[%s] %s", stats.name, stats.summary())
+    for shape, count in stats.repeated(threshold).items():
+        logger.warning(
+            "[%s] possible N+1: statement ran %d times: %s", stats.name, count, shape
+        )
+
+
+@contextmanager
+def tracked_job(name: str) -> Iterator[QueryStats]:
+    """Track a scheduler job or CLI command and log its statements when it ends."""
+    with track_queries(name) as stats:
+        try:
+            yield stats
+        finally:
+            log_query_stats(stats)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `assert_max_queries` when a block runs too many statements."""
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int,
+    max_repeats: Optional[int] = None,
+) -> Iterator[QueryStats]:
+    """
+    Fail if the block executes more than `max_queries` statements.
+
+    With `max_repeats`, also fail if any statement shape runs more often
+    than that. Statements from every thread count, so requests made with
+    a test client are included:
+
+        with assert_max_queries(2):
+            client.get(f"/api/v1/projects/{project_id}")
+    """
+    with track_all_queries("query budget") as stats:
+        yield stats
+
+    problems = []
+    if stats.count > max_queries:
+        problems.append(
+            f"expected at most {max_queries} statement(s), got {stats.count}"
+        )
+    if max_repeats is not None:
+        repeated = stats.repeated(max_repeats + 1)
+        if repeated:
+            problems.append(f"statement shapes ran more than {max_repeats} time(s)")
+    if problems:
+        listing = "\n".join(
+            f"  {count}x {shape}" for shape, count in stats.shapes().most_common()
+        )
+        raise QueryBudgetExceeded("; ".join(problems) + ":\n" + listing)
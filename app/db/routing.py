@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+def _is_read_only(clause: Any) -> bool:
+    """True for a plain SELECT; DML, SELECT ... FOR UPDATE and raw SQL are not."""
+    if clause is None or not getattr(clause, "is_select", False):
+        return False
+    return getattr(clause, "_for_update_arg", None) is None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and writes to the primary.
+
+    `bind` is the primary engine. Each session picks one of `replicas` up
+    front, so all reads of a request see the same snapshot, and runs plain
+    SELECTs there. Flushes, INSERT/UPDATE/DELETE and locking reads go to the
+    primary.
+
+    The first write makes the session sticky: every later statement,
+    reads included, uses the primary until the session is closed, so a
+    request reads its own writes regardless of replica lag. Repositories
+    call `stick_to_primary()` before a mutation so the reads it depends on
+    are not served stale. Without replicas this is a plain Session.
+    """
+
+    def __init__(
+        self,
+        bind: Optional[Engine] = None,
+        replicas: Sequence[Engine] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(bind=bind, **kwargs)
+        self._replica = random.choice(replicas) if replicas else None
+        self._sticky = False
+
+    @property
+    def uses_primary(self) -> bool:
+        """True when every statement is routed to the primary."""
+        return self._replica is None or self._sticky
+
+    def stick_to_primary(self) -> None:
+        """
+        Route everything to the primary until the session is closed.
+
+        Objects already loaded from the replica are expired, so the next
+        access reloads them from the primary.
+        """
+        if not self.uses_primary:
+            self.expire_all()
+        self._sticky = True
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        if not self.uses_primary:
+            if _is_read_only(clause) and not self._flushing:
+                return self._replica
+            self._sticky = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        self._sticky = False
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import os
 
+from typing import Any, Dict
+
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 
+from app.db.pool import InstrumentedQueuePool
+from app.db.routing import RoutingSession
+
 # Load environment variables from .env
 load_dotenv()
 
@@ -16,14 +22,71 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
 DB_NAME = os.getenv("DB_NAME", "todo_db")
 
-# Build the SQLAlchemy database URL
-DATABASE_URL = (
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
+# Build the SQLAlchemy database URL (a full DATABASE_URL takes precedence)
+DATABASE_URL = os.getenv("DATABASE_URL") or (
     f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
-# Create engine and session factory
-engine = create_engine(DATABASE_URL, echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+# Comma-separated read replica URLs; reads stay on the primary when empty
+DB_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DB_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true"
+DB_POOL_WARMUP = os.getenv("DB_POOL_WARMUP", "true").lower() == "true"
+
+
+def _pool_options(url: str) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the connection pool.
+
+    SQLite keeps SQLAlchemy's default pool, which is tailored to its
+    threading rules; every other backend gets an instrumented QueuePool.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": DB_POOL_USE_LIFO,
+    }
+
+
+# Create engines and session factory; RoutingSession sends reads to a replica.
+# Objects stay loaded after commit: repositories write with flush/RETURNING
+# and the caller's single commit must not force a reload of every row.
+engine = create_engine(
+    DATABASE_URL,
+    echo=DB_ECHO,
+    future=True,
+    **_pool_options(DATABASE_URL),
+)
+replica_engines = [
+    create_engine(url, echo=DB_ECHO, future=True, **_pool_options(url))
+    for url in DB_REPLICA_URLS
+]
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    bind=engine,
+    replicas=replica_engines,
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+)
 
 
 def get_session() -> Session:
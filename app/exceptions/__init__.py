@@ -1,5 +1,10 @@
 from .base import AppError
-from .repository_exceptions import RepositoryError, NotFoundError, UniqueConstraintError
+from .repository_exceptions import (
+    RepositoryError,
+    NotFoundError,
+    UniqueConstraintError,
+    LimitExceededError,
+)
 from .service_exceptions import ServiceError, ValidationError, BusinessRuleViolation
 
 __all__ = [
@@ -7,6 +12,7 @@ __all__ = [
     "RepositoryError",
     "NotFoundError",
     "UniqueConstraintError",
+    "LimitExceededError",
     "ServiceError",
     "ValidationError",
     "BusinessRuleViolation",
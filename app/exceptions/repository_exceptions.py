@@ -25,3 +25,10 @@ class UniqueConstraintError(RepositoryError):
 
     def __init__(self, message: str = "Unique constraint violated") -> None:
         super().__init__(message)
+
+
+class LimitExceededError(RepositoryError):
+    """Raised when a write is refused because it would exceed a quota."""
+
+    def __init__(self, message: str = "Limit exceeded") -> None:
+        super().__init__(message)
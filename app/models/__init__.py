@@ -1,4 +1,5 @@
 from .project import ProjectORM
 from .task import TaskORM
+from . import task_search  # noqa: F401  # Registers the full-text search DDL
 
 __all__ = ["ProjectORM", "TaskORM"]
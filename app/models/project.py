@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime
+from sqlalchemy import String, Text, DateTime, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -24,8 +24,31 @@ class ProjectORM(Base):
         DateTime, default=datetime.utcnow, nullable=False
     )
 
-    # One-to-many relationship with tasks
+    # Denormalized task counters, maintained by TaskRepository in the same
+    # transaction as the task writes that change them.
+    task_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    todo_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    doing_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    done_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
+    # Bumped on every change to the project or its tasks; ETags are
+    # derived from it so conditional GETs never touch the tasks table.
+    version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
+    # One-to-many relationship with tasks. Deleting a project leaves its
+    # tasks to the foreign key's ON DELETE CASCADE instead of loading them.
     tasks: Mapped[List["TaskORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,10 +12,63 @@ if TYPE_CHECKING:
     # Only imported for type checking, avoids circular import at runtime
     from app.models.project import ProjectORM
 
+# Predicate shared by the partial "open tasks" index and the queries that
+# should use it. It is kept as literal SQL so the planner can match it.
+OPEN_TASK_PREDICATE = "status <> 'done'"
+
 
 class TaskORM(Base):
     """SQLAlchemy ORM model for the tasks table."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Task listing: WHERE project_id = ? ORDER BY id. On PostgreSQL the
+        # INCLUDE columns make it covering for the list projection.
+        Index(
+            "ix_tasks_project_listing",
+            "project_id",
+            "id",
+            postgresql_include=[
+                "title",
+                "description",
+                "status",
+                "deadline",
+                "created_at",
+            ],
+        ),
+        # Overdue scan: WHERE deadline < ? AND status <> 'done' ORDER BY deadline
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text(OPEN_TASK_PREDICATE),
+            sqlite_where=text(OPEN_TASK_PREDICATE),
+        ),
+        # Cross-project queries (TaskRepository.query): one index per sort
+        # key, so pages are read in order and ranges on the key are index
+        # ranges; the project variants serve the same with a project filter.
+        Index("ix_tasks_deadline_id", "deadline", "id"),
+        Index("ix_tasks_created_id", "created_at", "id"),
+        Index("ix_tasks_project_deadline", "project_id", "deadline", "id"),
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        # Status filters in each sort order, and overdue (open tasks only)
+        # in id and creation order; overdue by deadline uses
+        # ix_tasks_open_deadline.
+        Index("ix_tasks_status_id", "status", "id"),
+        Index("ix_tasks_status_deadline", "status", "deadline", "id"),
+        Index("ix_tasks_status_created", "status", "created_at", "id"),
+        Index(
+            "ix_tasks_open_id",
+            "id",
+            postgresql_where=text(OPEN_TASK_PREDICATE),
+            sqlite_where=text(OPEN_TASK_PREDICATE),
+        ),
+        Index(
+            "ix_tasks_open_created",
+            "created_at",
+            "id",
+            postgresql_where=text(OPEN_TASK_PREDICATE),
+            sqlite_where=text(OPEN_TASK_PREDICATE),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
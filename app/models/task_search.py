@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, event
+
+from app.models.task import TaskORM
+
+# Full-text search over task titles and descriptions. The index lives
+# outside the ORM model because each backend stores it differently:
+#
+# - PostgreSQL: a GIN index on a weighted tsvector expression; titles are
+#   weighted above descriptions for ranking. Queries must use the same
+#   expression (TASK_SEARCH_VECTOR) for the planner to match the index.
+# - SQLite: an external-content FTS5 table kept in sync by triggers.
+#
+# The migration creates the same objects; these listeners cover
+# `metadata.create_all`, as used by tests and benchmarks.
+
+TASK_SEARCH_CONFIG = "english"
+TASK_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', description), 'B')"
+)
+TASK_FTS_TABLE = "tasks_fts"
+
+POSTGRES_SEARCH_DDL = (
+    f"CREATE INDEX ix_tasks_search_vector ON tasks USING gin (({TASK_SEARCH_VECTOR}))",
+)
+
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASK_FTS_TABLE} USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    f"CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {TASK_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    f"CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {TASK_FTS_TABLE}({TASK_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    f"CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    f"INSERT INTO {TASK_FTS_TABLE}({TASK_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {TASK_FTS_TABLE}(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+)
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        TaskORM.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        TaskORM.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    TaskORM.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {TASK_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
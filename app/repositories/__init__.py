@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Any, ClassVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -8,3 +12,47 @@ class BaseRepository:
 
     def __init__(self, session: Session) -> None:
         self._session = session
+
+    def _use_primary(self) -> None:
+        """
+        Pin a replica-routing session to the primary before a mutation.
+
+        The reads a mutation depends on (existence checks, current status)
+        must not come from a lagging replica.
+        """
+        stick_to_primary = getattr(self._session, "stick_to_primary", None)
+        if stick_to_primary is not None:
+            stick_to_primary()
+
+    def _dialect_name(self) -> str:
+        """
+        Name of the session's database dialect.
+
+        The bind is looked up for a plain SELECT: without a clause a
+        replica-routing session treats the lookup as a write and would
+        pin itself to the primary.
+        """
+        return self._session.get_bind(clause=select(1)).dialect.name
+
+
+class AsyncBaseRepository:
+    """
+    Base repository for the asyncio stack, holding an AsyncSession.
+
+    Methods run the matching synchronous repository on the AsyncSession's
+    greenlet-backed sync session (`AsyncSession.run_sync`): the queries
+    and counter bookkeeping are shared with the sync stack, while all
+    database I/O is awaited on the asyncio driver.
+    """
+
+    sync_repository: ClassVar[type[BaseRepository]]
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def _run(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        def call(sync_session: Session) -> Any:
+            repository = self.sync_repository(session=sync_session)
+            return getattr(repository, method_name)(*args, **kwargs)
+
+        return await self._session.run_sync(call)
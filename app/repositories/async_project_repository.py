@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from app.models import ProjectORM
+from app.repositories import AsyncBaseRepository
+from app.repositories.pagination import Page
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import ProjectView
+
+
+class AsyncProjectRepository(AsyncBaseRepository):
+    """Asyncio variant of ProjectRepository."""
+
+    sync_repository = ProjectRepository
+
+    # --- Query methods ---
+
+    async def get_by_id(self, project_id: int) -> ProjectORM:
+        return await self._run("get_by_id", project_id)
+
+    async def get_view(self, project_id: int) -> ProjectView:
+        return await self._run("get_view", project_id)
+
+    async def get_by_name(self, name: str) -> Optional[ProjectORM]:
+        return await self._run("get_by_name", name)
+
+    async def list_all(self) -> List[ProjectORM]:
+        return await self._run("list_all")
+
+    async def list_all_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectORM]:
+        return await self._run("list_all_page", limit=limit, after_id=after_id)
+
+    async def get_version(self, project_id: int) -> int:
+        return await self._run("get_version", project_id)
+
+    async def list_all_view_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectView]:
+        return await self._run("list_all_view_page", limit=limit, after_id=after_id)
+
+    async def exists_by_name(self, name: str) -> bool:
+        return await self._run("exists_by_name", name)
+
+    # --- Command methods (mutations) ---
+
+    async def create(
+        self,
+        name: str,
+        description: str,
+        max_projects: int | None = None,
+    ) -> ProjectORM:
+        return await self._run(
+            "create",
+            name=name,
+            description=description,
+            max_projects=max_projects,
+        )
+
+    async def update(
+        self,
+        project_id: int,
+        new_name: str,
+        new_description: str,
+    ) -> ProjectORM:
+        return await self._run(
+            "update",
+            project_id=project_id,
+            new_name=new_name,
+            new_description=new_description,
+        )
+
+    async def delete(self, project_id: int) -> None:
+        await self._run("delete", project_id)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from app.models import TaskORM
+from app.repositories import AsyncBaseRepository
+from app.repositories.pagination import Page
+from app.repositories.read_models import TaskView
+from app.repositories.task_repository import TaskRepository
+
+
+class AsyncTaskRepository(AsyncBaseRepository):
+    """Asyncio variant of TaskRepository."""
+
+    sync_repository = TaskRepository
+
+    # --- Query methods ---
+
+    async def get_by_id(self, task_id: int) -> TaskORM:
+        return await self._run("get_by_id", task_id)
+
+    async def get_view(self, task_id: int) -> TaskView:
+        return await self._run("get_view", task_id)
+
+    async def list_by_project(self, project_id: int) -> List[TaskORM]:
+        return await self._run("list_by_project", project_id)
+
+    async def list_by_project_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[TaskORM]:
+        return await self._run(
+            "list_by_project_page",
+            project_id,
+            limit=limit,
+            after_id=after_id,
+        )
+
+    async def list_by_project_view_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[TaskView]:
+        return await self._run(
+            "list_by_project_view_page",
+            project_id,
+            limit=limit,
+            after_id=after_id,
+        )
+
+    async def list_overdue_open_tasks(self, now: datetime) -> List[TaskORM]:
+        return await self._run("list_overdue_open_tasks", now)
+
+    async def next_open_deadline(self) -> Optional[datetime]:
+        return await self._run("next_open_deadline")
+
+    # --- Command methods ---
+
+    async def create(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline: datetime | None = None,
+        max_tasks: int | None = None,
+    ) -> TaskORM:
+        return await self._run(
+            "create",
+            project_id=project_id,
+            title=title,
+            description=description,
+            deadline=deadline,
+            max_tasks=max_tasks,
+        )
+
+    async def create_many(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+        max_tasks: int | None = None,
+    ) -> List[TaskORM]:
+        return await self._run(
+            "create_many",
+            project_id=project_id,
+            rows=rows,
+            max_tasks=max_tasks,
+        )
+
+    async def update(
+        self,
+        task_id: int,
+        new_title: str,
+        new_description: str,
+        new_deadline: datetime | None,
+    ) -> TaskORM:
+        return await self._run(
+            "update",
+            task_id=task_id,
+            new_title=new_title,
+            new_description=new_description,
+            new_deadline=new_deadline,
+        )
+
+    async def delete(self, task_id: int) -> None:
+        await self._run("delete", task_id)
+
+    async def close_overdue_chunk(
+        self,
+        now: datetime,
+        limit: int,
+        skip_locked: bool = False,
+    ) -> List[int]:
+        return await self._run("close_overdue_chunk", now, limit, skip_locked)
+
+    async def close_overdue_chunk_deadlines(
+        self,
+        now: datetime,
+        limit: int,
+        skip_locked: bool = False,
+    ) -> List[Tuple[int, datetime]]:
+        return await self._run("close_overdue_chunk_deadlines", now, limit, skip_locked)
+
+    async def close_overdue(self, now: datetime, batch_size: int = 1000) -> List[int]:
+        return await self._run("close_overdue", now, batch_size=batch_size)
+
+    async def update_status(self, task_id: int, new_status: str) -> TaskORM:
+        return await self._run("update_status", task_id, new_status)
+
+    async def update_status_many(
+        self,
+        project_id: int,
+        task_ids: Sequence[int],
+        new_status: str,
+    ) -> List[TaskORM]:
+        return await self._run(
+            "update_status_many",
+            project_id=project_id,
+            task_ids=task_ids,
+            new_status=new_status,
+        )
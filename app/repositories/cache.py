@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Dict, List, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# Size and time-to-live of the project lookup cache; a size of 0 disables it
+PROJECT_CACHE_SIZE = int(os.getenv("PROJECT_CACHE_SIZE", "1024"))
+PROJECT_CACHE_TTL = float(os.getenv("PROJECT_CACHE_TTL", "30"))
+
+
+class LookupCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after `ttl` seconds.
+
+    Values are plain data (ids, flags), never ORM instances, which belong
+    to one session. Only hits are stored: a falsy value (False, None) is
+    returned but not cached, so something that did not exist yet, or was
+    not on a lagging replica yet, is looked up again next time. Writers
+    call `invalidate_on_commit` for the keys they change; the TTL bounds
+    how stale an entry can get when another process makes the change.
+    With `max_size` 0 nothing is stored and every lookup loads.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        # Bumped by every invalidation; a value loaded across one isn't stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], T]) -> T:
+        """Return the cached value for `key`, calling `load` on a miss."""
+        if not self.enabled:
+            return load()
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+
+        with self._lock:
+            if not value or generation != self._generation:
+                return value
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Process-wide cache shared by every ProjectRepository that isn't given one
+project_cache = LookupCache(max_size=PROJECT_CACHE_SIZE, ttl=PROJECT_CACHE_TTL)
+
+
+# Invalidation after commit.
+#
+# A writer's keys are dropped once its transaction commits, not when it
+# flushes: dropped earlier, another request could load the pre-commit
+# value again and keep it for the whole TTL. Until then the writing
+# session reads around the cache (`has_pending_invalidations`), so its
+# uncommitted state is never stored for others. A rollback changed
+# nothing and drops the pending keys.
+
+_PENDING_KEY = "pending_cache_invalidations"
+
+
+def invalidate_on_commit(session: Session, cache: LookupCache, *keys: Hashable) -> None:
+    """Drop `keys` from `cache` once `session` commits."""
+    pending: List[Tuple[LookupCache, Tuple[Hashable, ...]]]
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    pending.append((cache, keys))
+
+
+def has_pending_invalidations(session: Session) -> bool:
+    """True while `session` has uncommitted changes to cached values."""
+    return bool(session.info.get(_PENDING_KEY))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for cache, keys in session.info.pop(_PENDING_KEY, ()):
+        cache.invalidate(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# In-process notifications of new open-task deadlines.
+#
+# TaskRepository records the deadlines it writes on open tasks in its
+# session's `info`; once that transaction commits, subscribers (the
+# deadline scheduler) receive the earliest one. Rolled back transactions
+# publish nothing. With no subscribers nothing is recorded at all.
+
+DeadlineCallback = Callable[[datetime], None]
+
+_PENDING_KEY = "pending_task_deadline"
+_subscribers: List[DeadlineCallback] = []
+
+
+def subscribe(callback: DeadlineCallback) -> None:
+    _subscribers.append(callback)
+
+
+def unsubscribe(callback: DeadlineCallback) -> None:
+    if callback in _subscribers:
+        _subscribers.remove(callback)
+
+
+def record_deadlines(session: Session, deadlines: Iterable[Optional[datetime]]) -> None:
+    """Remember the earliest of `deadlines` until `session` commits."""
+    if not _subscribers:
+        return
+    earliest = min((d for d in deadlines if d is not None), default=None)
+    if earliest is None:
+        return
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None or earliest < pending:
+        session.info[_PENDING_KEY] = earliest
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_deadline(session: Session) -> None:
+    earliest = session.info.pop(_PENDING_KEY, None)
+    if earliest is None:
+        return
+    for callback in list(_subscribers):
+        callback(earliest)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deadline(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    One page of a keyset-paginated query.
+
+    `next_key` is the sort key of the last item, to be passed back as the
+    `after` position of the next query, or None when this is the last page.
+    """
+
+    items: List[T]
+    next_key: Optional[Any] = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[T],
+        limit: int,
+        key: Callable[[T], Any],
+    ) -> "Page[T]":
+        """
+        Build a page from a query that fetched `limit + 1` rows.
+
+        The extra row only tells us whether another page exists.
+        """
+        items = list(rows[:limit])
+        next_key = key(items[-1]) if len(rows) > limit else None
+        return cls(items=items, next_key=next_key)
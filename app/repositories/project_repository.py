@@ -1,26 +1,72 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    RowMapping,
+    Select,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.exceptions import NotFoundError, UniqueConstraintError
-from app.models import ProjectORM
+from app.exceptions import LimitExceededError, NotFoundError, UniqueConstraintError
+from app.models import ProjectORM, TaskORM
+from app.models.task import OPEN_TASK_PREDICATE
 from app.repositories import BaseRepository
+from app.repositories.cache import (
+    LookupCache,
+    has_pending_invalidations,
+    invalidate_on_commit,
+    project_cache,
+)
+from app.repositories.pagination import Page
+from app.repositories.read_models import (
+    PROJECT_VIEW_COLUMNS,
+    ProjectStatsView,
+    ProjectView,
+    TaskStatsTotalsView,
+)
+
+T = TypeVar("T")
+
+# Advisory lock id that serializes project creates under a limit
+PROJECT_LIMIT_LOCK_ID = int(os.getenv("PROJECT_LIMIT_LOCK_ID", "7302"))
 
 
 class ProjectRepository(BaseRepository):
-    """Repository for ProjectORM entities."""
+    """
+    Repository for ProjectORM entities.
+
+    Mutations are flushed, not committed; the caller's unit of work owns
+    the transaction.
 
-    def __init__(self, session: Session | None = None) -> None:
+    Existence checks by id and name lookups (`exists`, `get_id_by_name`)
+    go through a LookupCache, the process-wide `project_cache` unless
+    another one is passed in; `create`, `update` and `delete` invalidate
+    the entries they change when their transaction commits.
+    """
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        cache: LookupCache | None = None,
+    ) -> None:
         # Allow passing an external session (e.g., from a service or test)
         # or create a local one for simple use-cases.
         if session is None:
             session = SessionLocal()
         super().__init__(session)
+        self._cache = cache if cache is not None else project_cache
 
     # --- Query methods ---
 
@@ -30,6 +76,146 @@ class ProjectRepository(BaseRepository):
             raise NotFoundError("Project", project_id)
         return project
 
+    def exists(self, project_id: int) -> bool:
+        """Return True if the project exists; cached."""
+        def load() -> bool:
+            stmt = select(ProjectORM.id).where(ProjectORM.id == project_id)
+            return self._session.execute(stmt).scalar_one_or_none() is not None
+
+        return self._cached(("id", project_id), load)
+
+    def get_id_by_name(self, name: str) -> Optional[int]:
+        """Return the id of the project with this name, or None; cached."""
+        def load() -> Optional[int]:
+            stmt = select(ProjectORM.id).where(ProjectORM.name == name)
+            return self._session.execute(stmt).scalar_one_or_none()
+
+        return self._cached(("name", name), load)
+
+    def _cached(self, key: Tuple[str, object], load: Callable[[], T]) -> T:
+        """
+        Look `key` up in the cache, calling `load` on a miss.
+
+        A session with uncommitted project changes reads the database
+        directly, so its own writes are visible to it and its uncommitted
+        state never reaches the shared cache.
+        """
+        if has_pending_invalidations(self._session):
+            return load()
+        return self._cache.get_or_load(key, load)
+
+    def _invalidate(self, *keys: Tuple[str, object]) -> None:
+        invalidate_on_commit(self._session, self._cache, *keys)
+
+    def get_view(self, project_id: int) -> ProjectView:
+        """Return the project's read model, selecting only its columns."""
+        stmt = select(*PROJECT_VIEW_COLUMNS).where(ProjectORM.id == project_id)
+        row = self._session.execute(stmt).first()
+        if row is None:
+            raise NotFoundError("Project", project_id)
+        return ProjectView(*row)
+
+    def stats(
+        self,
+        now: datetime,
+        project_id: int | None = None,
+    ) -> List[ProjectStatsView]:
+        """
+        Return task statistics for all projects, or one, ordered by id.
+
+        One statement: the projects' status counters, left-joined to a
+        GROUP BY over open tasks with a deadline, which counts the overdue
+        ones and finds the next deadline at or after `now`.
+        """
+        if project_id is None:
+            return self._stats_rows(now, None)
+        return self._stats_rows(now, lambda column: column == project_id)
+
+    def stats_page(
+        self,
+        now: datetime,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectStatsView]:
+        """
+        Return the statistics of up to `limit` projects with id greater than `after_id`.
+
+        Same statement as `stats`, with the GROUP BY restricted to the
+        projects of the page.
+        """
+        page_ids = self._page_stmt(select(ProjectORM.id), limit, after_id).subquery()
+        rows = self._stats_rows(
+            now, lambda column: column.in_(select(page_ids.c.id))
+        )
+        return Page.from_rows(rows, limit, key=lambda row: row.project_id)
+
+    def _stats_rows(
+        self,
+        now: datetime,
+        in_scope: Callable[[Any], ColumnElement[bool]] | None,
+    ) -> List[ProjectStatsView]:
+        open_deadlines = (
+            select(
+                TaskORM.project_id,
+                func.count().filter(TaskORM.deadline < now).label("overdue_count"),
+                func.min(TaskORM.deadline)
+                .filter(TaskORM.deadline >= now)
+                .label("next_deadline"),
+            )
+            .where(TaskORM.deadline.is_not(None))
+            .where(text(OPEN_TASK_PREDICATE))
+            .group_by(TaskORM.project_id)
+        )
+        stmt = select(
+            ProjectORM.id,
+            ProjectORM.task_count,
+            ProjectORM.todo_count,
+            ProjectORM.doing_count,
+            ProjectORM.done_count,
+        )
+        if in_scope is not None:
+            open_deadlines = open_deadlines.where(in_scope(TaskORM.project_id))
+            stmt = stmt.where(in_scope(ProjectORM.id))
+
+        open_deadlines = open_deadlines.subquery()
+        stmt = (
+            stmt.add_columns(
+                func.coalesce(open_deadlines.c.overdue_count, 0),
+                open_deadlines.c.next_deadline,
+            )
+            .outerjoin(open_deadlines, open_deadlines.c.project_id == ProjectORM.id)
+            .order_by(ProjectORM.id)
+        )
+        return [ProjectStatsView(*row) for row in self._session.execute(stmt)]
+
+    def stats_totals(self, now: datetime) -> TaskStatsTotalsView:
+        """
+        Return task statistics summed over all projects, in one statement.
+
+        The status counts add up the projects' counters; the overdue count
+        and next deadline are taken over all open tasks, without grouping.
+        """
+        overdue = select(func.count()).where(
+            text(OPEN_TASK_PREDICATE), TaskORM.deadline < now
+        )
+        next_deadline = select(func.min(TaskORM.deadline)).where(
+            text(OPEN_TASK_PREDICATE), TaskORM.deadline >= now
+        )
+        stmt = select(
+            *(
+                func.coalesce(func.sum(column), 0)
+                for column in (
+                    ProjectORM.task_count,
+                    ProjectORM.todo_count,
+                    ProjectORM.doing_count,
+                    ProjectORM.done_count,
+                )
+            ),
+            overdue.scalar_subquery(),
+            next_deadline.scalar_subquery(),
+        )
+        return TaskStatsTotalsView(*self._session.execute(stmt).one())
+
     def get_by_name(self, name: str) -> Optional[ProjectORM]:
         stmt = select(ProjectORM).where(ProjectORM.name == name)
         result = self._session.execute(stmt).scalar_one_or_none()
@@ -40,59 +226,182 @@ class ProjectRepository(BaseRepository):
         result = self._session.execute(stmt).scalars().all()
         return list(result)
 
+    def list_all_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectORM]:
+        """Return up to `limit` projects with id greater than `after_id`."""
+        stmt = self._page_stmt(select(ProjectORM), limit, after_id)
+        rows = self._session.execute(stmt).scalars().all()
+        return Page.from_rows(rows, limit, key=lambda project: project.id)
+
+    def list_all_view_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectView]:
+        """Same page as `list_all_page`, as ProjectView read models."""
+        stmt = self._page_stmt(select(*PROJECT_VIEW_COLUMNS), limit, after_id)
+        rows = [ProjectView(*row) for row in self._session.execute(stmt)]
+        return Page.from_rows(rows, limit, key=lambda project: project.id)
+
+    @staticmethod
+    def _page_stmt(stmt: Select, limit: int, after_id: int | None) -> Select:
+        stmt = stmt.order_by(ProjectORM.id).limit(limit + 1)
+        if after_id is not None:
+            stmt = stmt.where(ProjectORM.id > after_id)
+        return stmt
+
+    def get_version(self, project_id: int) -> int:
+        """Return the project's version stamp without loading the project."""
+        stmt = select(ProjectORM.version).where(ProjectORM.id == project_id)
+        version = self._session.execute(stmt).scalar_one_or_none()
+        if version is None:
+            raise NotFoundError("Project", project_id)
+        return version
+
+    def iter_batches(self, batch_size: int) -> Iterator[Sequence[RowMapping]]:
+        """
+        Yield every project as column mappings, `batch_size` rows at a time.
+
+        Plain column rows (no ORM instances) fetched with yield_per, which
+        uses a server-side cursor where the driver supports one, so memory
+        stays flat however many projects there are.
+        """
+        stmt = select(ProjectORM.__table__).order_by(ProjectORM.id)
+        result = self._session.execute(
+            stmt, execution_options={"yield_per": batch_size}
+        )
+        yield from result.mappings().partitions()
+
     def exists_by_name(self, name: str) -> bool:
-        return self.get_by_name(name) is not None
+        return self.get_id_by_name(name) is not None
 
     # --- Command methods (mutations) ---
 
-    def create(self, name: str, description: str) -> ProjectORM:
+    def create(
+        self,
+        name: str,
+        description: str,
+        max_projects: int | None = None,
+    ) -> ProjectORM:
+        """
+        Insert a new project.
+
+        The insert is a single INSERT ... SELECT; with `max_projects` it is
+        guarded by the current project count, so the limit is checked and
+        applied in one statement. LimitExceededError is raised when reached.
+
+        Under READ COMMITTED two concurrent guarded inserts could both count
+        below the limit, so on PostgreSQL they first take a transaction-level
+        advisory lock and run one at a time; each then counts the rows the
+        other committed. SQLite already serializes writers.
+        """
+        self._use_primary()
         if self.exists_by_name(name):
             raise UniqueConstraintError(f"Project with name '{name}' already exists")
 
-        project = ProjectORM(name=name, description=description)
-        self._session.add(project)
+        if max_projects is not None and self._dialect_name() == "postgresql":
+            self._session.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": PROJECT_LIMIT_LOCK_ID},
+            )
+
+        source = select(
+            literal(name),
+            literal(description),
+            literal(datetime.utcnow()),
+        )
+        if max_projects is not None:
+            project_count = (
+                select(func.count()).select_from(ProjectORM).scalar_subquery()
+            )
+            source = source.where(project_count < max_projects)
+
+        stmt = (
+            insert(ProjectORM)
+            .from_select(["name", "description", "created_at"], source)
+            .returning(ProjectORM)
+        )
 
         try:
-            self._session.commit()
+            project = self._session.execute(stmt).scalar_one_or_none()
         except IntegrityError as exc:
-            self._session.rollback()
             # Extra safety in case of concurrent insert
             raise UniqueConstraintError(
                 f"Project with name '{name}' already exists"
             ) from exc
 
-        self._session.refresh(project)
+        if project is None:
+            raise LimitExceededError(
+                f"Maximum limit of {max_projects} projects reached."
+            )
+        self._invalidate(("name", name), ("id", project.id))
         return project
 
+    def ensure_names(self, projects: Mapping[str, str]) -> Dict[str, int]:
+        """
+        Return the ids of the named projects, creating the missing ones.
+
+        `projects` maps name to the description used if it has to be
+        created. One SELECT finds the existing names and one multi-row
+        INSERT ... RETURNING adds the rest; no project limit is applied.
+        """
+        self._use_primary()
+        if not projects:
+            return {}
+
+        stmt = select(ProjectORM.name, ProjectORM.id).where(
+            ProjectORM.name.in_(list(projects))
+        )
+        ids = dict(self._session.execute(stmt).all())
+
+        missing = [name for name in projects if name not in ids]
+        if missing:
+            now = datetime.utcnow()
+            insert_stmt = insert(ProjectORM).returning(ProjectORM.name, ProjectORM.id)
+            params = [
+                {"name": name, "description": projects[name], "created_at": now}
+                for name in missing
+            ]
+            ids.update(self._session.execute(insert_stmt, params).all())
+            self._invalidate(*(("name", name) for name in missing))
+
+        return ids
+
     def update(self, project_id: int, new_name: str, new_description: str) -> ProjectORM:
         """Update an existing project."""
+        self._use_primary()
         project = self._session.get(ProjectORM, project_id)
         if project is None:
             raise NotFoundError("Project", project_id)
 
         # Check for unique name constraint manually
-        existing = self.get_by_name(new_name)
-        if existing is not None and existing.id != project.id:
+        existing_id = self.get_id_by_name(new_name)
+        if existing_id is not None and existing_id != project.id:
             raise UniqueConstraintError(f"Project with name '{new_name}' already exists")
 
+        self._invalidate(("name", project.name), ("name", new_name))
         project.name = new_name
         project.description = new_description
+        project.version = ProjectORM.version + 1
 
         try:
-            self._session.commit()
+            self._session.flush()
         except IntegrityError as exc:
-            self._session.rollback()
             raise UniqueConstraintError(
                 f"Project with name '{new_name}' already exists"
             ) from exc
 
-        self._session.refresh(project)
         return project
 
     def delete(self, project_id: int) -> None:
+        self._use_primary()
         project = self._session.get(ProjectORM, project_id)
         if project is None:
             raise NotFoundError("Project", project_id)
 
         self._session.delete(project)
-        self._session.commit()
+        self._session.flush()
+        self._invalidate(("id", project_id), ("name", project.name))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Optional
+
+from app.models import ProjectORM, TaskORM
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectView:
+    """
+    Read model of a project: the ProjectRead columns plus its version.
+
+    Built straight from a result tuple, so reads skip the identity map,
+    attribute instrumentation and relationship loaders.
+    """
+    id: int
+    name: str
+    description: str
+    created_at: datetime
+    task_count: int
+    todo_count: int
+    doing_count: int
+    done_count: int
+    version: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskView:
+    """Read model of a task: the TaskRead columns, see ProjectView."""
+    id: int
+    project_id: int
+    title: str
+    description: str
+    status: str
+    deadline: Optional[datetime]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectStatsView:
+    """
+    Task statistics of one project.
+
+    The status counts come from the project's maintained counters; the
+    overdue count and next deadline are taken over its open tasks.
+    """
+    project_id: int
+    task_count: int
+    todo_count: int
+    doing_count: int
+    done_count: int
+    overdue_count: int
+    next_deadline: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStatsTotalsView:
+    """Task statistics summed over all projects."""
+    task_count: int = 0
+    todo_count: int = 0
+    doing_count: int = 0
+    done_count: int = 0
+    overdue_count: int = 0
+    next_deadline: Optional[datetime] = None
+
+
+def view_columns(view: type, entity: type) -> tuple[Any, ...]:
+    """The entity's columns for each field of `view`, in field order."""
+    return tuple(getattr(entity, field.name) for field in fields(view))
+
+
+PROJECT_VIEW_COLUMNS = view_columns(ProjectView, ProjectORM)
+TASK_VIEW_COLUMNS = view_columns(TaskView, TaskORM)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Keys the cross-project task query can sort by; each has an index
+# leading with it (see TaskORM.__table_args__). Ties are broken by id.
+# A deadline range must be sorted by deadline and a creation range by
+# created_at: in any other order no index serves the range in order, and
+# every page would sort all the tasks in it.
+TASK_SORT_KEYS = ("id", "deadline", "created_at")
+
+# Several statuses or projects are read as one ordered index range per
+# value, merged; this bounds the number of ranges of one query.
+MAX_QUERY_PROJECTS = 50
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """
+    Filters of a cross-project task query; empty fields don't filter.
+
+    Ranges are half-open, `[from, before)`. `overdue` keeps open tasks
+    whose deadline has passed.
+    """
+    statuses: Tuple[str, ...] = ()
+    project_ids: Tuple[int, ...] = ()
+    deadline_from: Optional[datetime] = None
+    deadline_before: Optional[datetime] = None
+    created_from: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    overdue: bool = False
+
+    @property
+    def has_deadline_range(self) -> bool:
+        return self.deadline_from is not None or self.deadline_before is not None
+
+    @property
+    def has_created_range(self) -> bool:
+        return self.created_from is not None or self.created_before is not None
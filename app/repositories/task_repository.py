@@ -1,19 +1,94 @@
 from __future__ import annotations
 
+import io
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
-from typing import List
+from typing import Any, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Double,
+    RowMapping,
+    Select,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.exceptions import NotFoundError
-from app.models import TaskORM
+from app.exceptions import LimitExceededError, NotFoundError
+from app.models import ProjectORM, TaskORM
+from app.models.task import OPEN_TASK_PREDICATE
+from app.models.task_search import (
+    TASK_FTS_TABLE,
+    TASK_SEARCH_CONFIG,
+    TASK_SEARCH_VECTOR,
+)
 from app.repositories import BaseRepository
+from app.repositories.deadline_events import record_deadlines
+from app.repositories.pagination import Page
+from app.repositories.read_models import TASK_VIEW_COLUMNS, TaskView
+from app.repositories.task_query import (
+    MAX_QUERY_PROJECTS,
+    TASK_SORT_KEYS,
+    TaskFilter,
+)
+
+
+# Columns written by `TaskRepository.bulk_load`, in COPY order
+BULK_LOAD_COLUMNS = (
+    "project_id",
+    "title",
+    "description",
+    "status",
+    "deadline",
+    "created_at",
+)
+
+# Session-local staging table for COPY; dropped when the transaction ends
+STAGING_TABLE = "tasks_import_staging"
+
+
+def _copy_text_value(value: Any) -> str:
+    """Render one value for COPY's text format (\\N is NULL)."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# Counter column on ProjectORM for each task status
+STATUS_COUNTER_COLUMNS = {
+    "todo": "todo_count",
+    "doing": "doing_count",
+    "done": "done_count",
+}
 
 
 class TaskRepository(BaseRepository):
-    """Repository for TaskORM entities."""
+    """
+    Repository for TaskORM entities.
+
+    Mutations are flushed, not committed; the caller's unit of work owns
+    the transaction.
+    """
 
     def __init__(self, session: Session | None = None) -> None:
         if session is None:
@@ -28,6 +103,21 @@ class TaskRepository(BaseRepository):
             raise NotFoundError("Task", task_id)
         return task
 
+    def get_view(self, task_id: int) -> TaskView:
+        """Return the task's read model, selecting only its columns."""
+        stmt = select(*TASK_VIEW_COLUMNS).where(TaskORM.id == task_id)
+        row = self._session.execute(stmt).first()
+        if row is None:
+            raise NotFoundError("Task", task_id)
+        return TaskView(*row)
+
+    def exists_in_project(self, project_id: int, task_id: int) -> bool:
+        stmt = select(TaskORM.id).where(
+            TaskORM.id == task_id,
+            TaskORM.project_id == project_id,
+        )
+        return self._session.execute(stmt).first() is not None
+
     def list_by_project(self, project_id: int) -> List[TaskORM]:
         stmt = (
             select(TaskORM)
@@ -37,18 +127,238 @@ class TaskRepository(BaseRepository):
         result = self._session.execute(stmt).scalars().all()
         return list(result)
 
+    def list_by_project_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[TaskORM]:
+        """
+        Return up to `limit` tasks of a project with id greater than `after_id`.
+
+        Served by ix_tasks_project_listing, so the cost does not grow with
+        how deep the client has paged.
+        """
+        stmt = self._project_page_stmt(select(TaskORM), project_id, limit, after_id)
+        rows = self._session.execute(stmt).scalars().all()
+        return Page.from_rows(rows, limit, key=lambda task: task.id)
+
+    def list_by_project_view_page(
+        self,
+        project_id: int,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[TaskView]:
+        """Same page as `list_by_project_page`, as TaskView read models."""
+        stmt = self._project_page_stmt(
+            select(*TASK_VIEW_COLUMNS), project_id, limit, after_id
+        )
+        rows = [TaskView(*row) for row in self._session.execute(stmt)]
+        return Page.from_rows(rows, limit, key=lambda task: task.id)
+
+    @staticmethod
+    def _project_page_stmt(
+        stmt: Select,
+        project_id: int,
+        limit: int,
+        after_id: int | None,
+    ) -> Select:
+        stmt = (
+            stmt.where(TaskORM.project_id == project_id)
+            .order_by(TaskORM.id)
+            .limit(limit + 1)
+        )
+        if after_id is not None:
+            stmt = stmt.where(TaskORM.id > after_id)
+        return stmt
+
     def list_overdue_open_tasks(self, now: datetime) -> List[TaskORM]:
         """Return tasks whose deadline has passed and are not yet done."""
         stmt = (
             select(TaskORM)
             .where(TaskORM.deadline.is_not(None))
             .where(TaskORM.deadline < now)
-            .where(TaskORM.status != "done")
+            # Same literal predicate as the partial ix_tasks_open_deadline index
+            .where(text(OPEN_TASK_PREDICATE))
             .order_by(TaskORM.deadline)
         )
         result = self._session.execute(stmt).scalars().all()
         return list(result)
 
+    def next_open_deadline(self) -> Optional[datetime]:
+        """
+        Return the earliest deadline of an open task, or None.
+
+        Answered from the first entry of the partial ix_tasks_open_deadline
+        index, so it stays cheap however many tasks there are.
+        """
+        stmt = (
+            select(func.min(TaskORM.deadline))
+            .where(TaskORM.deadline.is_not(None))
+            .where(text(OPEN_TASK_PREDICATE))
+        )
+        return self._session.execute(stmt).scalar_one()
+
+    def query(
+        self,
+        filters: TaskFilter,
+        sort: str = "id",
+        descending: bool = False,
+        limit: int = 50,
+        after: Sequence[Any] | None = None,
+        now: datetime | None = None,
+    ) -> Page[TaskView]:
+        """
+        Return one page of tasks across projects matching `filters`.
+
+        Rows come in `sort` order (one of TASK_SORT_KEYS), ties broken by
+        id, and `after` is the `next_key` of the previous page: the sort
+        value and id of its last task. Sorting by deadline leaves out
+        tasks without one. `now` is the reference time for `overdue`.
+
+        Several projects, or else several statuses, are read as one
+        ordered index range per value, merged by a UNION ALL under the
+        ORDER BY, so no page sorts the tasks its filters select.
+        ValueError is raised for an unknown sort key, for more than
+        MAX_QUERY_PROJECTS projects, and for a deadline range not sorted
+        by deadline or a creation range not sorted by created_at.
+        """
+        if sort not in TASK_SORT_KEYS:
+            raise ValueError(f"Cannot sort tasks by {sort!r}")
+        if (filters.has_deadline_range and sort != "deadline") or (
+            filters.has_created_range and sort != "created_at"
+        ):
+            raise ValueError(
+                "A deadline range must be sorted by deadline "
+                "and a creation range by created_at"
+            )
+        if len(filters.project_ids) > MAX_QUERY_PROJECTS:
+            raise ValueError(f"At most {MAX_QUERY_PROJECTS} projects can be queried")
+
+        conditions = []
+        if filters.deadline_from is not None:
+            conditions.append(TaskORM.deadline >= filters.deadline_from)
+        if filters.deadline_before is not None:
+            conditions.append(TaskORM.deadline < filters.deadline_before)
+        if filters.created_from is not None:
+            conditions.append(TaskORM.created_at >= filters.created_from)
+        if filters.created_before is not None:
+            conditions.append(TaskORM.created_at < filters.created_before)
+        if filters.overdue:
+            conditions.append(TaskORM.deadline < (now or datetime.utcnow()))
+            conditions.append(text(OPEN_TASK_PREDICATE))
+
+        if sort == "id":
+            keys = (TaskORM.id,)
+        else:
+            keys = (getattr(TaskORM, sort), TaskORM.id)
+            if sort == "deadline":
+                conditions.append(TaskORM.deadline.is_not(None))
+
+        if after is not None:
+            position, values = tuple_(*keys), tuple_(*after)
+            conditions.append(position < values if descending else position > values)
+
+        # The merged column: projects if several are given (the statuses
+        # then filter each project's range), else statuses.
+        if len(filters.project_ids) > 1:
+            merged, values = TaskORM.project_id, filters.project_ids
+            if filters.statuses:
+                conditions.append(TaskORM.status.in_(filters.statuses))
+        else:
+            merged, values = TaskORM.status, filters.statuses
+            if filters.project_ids:
+                conditions.append(TaskORM.project_id.in_(filters.project_ids))
+
+        arms = [
+            select(*TASK_VIEW_COLUMNS).where(merged == value, *conditions)
+            for value in values
+        ] or [select(*TASK_VIEW_COLUMNS).where(*conditions)]
+        if len(arms) == 1:
+            stmt, order_keys = arms[0], keys
+        else:
+            stmt = union_all(*arms)
+            order_keys = tuple(stmt.selected_columns[key.key] for key in keys)
+        stmt = stmt.order_by(
+            *(key.desc() if descending else key for key in order_keys)
+        ).limit(limit + 1)
+
+        rows = [TaskView(*row) for row in self._session.execute(stmt)]
+        if sort == "id":
+            return Page.from_rows(rows, limit, key=lambda task: (task.id,))
+        return Page.from_rows(
+            rows, limit, key=lambda task: (getattr(task, sort), task.id)
+        )
+
+    def search(
+        self,
+        query: str,
+        project_id: int | None = None,
+        limit: int = 50,
+        after: Sequence[Any] | None = None,
+    ) -> Page[TaskView]:
+        """
+        Full-text search over task titles and descriptions, best match first.
+
+        PostgreSQL matches `query` with websearch_to_tsquery against the
+        indexed tsvector expression and ranks by ts_rank; SQLite matches every
+        word of `query` in the FTS5 table and ranks by bm25. Title matches
+        outrank description matches on both. Pages are keyset-paginated on
+        (rank, id): `after` is the `next_key` of the previous page, the
+        rank and id of its last task, with the rank negated on PostgreSQL
+        so that both backends order by ascending rank. ts_rank depends only
+        on the task and the query, so PostgreSQL pages neither skip nor
+        repeat tasks when others change between requests; bm25 also
+        weighs corpus statistics, so on SQLite they can.
+        """
+        if self._dialect_name() == "postgresql":
+            tsquery = func.websearch_to_tsquery(TASK_SEARCH_CONFIG, query)
+            vector = literal_column(f"({TASK_SEARCH_VECTOR})")
+            # As double precision: a real would come back rounded to its
+            # shortest text form and no longer compare equal in the keyset.
+            rank = -cast(func.ts_rank(vector, tsquery), Double)
+            stmt = select(*TASK_VIEW_COLUMNS, rank.label("rank")).where(
+                vector.op("@@")(tsquery)
+            )
+        else:
+            words = re.findall(r"\w+", query)
+            if not words:
+                return Page(items=[])
+            fts = table(TASK_FTS_TABLE, column("rowid"))
+            match = " ".join(f'"{word}"' for word in words)
+            rank = func.bm25(literal_column(TASK_FTS_TABLE), 2.0, 1.0)
+            stmt = (
+                select(*TASK_VIEW_COLUMNS, rank.label("rank"))
+                .join(fts, fts.c.rowid == TaskORM.id)
+                .where(literal_column(TASK_FTS_TABLE).op("MATCH")(match))
+            )
+
+        if project_id is not None:
+            stmt = stmt.where(TaskORM.project_id == project_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(rank, TaskORM.id) > tuple_(*after))
+        stmt = stmt.order_by(rank, TaskORM.id).limit(limit + 1)
+
+        rows = self._session.execute(stmt).all()
+        page = Page.from_rows(rows, limit, key=lambda row: (row.rank, row.id))
+        return Page(
+            items=[TaskView(*row[:-1]) for row in page.items],
+            next_key=page.next_key,
+        )
+
+    def iter_batches(self, batch_size: int) -> Iterator[Sequence[RowMapping]]:
+        """
+        Yield every task as column mappings, `batch_size` rows at a time.
+
+        Ordered by (project_id, id) so ix_tasks_project_listing serves the
+        scan; rows are streamed with yield_per as in ProjectRepository.
+        """
+        stmt = select(TaskORM.__table__).order_by(TaskORM.project_id, TaskORM.id)
+        result = self._session.execute(
+            stmt, execution_options={"yield_per": batch_size}
+        )
+        yield from result.mappings().partitions()
+
     # --- Command methods ---
 
     def create(
@@ -57,7 +367,19 @@ class TaskRepository(BaseRepository):
         title: str,
         description: str,
         deadline: datetime | None = None,
+        max_tasks: int | None = None,
     ) -> TaskORM:
+        """
+        Insert a new 'todo' task and count it on its project.
+
+        The project's counters are incremented by one conditional UPDATE;
+        with `max_tasks` it only matches while the project is below the
+        limit, so concurrent creates serialize on the project row and can
+        never overshoot it. LimitExceededError is raised when it is full.
+        """
+        self._use_primary()
+        self._reserve_task_slots(project_id, 1, max_tasks)
+
         task = TaskORM(
             project_id=project_id,
             title=title,
@@ -65,10 +387,106 @@ class TaskRepository(BaseRepository):
             deadline=deadline,
         )
         self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+        self._session.flush()
+        record_deadlines(self._session, [deadline])
         return task
 
+    def create_many(
+        self,
+        project_id: int,
+        rows: Sequence[Mapping[str, Any]],
+        max_tasks: int | None = None,
+    ) -> List[TaskORM]:
+        """
+        Insert many 'todo' tasks into one project and return them in order.
+
+        `rows` hold title, description and deadline. The quota is reserved
+        once for the whole batch, then the rows go out as multi-row
+        INSERT ... RETURNING batches (SQLAlchemy's insertmanyvalues),
+        returned in the order of `rows`.
+        """
+        self._use_primary()
+        if not rows:
+            return []
+
+        self._reserve_task_slots(project_id, len(rows), max_tasks)
+
+        # PostgreSQL keeps the batches and orders RETURNING by the
+        # autoincrement id; SQLite has no such guarantee and gets one
+        # INSERT per row instead.
+        stmt = insert(TaskORM).returning(TaskORM, sort_by_parameter_order=True)
+        params = [{**row, "project_id": project_id} for row in rows]
+        tasks = list(self._session.scalars(stmt, params))
+        record_deadlines(self._session, (task.deadline for task in tasks))
+        return tasks
+
+    def bulk_load(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """
+        Insert already validated tasks across many projects; returns the count.
+
+        `rows` hold project_id, title, description, status and deadline,
+        and optionally created_at; rows without one are stamped with now.
+        On PostgreSQL the rows are COPYed into a temporary staging table and
+        merged into tasks with one INSERT ... SELECT; other databases get an
+        executemany INSERT. Project counters are adjusted once per project.
+        No task quota is applied: this is the path for data migrations.
+        """
+        self._use_primary()
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        params = [
+            {column: row.get(column) for column in BULK_LOAD_COLUMNS}
+            | {"created_at": row.get("created_at") or now}
+            for row in rows
+        ]
+        if self._dialect_name() == "postgresql":
+            self._copy_load(params)
+        else:
+            self._session.execute(insert(TaskORM.__table__), params)
+
+        deltas: dict[int, Counter] = defaultdict(Counter)
+        for row in params:
+            deltas[row["project_id"]][row["status"]] += 1
+        self._adjust_project_counters(deltas)
+        record_deadlines(
+            self._session,
+            (row["deadline"] for row in params if row["status"] != "done"),
+        )
+        return len(params)
+
+    def _copy_load(self, params: Sequence[Mapping[str, Any]]) -> None:
+        """COPY rows into the staging table, then merge them into tasks."""
+        columns = ", ".join(BULK_LOAD_COLUMNS)
+        self._session.execute(
+            text(
+                f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} "
+                "(project_id integer, title text, description text, status text, "
+                "deadline timestamp, created_at timestamp) ON COMMIT DROP"
+            )
+        )
+
+        buffer = io.StringIO()
+        for row in params:
+            buffer.write(
+                "\t".join(_copy_text_value(row[column]) for column in BULK_LOAD_COLUMNS)
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        dbapi_connection = self._session.connection().connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {STAGING_TABLE} ({columns}) FROM STDIN", buffer)
+
+        self._session.execute(
+            text(
+                f"INSERT INTO tasks ({columns}) "
+                f"SELECT {columns} FROM {STAGING_TABLE}"
+            )
+        )
+        self._session.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+
     def update(
         self,
         task_id: int,
@@ -77,6 +495,7 @@ class TaskRepository(BaseRepository):
         new_deadline: datetime | None,
     ) -> TaskORM:
         """Update an existing task."""
+        self._use_primary()
         task = self._session.get(TaskORM, task_id)
         if task is None:
             raise NotFoundError("Task", task_id)
@@ -85,24 +504,351 @@ class TaskRepository(BaseRepository):
         task.description = new_description
         task.deadline = new_deadline
 
-        self._session.commit()
-        self._session.refresh(task)
+        self._session.flush()
+        self._bump_project_versions([task.project_id])
+        if task.status != "done":
+            record_deadlines(self._session, [new_deadline])
         return task
 
     def delete(self, task_id: int) -> None:
+        self._use_primary()
         task = self._session.get(TaskORM, task_id)
         if task is None:
             raise NotFoundError("Task", task_id)
 
+        self._adjust_project_counters(
+            {task.project_id: Counter({task.status: -1})}
+        )
         self._session.delete(task)
-        self._session.commit()
+        self._session.flush()
+
+    def update_in_project(
+        self,
+        project_id: int,
+        task_id: int,
+        values: Mapping[str, Any],
+    ) -> TaskView:
+        """
+        Apply `values` to a task of a project with one UPDATE ... RETURNING.
+
+        The row is matched by id and project id, so a task of another
+        project raises NotFoundError like a missing one. A status change
+        first reads and locks the current status so the project counters
+        can be adjusted; the project's version is bumped either way.
+        """
+        self._use_primary()
+        scope = (TaskORM.id == task_id, TaskORM.project_id == project_id)
+
+        old_status = None
+        if "status" in values:
+            status_stmt = select(TaskORM.status).where(*scope).with_for_update()
+            old_status = self._session.execute(status_stmt).scalar_one_or_none()
+            if old_status is None:
+                raise NotFoundError("Task", task_id)
+
+        stmt = (
+            update(TaskORM)
+            .where(*scope)
+            .values(**values)
+            .returning(*TASK_VIEW_COLUMNS)
+        )
+        row = self._session.execute(stmt).first()
+        if row is None:
+            raise NotFoundError("Task", task_id)
+
+        if old_status is not None and old_status != values["status"]:
+            self._adjust_project_counters(
+                {project_id: Counter({old_status: -1, values["status"]: 1})}
+            )
+        else:
+            self._bump_project_versions([project_id])
+
+        task = TaskView(*row)
+        if task.status != "done":
+            record_deadlines(self._session, [task.deadline])
+        return task
+
+    def delete_in_project(self, project_id: int, task_id: int) -> None:
+        """
+        Delete a task of a project with one DELETE ... RETURNING its status.
+
+        Raises NotFoundError unless the task exists in that project.
+        """
+        self._use_primary()
+        stmt = (
+            delete(TaskORM)
+            .where(TaskORM.id == task_id, TaskORM.project_id == project_id)
+            .returning(TaskORM.status)
+        )
+        old_status = self._session.execute(stmt).scalar_one_or_none()
+        if old_status is None:
+            raise NotFoundError("Task", task_id)
+
+        self._adjust_project_counters({project_id: Counter({old_status: -1})})
+
+    def delete_project_chunk(self, project_id: int, limit: int) -> int:
+        """
+        Delete up to `limit` tasks of a project, lowest ids first.
+
+        One DELETE ... RETURNING status and one counter update, so the
+        project stays consistent between chunks. Returns the number of
+        deleted tasks; 0 means none are left.
+        """
+        self._use_primary()
+        chunk_ids = (
+            select(TaskORM.id)
+            .where(TaskORM.project_id == project_id)
+            .order_by(TaskORM.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(TaskORM)
+            .where(TaskORM.id.in_(chunk_ids))
+            .returning(TaskORM.status)
+            .execution_options(synchronize_session=False)
+        )
+        statuses = Counter(self._session.execute(stmt).scalars())
+        if statuses:
+            delta = Counter({status: -count for status, count in statuses.items()})
+            self._adjust_project_counters({project_id: delta})
+        return sum(statuses.values())
+
+    def close_overdue_chunk(
+        self,
+        now: datetime,
+        limit: int,
+        skip_locked: bool = False,
+    ) -> List[int]:
+        """
+        Set status 'done' on up to `limit` overdue open tasks, oldest first.
+
+        One SELECT of the candidates, one UPDATE ... RETURNING and one
+        executemany of project counter deltas. Returns the closed ids; an
+        empty list means the backlog is drained.
+
+        With `skip_locked` the candidates are claimed with SELECT ... FOR
+        UPDATE SKIP LOCKED, so concurrent workers each close a different
+        chunk instead of waiting on one another. SQLite has no row locks
+        and ignores it.
+        """
+        closed = self.close_overdue_chunk_deadlines(now, limit, skip_locked)
+        return [task_id for task_id, _ in closed]
+
+    def close_overdue_chunk_deadlines(
+        self,
+        now: datetime,
+        limit: int,
+        skip_locked: bool = False,
+    ) -> List[Tuple[int, datetime]]:
+        """Like `close_overdue_chunk`, but return (id, deadline) of each closed task."""
+        self._use_primary()
+        chunk_stmt = self._overdue_chunk_stmt(now, limit, skip_locked)
+        chunk = self._session.execute(chunk_stmt).all()
+        if not chunk:
+            return []
+
+        stmt = (
+            update(TaskORM)
+            .where(TaskORM.id.in_([row.id for row in chunk]))
+            .where(text(OPEN_TASK_PREDICATE))
+            .values(status="done")
+            .returning(TaskORM.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated_ids = set(self._session.execute(stmt).scalars())
+        closed = [row for row in chunk if row.id in updated_ids]
+
+        deltas: dict[int, Counter] = defaultdict(Counter)
+        for row in closed:
+            deltas[row.project_id][row.status] -= 1
+            deltas[row.project_id]["done"] += 1
+        self._adjust_project_counters(deltas)
+
+        return [(row.id, row.deadline) for row in closed]
+
+    @staticmethod
+    def _overdue_chunk_stmt(now: datetime, limit: int, skip_locked: bool) -> Select:
+        stmt = (
+            select(TaskORM.id, TaskORM.project_id, TaskORM.status, TaskORM.deadline)
+            .where(TaskORM.deadline < now)
+            .where(text(OPEN_TASK_PREDICATE))
+            .order_by(TaskORM.deadline)
+            .limit(limit)
+        )
+        if skip_locked:
+            stmt = stmt.with_for_update(skip_locked=True)
+        return stmt
+
+    def close_overdue(self, now: datetime, batch_size: int = 1000) -> List[int]:
+        """
+        Set status 'done' on all overdue open tasks and return their ids.
+
+        Works through the backlog in chunks of `batch_size` within the
+        current transaction. Jobs that want to commit per chunk call
+        `close_overdue_chunk` from their own unit of work instead.
+        """
+        closed_ids: List[int] = []
+        while True:
+            ids = self.close_overdue_chunk(now, batch_size)
+            if not ids:
+                return closed_ids
+            closed_ids.extend(ids)
 
     def update_status(self, task_id: int, new_status: str) -> TaskORM:
+        self._use_primary()
         task = self._session.get(TaskORM, task_id)
         if task is None:
             raise NotFoundError("Task", task_id)
 
-        task.status = new_status
-        self._session.commit()
-        self._session.refresh(task)
+        if task.status != new_status:
+            self._adjust_project_counters(
+                {task.project_id: Counter({task.status: -1, new_status: 1})}
+            )
+            task.status = new_status
+
+        self._session.flush()
+        if new_status != "done":
+            record_deadlines(self._session, [task.deadline])
         return task
+
+    def update_status_many(
+        self,
+        project_id: int,
+        task_ids: Sequence[int],
+        new_status: str,
+    ) -> List[TaskORM]:
+        """
+        Set `new_status` on the given tasks of one project in one UPDATE.
+
+        Ids that do not exist or belong to another project are ignored.
+        The current statuses are read first (locking the rows where the
+        database supports it) so the project counters can be adjusted.
+        Returns the matching tasks ordered by id.
+        """
+        self._use_primary()
+        if not task_ids:
+            return []
+
+        scope = (TaskORM.project_id == project_id, TaskORM.id.in_(task_ids))
+
+        current_stmt = (
+            select(TaskORM.status)
+            .where(*scope)
+            .where(TaskORM.status != new_status)
+            .with_for_update()
+        )
+        delta: Counter = Counter()
+        for old_status in self._session.execute(current_stmt).scalars():
+            delta[old_status] -= 1
+            delta[new_status] += 1
+
+        stmt = (
+            update(TaskORM)
+            .where(*scope)
+            .values(status=new_status)
+            .returning(TaskORM)
+            .execution_options(synchronize_session="fetch")
+        )
+        tasks = list(self._session.scalars(stmt))
+        self._adjust_project_counters({project_id: delta})
+        if new_status != "done":
+            record_deadlines(self._session, (task.deadline for task in tasks))
+        return sorted(tasks, key=lambda task: task.id)
+
+    # --- Project counter maintenance ---
+
+    def _reserve_task_slots(
+        self,
+        project_id: int,
+        count: int,
+        max_tasks: int | None,
+    ) -> None:
+        """
+        Count `count` new 'todo' tasks on a project in one conditional UPDATE.
+
+        Raises NotFoundError if the project does not exist and
+        LimitExceededError if the new total would exceed `max_tasks`.
+        """
+        stmt = (
+            update(ProjectORM)
+            .where(ProjectORM.id == project_id)
+            .values(
+                task_count=ProjectORM.task_count + count,
+                todo_count=ProjectORM.todo_count + count,
+                version=ProjectORM.version + 1,
+            )
+            .returning(ProjectORM.id)
+            .execution_options(synchronize_session=False)
+        )
+        if max_tasks is not None:
+            stmt = stmt.where(ProjectORM.task_count + count <= max_tasks)
+
+        if self._session.execute(stmt).first() is None:
+            if self._session.get(ProjectORM, project_id) is None:
+                raise NotFoundError("Project", project_id)
+            raise LimitExceededError(
+                f"Maximum limit of {max_tasks} tasks per project reached."
+            )
+        self._expire_project_counters([project_id])
+
+    def _adjust_project_counters(self, deltas: Mapping[int, Counter]) -> None:
+        """
+        Apply per-project status count deltas with a single executemany.
+
+        `deltas` maps project id to a Counter of status -> change; the total
+        task_count changes by the sum of the status changes. Each changed
+        project's version is bumped in the same statement.
+        """
+        params = [
+            {
+                "b_project_id": project_id,
+                "b_total": sum(delta.values()),
+                **{
+                    f"b_{column}": delta.get(status, 0)
+                    for status, column in STATUS_COUNTER_COLUMNS.items()
+                },
+            }
+            for project_id, delta in deltas.items()
+            if any(delta.values())
+        ]
+        if not params:
+            return
+
+        projects = ProjectORM.__table__
+        stmt = (
+            update(projects)
+            .where(projects.c.id == bindparam("b_project_id"))
+            .values(
+                task_count=projects.c.task_count + bindparam("b_total"),
+                version=projects.c.version + 1,
+                **{
+                    column: projects.c[column] + bindparam(f"b_{column}")
+                    for column in STATUS_COUNTER_COLUMNS.values()
+                },
+            )
+        )
+        self._session.execute(stmt, params)
+        self._expire_project_counters(deltas.keys())
+
+    def _bump_project_versions(self, project_ids: Iterable[int]) -> None:
+        """Bump the version of projects whose tasks changed without a counter delta."""
+        project_ids = list(project_ids)
+        stmt = (
+            update(ProjectORM)
+            .where(ProjectORM.id.in_(project_ids))
+            .values(version=ProjectORM.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.execute(stmt)
+        self._expire_project_counters(project_ids)
+
+    def _expire_project_counters(self, project_ids: Iterable[int]) -> None:
+        """Expire counters of already-loaded projects changed behind the ORM's back."""
+        attributes = ["task_count", *STATUS_COUNTER_COLUMNS.values(), "version"]
+        for project_id in project_ids:
+            project = self._session.identity_map.get(
+                self._session.identity_key(ProjectORM, project_id)
+            )
+            if project is not None:
+                self._session.expire(project, attributes)
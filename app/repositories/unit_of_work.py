@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.async_session import get_async_sessionmaker
+from app.db.session import SessionLocal
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+class UnitOfWork:
+    """
+    One transaction boundary for a request, CLI command or scheduler job.
+
+    Repositories only flush their changes; the unit of work commits once
+    when the block exits cleanly and rolls back if it raises:
+
+        with UnitOfWork() as uow:
+            project = uow.projects.create(name="Inbox", description="...")
+            uow.tasks.create(project.id, "First", "...")
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session = self._session_factory()
+        self.projects = ProjectRepository(session=self.session)
+        self.tasks = TaskRepository(session=self.session)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.session.close()
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+
+
+class AsyncUnitOfWork:
+    """
+    Asyncio counterpart of UnitOfWork, built on an AsyncSession:
+
+        async with AsyncUnitOfWork() as uow:
+            project = await uow.projects.create(name="Inbox", description="...")
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> None:
+        self._session_factory = session_factory or get_async_sessionmaker()
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        self.session = self._session_factory()
+        self.projects = AsyncProjectRepository(session=self.session)
+        self.tasks = AsyncTaskRepository(session=self.session)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import ProjectORM
+from app.repositories.pagination import Page
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import (
+    ProjectStatsView,
+    ProjectView,
+    TaskStatsTotalsView,
+)
+from app.services.project_service import ProjectService
+
+
+class AsyncProjectService:
+    """
+    Asyncio variant of ProjectService.
+
+    Each use-case runs ProjectService on the AsyncSession's sync session,
+    so validation and business rules are shared with the sync stack.
+    """
+
+    def __init__(self, session: AsyncSession, max_projects: int) -> None:
+        self._session = session
+        self._max_projects = max_projects
+
+    async def _run(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        def call(sync_session: Session) -> Any:
+            service = ProjectService(
+                project_repo=ProjectRepository(session=sync_session),
+                max_projects=self._max_projects,
+            )
+            return getattr(service, method_name)(*args, **kwargs)
+
+        return await self._session.run_sync(call)
+
+    async def create_project(self, name: str, description: str) -> ProjectORM:
+        return await self._run("create_project", name=name, description=description)
+
+    async def get_project(self, project_id: int) -> ProjectView:
+        return await self._run("get_project", project_id)
+
+    async def get_project_version(self, project_id: int) -> int:
+        return await self._run("get_project_version", project_id)
+
+    async def get_all_projects(self) -> List[ProjectORM]:
+        return await self._run("get_all_projects")
+
+    async def get_projects_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectORM]:
+        return await self._run("get_projects_page", limit=limit, after_id=after_id)
+
+    async def get_projects_view_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectView]:
+        return await self._run(
+            "get_projects_view_page", limit=limit, after_id=after_id
+        )
+
+    async def get_projects_stats_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectStatsView]:
+        return await self._run(
+            "get_projects_stats_page", limit=limit, after_id=after_id
+        )
+
+    async def get_stats_totals(self) -> TaskStatsTotalsView:
+        return await self._run("get_stats_totals")
+
+    async def get_project_stats(self, project_id: int) -> ProjectStatsView:
+        return await self._run("get_project_stats", project_id)
+
+    async def delete_project(self, project_id: int) -> None:
+        await self._run("delete_project", project_id)
+
+    async def edit_project(
+        self,
+        project_id: int,
+        new_name: str,
+        new_description: str,
+    ) -> ProjectORM:
+        return await self._run(
+            "edit_project",
+            project_id=project_id,
+            new_name=new_name,
+            new_description=new_description,
+        )
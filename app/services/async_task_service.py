@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import TaskORM
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import TaskView
+from app.repositories.task_repository import TaskRepository
+from app.services.task_service import BatchCreateResult, NewTask, TaskService
+
+
+class AsyncTaskService:
+    """
+    Asyncio variant of TaskService.
+
+    Each use-case runs TaskService on the AsyncSession's sync session, so
+    validation and business rules are shared with the sync stack.
+    """
+
+    def __init__(self, session: AsyncSession, max_tasks_per_project: int) -> None:
+        self._session = session
+        self._max_tasks_per_project = max_tasks_per_project
+
+    async def _run(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        def call(sync_session: Session) -> Any:
+            service = TaskService(
+                task_repo=TaskRepository(session=sync_session),
+                project_repo=ProjectRepository(session=sync_session),
+                max_tasks_per_project=self._max_tasks_per_project,
+            )
+            return getattr(service, method_name)(*args, **kwargs)
+
+        return await self._session.run_sync(call)
+
+    async def create_task(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline: Optional[datetime],
+    ) -> TaskORM:
+        return await self._run(
+            "create_task",
+            project_id=project_id,
+            title=title,
+            description=description,
+            deadline=deadline,
+        )
+
+    async def add_task_to_project(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline_str: Optional[str],
+    ) -> TaskORM:
+        return await self._run(
+            "add_task_to_project",
+            project_id=project_id,
+            title=title,
+            description=description,
+            deadline_str=deadline_str,
+        )
+
+    async def create_tasks_batch(
+        self,
+        project_id: int,
+        items: Sequence[NewTask],
+        partial: bool = False,
+    ) -> BatchCreateResult:
+        return await self._run(
+            "create_tasks_batch",
+            project_id=project_id,
+            items=items,
+            partial=partial,
+        )
+
+    async def get_project_tasks(self, project_id: int) -> List[TaskORM]:
+        return await self._run("get_project_tasks", project_id)
+
+    async def delete_task(self, task_id: int) -> None:
+        await self._run("delete_task", task_id)
+
+    async def edit_task(
+        self,
+        task_id: int,
+        new_title: str,
+        new_description: str,
+        new_deadline_str: Optional[str],
+    ) -> TaskORM:
+        return await self._run(
+            "edit_task",
+            task_id=task_id,
+            new_title=new_title,
+            new_description=new_description,
+            new_deadline_str=new_deadline_str,
+        )
+
+    async def patch_project_task(
+        self,
+        project_id: int,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> TaskView:
+        return await self._run(
+            "patch_project_task",
+            project_id,
+            task_id,
+            title=title,
+            description=description,
+            deadline=deadline,
+            status=status,
+        )
+
+    async def delete_project_task(self, project_id: int, task_id: int) -> None:
+        await self._run("delete_project_task", project_id, task_id)
+
+    async def change_task_status(self, task_id: int, new_status: str) -> TaskORM:
+        return await self._run("change_task_status", task_id, new_status)
+
+    async def change_status_many(
+        self,
+        task_ids: Sequence[int],
+        new_status: str,
+        project_id: int,
+    ) -> List[TaskORM]:
+        return await self._run(
+            "change_status_many",
+            task_ids=task_ids,
+            new_status=new_status,
+            project_id=project_id,
+        )
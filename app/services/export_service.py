@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to JSON")
+
+
+def _ndjson_chunk(record_type: str, rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """Encode one batch of rows as NDJSON lines tagged with their record type."""
+    lines = (
+        json.dumps({"type": record_type, **row}, default=_json_default)
+        for row in rows
+    )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into one gzip stream, chunk by chunk."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class ExportService:
+    """
+    Application service for the full data export.
+
+    The export is NDJSON: one `{"type": "project", ...}` line per project,
+    then one `{"type": "task", ...}` line per task ordered by project. Rows
+    are read in batches and every batch becomes one chunk, so memory use
+    depends on the batch size, not on the size of the tables.
+    """
+
+    def __init__(
+        self,
+        project_repo: ProjectRepository,
+        task_repo: TaskRepository,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> None:
+        self._project_repo = project_repo
+        self._task_repo = task_repo
+        self._batch_size = batch_size
+
+    def iter_ndjson(self) -> Iterator[bytes]:
+        """Yield the export as NDJSON chunks of up to `batch_size` lines."""
+        for batch in self._project_repo.iter_batches(self._batch_size):
+            yield _ndjson_chunk("project", batch)
+        for batch in self._task_repo.iter_batches(self._batch_size):
+            yield _ndjson_chunk("task", batch)
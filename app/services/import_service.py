@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.exceptions import ValidationError
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.project_service import validate_project_fields
+from app.services.task_service import ALLOWED_STATUSES, validate_task_fields
+
+# One input record and the line it was read from; anything but a mapping
+# (e.g. an undecodable line) is reported as invalid
+ImportRecord = Tuple[int, Any]
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _deadline_str(value: Any) -> Optional[str]:
+    """
+    Reduce a deadline to the `YYYY-MM-DD` form the task rules expect.
+
+    Full ISO timestamps, as written by the export, keep their date part
+    like API deadlines do; anything else is left for validation to reject.
+    """
+    if not value:
+        return None
+    value = str(value)
+    if len(value) > 10:
+        try:
+            return datetime.fromisoformat(value).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    return value
+
+
+def _created_at(value: Any) -> Optional[datetime]:
+    """Parse an ISO creation timestamp, as written by the export; empty means now."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValidationError(f"Invalid created_at '{value}'.") from None
+
+
+@dataclass(frozen=True)
+class ImportRecordError:
+    """Why the record on `line` was rejected."""
+    line: int
+    message: str
+
+
+@dataclass
+class ImportChunkResult:
+    """Outcome of `ImportService.import_chunk`."""
+    projects: int = 0
+    tasks: int = 0
+    errors: List[ImportRecordError] = field(default_factory=list)
+
+
+class ImportService:
+    """
+    Application service for bulk imports of projects and tasks.
+
+    Records are validated with the same rules as ProjectService and
+    TaskService and loaded a chunk at a time: the projects of a chunk with
+    one lookup and one multi-row INSERT, its tasks with one bulk load.
+
+    A record is a project (`{"type": "project", "name", "description"}`)
+    or a task (`type` "task" or absent) naming its project by `project`,
+    or by `project_id` when that is the `id` of an earlier project record,
+    as in the NDJSON export. Projects named by a task are created if they
+    don't exist. `source_projects` carries those ids across chunks.
+    """
+
+    def __init__(
+        self,
+        project_repo: ProjectRepository,
+        task_repo: TaskRepository,
+        source_projects: Optional[Dict[Any, str]] = None,
+    ) -> None:
+        self._project_repo = project_repo
+        self._task_repo = task_repo
+        self._source_projects = {} if source_projects is None else source_projects
+
+    def import_chunk(self, records: Sequence[ImportRecord]) -> ImportChunkResult:
+        """Validate and load one chunk; invalid records are reported, not loaded."""
+        result = ImportChunkResult()
+        projects: Dict[str, str] = {}
+        tasks: List[Dict[str, Any]] = []
+
+        for line, record in records:
+            try:
+                if not isinstance(record, Mapping):
+                    raise ValidationError("Record must be a JSON object.")
+                record_type = record.get("type") or "task"
+                if record_type == "project":
+                    name, description = validate_project_fields(
+                        _text(record.get("name")), _text(record.get("description"))
+                    )
+                    projects[name] = description
+                    if record.get("id") is not None:
+                        self._source_projects[record["id"]] = name
+                    result.projects += 1
+                elif record_type == "task":
+                    tasks.append(self._validate_task(record, projects))
+                else:
+                    raise ValidationError(f"Unknown record type '{record_type}'.")
+            except ValidationError as exc:
+                result.errors.append(ImportRecordError(line=line, message=str(exc)))
+
+        project_ids = self._project_repo.ensure_names(projects)
+        for task in tasks:
+            task["project_id"] = project_ids[task.pop("project")]
+        result.tasks = self._task_repo.bulk_load(tasks)
+        return result
+
+    def _validate_task(
+        self,
+        record: Mapping[str, Any],
+        projects: Dict[str, str],
+    ) -> Dict[str, Any]:
+        project = record.get("project")
+        if project is None:
+            project = self._source_projects.get(record.get("project_id"))
+        if project is None:
+            raise ValidationError("Task does not reference a known project.")
+        project, _ = validate_project_fields(_text(project), "")
+
+        title, description, deadline = validate_task_fields(
+            _text(record.get("title")),
+            _text(record.get("description")),
+            _deadline_str(record.get("deadline")),
+        )
+
+        status = record.get("status") or "todo"
+        if status not in ALLOWED_STATUSES:
+            raise ValidationError(
+                f"Invalid status '{status}'. Must be one of {ALLOWED_STATUSES}."
+            )
+
+        created_at = _created_at(record.get("created_at"))
+
+        # Only an accepted task may bring its project into the chunk.
+        projects.setdefault(project, "")
+        return {
+            "project": project,
+            "title": title,
+            "description": description,
+            "deadline": deadline,
+            "status": status,
+            "created_at": created_at,
+        }
@@ -1,20 +1,52 @@
 from __future__ import annotations
 
-from typing import List
+from datetime import datetime
+from typing import List, Tuple
 
 from app.exceptions import (
     ValidationError,
     BusinessRuleViolation,
+    LimitExceededError,
     NotFoundError,
     UniqueConstraintError,
 )
 from app.models import ProjectORM
+from app.repositories.pagination import Page
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import (
+    ProjectStatsView,
+    ProjectView,
+    TaskStatsTotalsView,
+)
 
 MAX_PROJECT_NAME_LENGTH = 30
 MAX_PROJECT_DESCRIPTION_LENGTH = 150
 
 
+def validate_project_fields(name: str, description: str) -> Tuple[str, str]:
+    """
+    Apply the project field rules and return the cleaned values.
+
+    Names and descriptions are stripped and length-checked.
+    Raises ValidationError on the first rule that fails.
+    """
+    name = name.strip()
+    description = description.strip()
+
+    if not name:
+        raise ValidationError("Project name cannot be empty.")
+    if len(name) > MAX_PROJECT_NAME_LENGTH:
+        raise ValidationError(
+            f"Project name cannot exceed {MAX_PROJECT_NAME_LENGTH} characters."
+        )
+    if len(description) > MAX_PROJECT_DESCRIPTION_LENGTH:
+        raise ValidationError(
+            f"Project description cannot exceed {MAX_PROJECT_DESCRIPTION_LENGTH} characters."
+        )
+
+    return name, description
+
+
 class ProjectService:
     """Application service for project-related use-cases."""
 
@@ -24,38 +56,79 @@ class ProjectService:
 
     def create_project(self, name: str, description: str) -> ProjectORM:
         """Create a new project after applying business rules and validation."""
-        name = name.strip()
-        description = description.strip()
-
-        if not name:
-            raise ValidationError("Project name cannot be empty.")
-        if len(name) > MAX_PROJECT_NAME_LENGTH:
-            raise ValidationError(
-                f"Project name cannot exceed {MAX_PROJECT_NAME_LENGTH} characters."
-            )
-        if len(description) > MAX_PROJECT_DESCRIPTION_LENGTH:
-            raise ValidationError(
-                f"Project description cannot exceed {MAX_PROJECT_DESCRIPTION_LENGTH} characters."
-            )
+        name, description = validate_project_fields(name, description)
 
-        projects = self._project_repo.list_all()
-        if len(projects) >= self._max_projects:
+        # The repository checks the limit and inserts in one statement.
+        try:
+            return self._project_repo.create(
+                name=name,
+                description=description,
+                max_projects=self._max_projects,
+            )
+        except LimitExceededError as exc:
             raise BusinessRuleViolation(
                 f"Cannot create new project. Maximum limit of {self._max_projects} projects reached."
-            )
-
-        try:
-            return self._project_repo.create(name=name, description=description)
+            ) from exc
         except UniqueConstraintError as exc:
             # Re-raise as validation-level error for the caller
             raise ValidationError(str(exc)) from exc
 
+    def get_project(self, project_id: int) -> ProjectView:
+        """Return a project's read model; raises NotFoundError if it doesn't exist."""
+        return self._project_repo.get_view(project_id)
+
+    def get_project_version(self, project_id: int) -> int:
+        """Return the project's version stamp, bumped on every change to it or its tasks."""
+        return self._project_repo.get_version(project_id)
+
     def get_all_projects(self) -> List[ProjectORM]:
         """Return all projects ordered by id."""
         return self._project_repo.list_all()
 
+    def get_projects_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectORM]:
+        """Return one page of projects ordered by id."""
+        return self._project_repo.list_all_page(limit=limit, after_id=after_id)
+
+    def get_projects_view_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+    ) -> Page[ProjectView]:
+        """Return one page of project read models ordered by id."""
+        return self._project_repo.list_all_view_page(limit=limit, after_id=after_id)
+
+    def get_projects_stats_page(
+        self,
+        limit: int,
+        after_id: int | None = None,
+        now: datetime | None = None,
+    ) -> Page[ProjectStatsView]:
+        """Return the task statistics of one page of projects ordered by id."""
+        return self._project_repo.stats_page(
+            now or datetime.utcnow(), limit=limit, after_id=after_id
+        )
+
+    def get_stats_totals(self, now: datetime | None = None) -> TaskStatsTotalsView:
+        """Return the task statistics summed over all projects."""
+        return self._project_repo.stats_totals(now or datetime.utcnow())
+
+    def get_project_stats(
+        self,
+        project_id: int,
+        now: datetime | None = None,
+    ) -> ProjectStatsView:
+        """Return a project's task statistics; raises NotFoundError if it doesn't exist."""
+        rows = self._project_repo.stats(now or datetime.utcnow(), project_id=project_id)
+        if not rows:
+            raise NotFoundError("Project", project_id)
+        return rows[0]
+
     def delete_project(self, project_id: int) -> None:
-        """Delete a project by id. Tasks will be deleted by cascade."""
+        """Delete a project by id. Its tasks are deleted by the database's cascade."""
         try:
             self._project_repo.delete(project_id)
         except NotFoundError as exc:
@@ -69,19 +142,7 @@ class ProjectService:
         new_description: str,
     ) -> ProjectORM:
         """Edit an existing project after validation."""
-        new_name = new_name.strip()
-        new_description = new_description.strip()
-
-        if not new_name:
-            raise ValidationError("Project name cannot be empty.")
-        if len(new_name) > MAX_PROJECT_NAME_LENGTH:
-            raise ValidationError(
-                f"Project name cannot exceed {MAX_PROJECT_NAME_LENGTH} characters."
-            )
-        if len(new_description) > MAX_PROJECT_DESCRIPTION_LENGTH:
-            raise ValidationError(
-                f"Project description cannot exceed {MAX_PROJECT_DESCRIPTION_LENGTH} characters."
-            )
+        new_name, new_description = validate_project_fields(new_name, new_description)
 
         try:
             return self._project_repo.update(
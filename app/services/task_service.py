@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.exceptions import (
     ValidationError,
     NotFoundError,
     BusinessRuleViolation,
+    LimitExceededError,
     AppError,
 )
 from app.models import TaskORM
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import TaskView
 from app.repositories.task_repository import TaskRepository
 
 MAX_TASK_TITLE_LENGTH = 30
@@ -18,6 +22,92 @@ MAX_TASK_DESCRIPTION_LENGTH = 150
 ALLOWED_STATUSES = ("todo", "doing", "done")
 
 
+def _deadline_to_str(deadline: Optional[datetime]) -> Optional[str]:
+    """Keep only the calendar date part of an API deadline, e.g. "2025-12-09"."""
+    if deadline is None:
+        return None
+    return deadline.strftime("%Y-%m-%d")
+
+
+def _clean_title(title: str) -> str:
+    title = title.strip()
+    if not title:
+        raise ValidationError("Task title cannot be empty.")
+    if len(title) > MAX_TASK_TITLE_LENGTH:
+        raise ValidationError(
+            f"Task title cannot exceed {MAX_TASK_TITLE_LENGTH} characters."
+        )
+    return title
+
+
+def _clean_description(description: str) -> str:
+    description = description.strip()
+    if len(description) > MAX_TASK_DESCRIPTION_LENGTH:
+        raise ValidationError(
+            f"Task description cannot exceed {MAX_TASK_DESCRIPTION_LENGTH} characters."
+        )
+    return description
+
+
+def _parse_deadline(deadline_str: Optional[str]) -> Optional[datetime]:
+    if not deadline_str:
+        return None
+    try:
+        return datetime.strptime(deadline_str, "%Y-%m-%d")
+    except ValueError as exc:
+        raise ValidationError(
+            "Invalid deadline format. Please use YYYY-MM-DD."
+        ) from exc
+
+
+def _check_status(status: str) -> None:
+    if status not in ALLOWED_STATUSES:
+        raise ValidationError(
+            f"Invalid status '{status}'. Must be one of {ALLOWED_STATUSES}."
+        )
+
+
+def validate_task_fields(
+    title: str,
+    description: str,
+    deadline_str: Optional[str],
+) -> Tuple[str, str, Optional[datetime]]:
+    """
+    Apply the task field rules and return the cleaned values.
+
+    Titles and descriptions are stripped and length-checked, and the
+    deadline must use the `YYYY-MM-DD` format.
+    Raises ValidationError on the first rule that fails.
+    """
+    return (
+        _clean_title(title),
+        _clean_description(description),
+        _parse_deadline(deadline_str),
+    )
+
+
+@dataclass(frozen=True)
+class NewTask:
+    """One task of a batch create request, as received from the API."""
+    title: str
+    description: str
+    deadline: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class BatchItemError:
+    """Why the item at `index` of a batch was rejected."""
+    index: int
+    message: str
+
+
+@dataclass
+class BatchCreateResult:
+    """Outcome of `TaskService.create_tasks_batch`."""
+    created: List[TaskORM] = field(default_factory=list)
+    errors: List[BatchItemError] = field(default_factory=list)
+
+
 class TaskService:
     def __init__(
         self,
@@ -46,17 +136,11 @@ class TaskService:
         This method converts it to the `YYYY-MM-DD` string format expected
         by `add_task_to_project` and delegates the actual business logic.
         """
-        if deadline is None:
-            deadline_str: Optional[str] = None
-        else:
-            # Keep only the calendar date part, e.g. "2025-12-09".
-            deadline_str = deadline.strftime("%Y-%m-%d")
-
         return self.add_task_to_project(
             project_id=project_id,
             title=title,
             description=description,
-            deadline_str=deadline_str,
+            deadline_str=_deadline_to_str(deadline),
         )
 
     def add_task_to_project(
@@ -70,50 +154,79 @@ class TaskService:
         Add a new task to a project after enforcing all business rules.
         """
         # Ensure the project exists (avoid failing later at the DB level).
-        try:
-            self._project_repo.get_by_id(project_id)
-        except NotFoundError as exc:
-            raise ValidationError(
-                f"Project with id {project_id} does not exist."
-            ) from exc
+        if not self._project_repo.exists(project_id):
+            raise ValidationError(f"Project with id {project_id} does not exist.")
 
-        # Enforce maximum number of tasks per project.
-        tasks = self._task_repo.list_by_project(project_id)
-        if len(tasks) >= self._max_tasks_per_project:
+        title, description, parsed_deadline = validate_task_fields(
+            title, description, deadline_str
+        )
+
+        # Enforce maximum number of tasks per project. The repository checks
+        # the project's task counter and reserves the slot atomically.
+        try:
+            return self._task_repo.create(
+                project_id=project_id,
+                title=title,
+                description=description,
+                deadline=parsed_deadline,
+                max_tasks=self._max_tasks_per_project,
+            )
+        except LimitExceededError as exc:
             raise BusinessRuleViolation(
                 "Cannot add new task. "
                 f"Maximum limit of {self._max_tasks_per_project} tasks per project reached."
-            )
+            ) from exc
 
-        title = title.strip()
-        description = description.strip()
+    def create_tasks_batch(
+        self,
+        project_id: int,
+        items: Sequence[NewTask],
+        partial: bool = False,
+    ) -> BatchCreateResult:
+        """
+        Create many tasks in one project with multi-row INSERTs.
 
-        if not title:
-            raise ValidationError("Task title cannot be empty.")
-        if len(title) > MAX_TASK_TITLE_LENGTH:
-            raise ValidationError(
-                f"Task title cannot exceed {MAX_TASK_TITLE_LENGTH} characters."
-            )
-        if len(description) > MAX_TASK_DESCRIPTION_LENGTH:
-            raise ValidationError(
-                f"Task description cannot exceed {MAX_TASK_DESCRIPTION_LENGTH} characters."
-            )
+        Every item is validated with the same rules as `add_task_to_project`
+        and the task quota is checked once for the whole batch.
 
-        parsed_deadline: Optional[datetime] = None
-        if deadline_str:
+        In all-or-nothing mode (the default) nothing is created if any item
+        is invalid; the result then only carries the per-item errors. In
+        partial mode the valid items are created and the invalid ones are
+        reported. Either way, exceeding the quota rejects the whole batch.
+        """
+        if not self._project_repo.exists(project_id):
+            raise ValidationError(f"Project with id {project_id} does not exist.")
+
+        result = BatchCreateResult()
+        rows = []
+        for index, item in enumerate(items):
             try:
-                parsed_deadline = datetime.strptime(deadline_str, "%Y-%m-%d")
-            except ValueError as exc:
-                raise ValidationError(
-                    "Invalid deadline format. Please use YYYY-MM-DD."
-                ) from exc
+                title, description, deadline = validate_task_fields(
+                    item.title, item.description, _deadline_to_str(item.deadline)
+                )
+            except ValidationError as exc:
+                result.errors.append(BatchItemError(index=index, message=str(exc)))
+                continue
+            rows.append(
+                {"title": title, "description": description, "deadline": deadline}
+            )
 
-        return self._task_repo.create(
-            project_id=project_id,
-            title=title,
-            description=description,
-            deadline=parsed_deadline,
-        )
+        if (result.errors and not partial) or not rows:
+            return result
+
+        try:
+            result.created = self._task_repo.create_many(
+                project_id=project_id,
+                rows=rows,
+                max_tasks=self._max_tasks_per_project,
+            )
+        except LimitExceededError as exc:
+            raise BusinessRuleViolation(
+                f"Cannot add {len(rows)} new tasks. "
+                f"Maximum limit of {self._max_tasks_per_project} tasks per project reached."
+            ) from exc
+
+        return result
 
     def get_project_tasks(self, project_id: int) -> List[TaskORM]:
         """
@@ -142,28 +255,9 @@ class TaskService:
         Update title / description / deadline of an existing task
         after validating the new values.
         """
-        new_title = new_title.strip()
-        new_description = new_description.strip()
-
-        if not new_title:
-            raise ValidationError("Task title cannot be empty.")
-        if len(new_title) > MAX_TASK_TITLE_LENGTH:
-            raise ValidationError(
-                f"Task title cannot exceed {MAX_TASK_TITLE_LENGTH} characters."
-            )
-        if len(new_description) > MAX_TASK_DESCRIPTION_LENGTH:
-            raise ValidationError(
-                f"Task description cannot exceed {MAX_TASK_DESCRIPTION_LENGTH} characters."
-            )
-
-        new_deadline: Optional[datetime] = None
-        if new_deadline_str:
-            try:
-                new_deadline = datetime.strptime(new_deadline_str, "%Y-%m-%d")
-            except ValueError as exc:
-                raise ValidationError(
-                    "Invalid deadline format. Please use YYYY-MM-DD."
-                ) from exc
+        new_title, new_description, new_deadline = validate_task_fields(
+            new_title, new_description, new_deadline_str
+        )
 
         return self._task_repo.update(
             task_id=task_id,
@@ -172,13 +266,74 @@ class TaskService:
             new_deadline=new_deadline,
         )
 
+    def patch_project_task(
+        self,
+        project_id: int,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> TaskView:
+        """
+        Apply a partial update to a task of a project.
+
+        Only the given fields are validated and written, in a single UPDATE
+        scoped to the project. Deadlines keep only their date, as in
+        `create_task`. Raises NotFoundError unless the task belongs to the
+        project, even when the new values are also invalid.
+        """
+        values = {}
+        try:
+            if title is not None:
+                values["title"] = _clean_title(title)
+            if description is not None:
+                values["description"] = _clean_description(description)
+            if deadline is not None:
+                values["deadline"] = _parse_deadline(_deadline_to_str(deadline))
+            if status is not None:
+                _check_status(status)
+                values["status"] = status
+        except ValidationError:
+            if not self._task_repo.exists_in_project(project_id, task_id):
+                raise NotFoundError("Task", task_id)
+            raise
+
+        if not values:
+            task = self._task_repo.get_view(task_id)
+            if task.project_id != project_id:
+                raise NotFoundError("Task", task_id)
+            return task
+
+        return self._task_repo.update_in_project(project_id, task_id, values)
+
+    def delete_project_task(self, project_id: int, task_id: int) -> None:
+        """Delete a task of a project; raises NotFoundError unless it belongs there."""
+        self._task_repo.delete_in_project(project_id, task_id)
+
     def change_task_status(self, task_id: int, new_status: str) -> TaskORM:
         """
         Change task status after validating that the new value is allowed.
         """
-        if new_status not in ALLOWED_STATUSES:
-            raise ValidationError(
-                f"Invalid status '{new_status}'. Must be one of {ALLOWED_STATUSES}."
-            )
+        _check_status(new_status)
+        return self._task_repo.update_status(task_id, new_status)
 
-        return self._task_repo.update_status(task_id, new_status)
\ No newline at end of file
+    def change_status_many(
+        self,
+        task_ids: Sequence[int],
+        new_status: str,
+        project_id: int,
+    ) -> List[TaskORM]:
+        """
+        Change the status of many tasks of one project at once.
+
+        The status is validated once and applied with a single UPDATE.
+        Tasks that do not exist in the project are skipped; the updated
+        tasks are returned ordered by id.
+        """
+        _check_status(new_status)
+        return self._task_repo.update_status_many(
+            project_id=project_id,
+            task_ids=sorted(set(task_ids)),
+            new_status=new_status,
+        )
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+Compare API throughput of the sync (threadpool) and async route handlers.
+
+Usage:
+    python -m benchmarks.bench_async_vs_sync [--clients 100,500,1000] [--url URL]
+
+Each concurrent client lists one project's tasks --requests times through
+httpx's in-process ASGI transport, so the numbers measure the app and the
+database driver, not the network. Pass a PostgreSQL URL to compare
+psycopg2 against asyncpg; the default is a throw-away SQLite file.
+
+Both engines get the same --pool-size. Keep it at least the size of the
+threadpool (40 by default): with a smaller pool, sync handlers queue for a
+connection inside their threads and the sync numbers measure pool waits
+rather than the driver.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from collections.abc import AsyncGenerator, Generator
+
+# The benchmark brings its own engines; don't touch the configured database.
+os.environ.setdefault("DB_POOL_WARMUP", "false")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.dependencies import get_async_session, get_session
+from app.api.main import create_app
+from app.db.async_session import to_async_url
+from app.models import ProjectORM, TaskORM
+from app.repositories.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from benchmarks.common import make_engine, timed
+
+
+def _seed(engine: Engine, tasks: int) -> int:
+    with Session(engine) as session:
+        project = ProjectORM(name="bench", description="benchmark project")
+        session.add(project)
+        session.flush()
+        session.add_all(
+            TaskORM(project_id=project.id, title=f"task {i}", description="")
+            for i in range(tasks)
+        )
+        session.commit()
+        return project.id
+
+
+def _sync_app(engine: Engine) -> FastAPI:
+    app = create_app(async_routes=False)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def override() -> Generator[Session, None, None]:
+        with UnitOfWork(factory) as uow:
+            yield uow.session
+
+    app.dependency_overrides[get_session] = override
+    return app
+
+
+def _async_app(factory: async_sessionmaker[AsyncSession]) -> FastAPI:
+    app = create_app(async_routes=True)
+
+    async def override() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncUnitOfWork(factory) as uow:
+            yield uow.session
+
+    app.dependency_overrides[get_async_session] = override
+    return app
+
+
+async def _run_clients(app: FastAPI, path: str, clients: int, requests: int) -> float:
+    """Return requests per second for `clients` concurrent clients."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def client() -> None:
+            for _ in range(requests):
+                response = await http.get(path)
+                response.raise_for_status()
+
+        with timed() as elapsed:
+            await asyncio.gather(*(client() for _ in range(clients)))
+    return clients * requests / elapsed[0]
+
+
+async def _main(args: argparse.Namespace) -> None:
+    pool = {"pool_size": args.pool_size, "max_overflow": 0, "pool_timeout": 300}
+    engine = make_engine(args.url, **pool)
+    project_id = _seed(engine, args.tasks)
+    path = f"/api/v1/projects/{project_id}/tasks?limit={args.tasks}"
+
+    async_engine = create_async_engine(
+        to_async_url(engine.url.render_as_string(hide_password=False)),
+        **pool,
+    )
+    sync_app = _sync_app(engine)
+    async_app = _async_app(async_sessionmaker(bind=async_engine, expire_on_commit=False))
+
+    print(f"{'clients':>8} {'sync (req/s)':>13} {'async (req/s)':>14} {'ratio':>7}")
+    for clients in (int(c) for c in args.clients.split(",")):
+        sync_rps = await _run_clients(sync_app, path, clients, args.requests)
+        async_rps = await _run_clients(async_app, path, clients, args.requests)
+        print(
+            f"{clients:>8} {sync_rps:>13.0f} {async_rps:>14.0f} "
+            f"{async_rps / sync_rps:>6.2f}x"
+        )
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", default="100,500,1000")
+    parser.add_argument("--requests", type=int, default=5, help="requests per client")
+    parser.add_argument("--tasks", type=int, default=20, help="tasks in the listed project")
+    parser.add_argument("--pool-size", type=int, default=40)
+    parser.add_argument("--url", default=None, help="database URL (default: temp SQLite)")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
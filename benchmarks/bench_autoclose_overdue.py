@@ -0,0 +1,101 @@
+"""
+Compare row-by-row auto-close with the set-based TaskRepository.close_overdue.
+
+Usage:
+    python -m benchmarks.bench_autoclose_overdue [--sizes 10000,100000] [--url URL]
+
+The row-by-row strategy commits once per task, so on a local SQLite file it
+needs minutes for 10k rows; sizes above --row-by-row-limit only run the
+set-based path.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import ProjectORM, TaskORM
+from app.repositories.task_repository import TaskRepository
+from benchmarks.common import make_engine, timed
+
+
+def _seed(session: Session, count: int, now: datetime) -> None:
+    project = ProjectORM(name="bench", description="benchmark project")
+    session.add(project)
+    session.flush()
+
+    deadline = now - timedelta(days=1)
+    rows = [
+        {
+            "project_id": project.id,
+            "title": f"task {i}",
+            "description": "overdue benchmark task",
+            "status": "todo",
+            "deadline": deadline,
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+    session.execute(insert(TaskORM), rows)
+    session.commit()
+
+
+def _close_row_by_row(session: Session, now: datetime) -> int:
+    """The previous strategy: one get + commit + refresh per overdue task."""
+    task_repo = TaskRepository(session=session)
+    overdue = task_repo.list_overdue_open_tasks(now)
+    for task in overdue:
+        loaded = session.get(TaskORM, task.id)
+        loaded.status = "done"
+        session.commit()
+        session.refresh(loaded)
+    return len(overdue)
+
+
+def _close_set_based(session: Session, now: datetime, batch_size: int) -> int:
+    task_repo = TaskRepository(session=session)
+    closed = len(task_repo.close_overdue(now, batch_size=batch_size))
+    session.commit()
+    return closed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--row-by-row-limit", type=int, default=10000)
+    parser.add_argument("--url", default=None, help="Database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    print(f"{'rows':>8} {'row-by-row (s)':>15} {'set-based (s)':>14} {'speedup':>8}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        engine = make_engine(args.url)
+        with Session(engine) as session:
+            _seed(session, size, now)
+        with Session(engine) as session, timed() as fast:
+            closed_fast = _close_set_based(session, now, args.batch_size)
+        assert closed_fast == size
+
+        if size > args.row_by_row_limit:
+            print(f"{size:>8} {'skipped':>15} {fast[0]:>14.2f} {'-':>8}")
+            continue
+
+        engine = make_engine(args.url)
+        with Session(engine) as session:
+            _seed(session, size, now)
+        with Session(engine) as session, timed() as slow:
+            closed_slow = _close_row_by_row(session, now)
+        assert closed_slow == size
+
+        print(
+            f"{size:>8} {slow[0]:>15.2f} {fast[0]:>14.2f} "
+            f"{slow[0] / fast[0]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
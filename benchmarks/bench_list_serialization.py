@@ -0,0 +1,96 @@
+"""
+Compare the TaskRead list path with the fast row + orjson path.
+
+Usage:
+    python -m benchmarks.bench_list_serialization [--sizes 1000,10000] [--url URL]
+
+Both paths load one page of a project's tasks and encode it as the JSON
+body of GET /projects/{id}/tasks. The TaskRead path loads ORM entities
+and does what FastAPI does for `response_model=TaskPage`: validate them
+from attributes, dump them and encode with the stdlib json module. The
+fast path selects TaskView read models and encodes them directly with
+orjson.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timedelta
+
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.api.fast_json import fields_of, page_content
+from app.api.schemas import TaskPage, TaskRead
+from app.models import ProjectORM, TaskORM
+from app.repositories.task_repository import TaskRepository
+from benchmarks.common import make_engine, timed
+
+
+def _seed(session: Session, count: int) -> int:
+    project = ProjectORM(name="bench", description="benchmark project")
+    session.add(project)
+    session.flush()
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "project_id": project.id,
+            "title": f"task {i}",
+            "description": "serialization benchmark task",
+            "status": "todo",
+            "deadline": now + timedelta(days=i % 30),
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+    session.execute(insert(TaskORM), rows)
+    session.commit()
+    return project.id
+
+
+def _taskread_path(session: Session, project_id: int, limit: int) -> bytes:
+    page = TaskRepository(session=session).list_by_project_page(project_id, limit)
+    model = TaskPage.model_validate({"items": page.items, "next_cursor": None})
+    return json.dumps(model.model_dump(mode="json")).encode("utf-8")
+
+
+def _fast_path(session: Session, project_id: int, limit: int) -> bytes:
+    page = TaskRepository(session=session).list_by_project_view_page(project_id, limit)
+    return orjson.dumps(page_content(page.items, fields_of(TaskRead), None))
+
+
+def _best_of(engine, path, project_id: int, limit: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session, timed() as elapsed:
+            path(session, project_id, limit)
+        best = min(best, elapsed[0])
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per path; best is kept")
+    parser.add_argument("--url", default=None, help="Database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'TaskRead (ms)':>14} {'fast (ms)':>10} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        engine = make_engine(args.url)
+        with Session(engine) as session:
+            project_id = _seed(session, size)
+
+        slow = _best_of(engine, _taskread_path, project_id, size, args.repeat)
+        fast = _best_of(engine, _fast_path, project_id, size, args.repeat)
+        print(
+            f"{size:>8} {slow * 1000:>14.1f} {fast * 1000:>10.1f} "
+            f"{slow / fast:>7.1f}x"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measure the per-request overhead of the metrics middleware.
+
+Usage:
+    python -m benchmarks.bench_metrics_overhead [--requests 2000] [--url URL]
+
+The same sync app is built with and without metrics and both serve GET
+/api/v1/projects/{id} (one statement) and a task list page --requests times
+through httpx's in-process ASGI transport. Runs alternate so drift affects
+both sides alike; the best of --rounds is reported.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from collections.abc import Generator
+
+# The benchmark brings its own engine; don't touch the configured database.
+os.environ.setdefault("DB_POOL_WARMUP", "false")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.dependencies import get_session
+from app.api.main import create_app
+from app.models import ProjectORM, TaskORM
+from app.repositories.unit_of_work import UnitOfWork
+from benchmarks.common import make_engine, timed
+
+
+def _seed(engine: Engine, tasks: int) -> int:
+    with Session(engine) as session:
+        project = ProjectORM(name="bench", description="benchmark project")
+        session.add(project)
+        session.flush()
+        session.add_all(
+            TaskORM(project_id=project.id, title=f"task {i}", description="")
+            for i in range(tasks)
+        )
+        session.commit()
+        return project.id
+
+
+def _app(engine: Engine, metrics: bool) -> FastAPI:
+    app = create_app(async_routes=False, metrics=metrics)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def override() -> Generator[Session, None, None]:
+        with UnitOfWork(factory) as uow:
+            yield uow.session
+
+    app.dependency_overrides[get_session] = override
+    return app
+
+
+async def _per_request_us(app: FastAPI, path: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        with timed() as elapsed:
+            for _ in range(requests):
+                response = await http.get(path)
+                response.raise_for_status()
+    return elapsed[0] / requests * 1e6
+
+
+async def _main(args: argparse.Namespace) -> None:
+    engine = make_engine(args.url)
+    project_id = _seed(engine, args.tasks)
+    apps = {False: _app(engine, metrics=False), True: _app(engine, metrics=True)}
+    paths = {
+        "get project": f"/api/v1/projects/{project_id}",
+        "list tasks": f"/api/v1/projects/{project_id}/tasks?limit={args.tasks}",
+    }
+
+    print(f"{'endpoint':>12} {'off (us)':>10} {'on (us)':>10} {'overhead':>10}")
+    for name, path in paths.items():
+        best = {False: float("inf"), True: float("inf")}
+        for _ in range(args.rounds):
+            for metrics, app in apps.items():
+                us = await _per_request_us(app, path, args.requests)
+                best[metrics] = min(best[metrics], us)
+        overhead = best[True] - best[False]
+        print(
+            f"{name:>12} {best[False]:>10.1f} {best[True]:>10.1f} "
+            f"{overhead:>+8.1f}us ({overhead / best[False]:+.1%})"
+        )
+
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=20, help="tasks in the listed project")
+    parser.add_argument("--url", default=None, help="database URL (default: temp SQLite)")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measure project delete latency against the number of tasks it has.
+
+Usage:
+    python -m benchmarks.bench_project_delete [--sizes 1000,10000,100000] [--url URL]
+
+Three strategies are timed on a freshly seeded project per run:
+
+- orm: the previous behaviour, loading every task and letting the ORM
+  issue one DELETE per task (skipped above --orm-limit);
+- cascade: ProjectRepository.delete, one DELETE left to ON DELETE CASCADE;
+- chunked: delete_project_in_chunks, one transaction per --batch-size
+  tasks; slower in total but no transaction locks the whole project.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.commands.delete_project import delete_project_in_chunks
+from app.models import ProjectORM, TaskORM
+from app.repositories.project_repository import ProjectRepository
+from benchmarks.common import make_engine, timed
+
+
+def _seed(session: Session, count: int) -> int:
+    project = ProjectORM(
+        name="bench",
+        description="benchmark project",
+        task_count=count,
+        todo_count=count,
+    )
+    session.add(project)
+    session.flush()
+
+    now = datetime.utcnow()
+    session.execute(
+        insert(TaskORM),
+        [
+            {
+                "project_id": project.id,
+                "title": f"task {i}",
+                "description": "delete benchmark task",
+                "status": "todo",
+                "deadline": None,
+                "created_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    session.commit()
+    return project.id
+
+
+def _delete_orm(session_factory, project_id: int, batch_size: int) -> None:
+    with session_factory() as session:
+        project = session.get(ProjectORM, project_id)
+        for task in project.tasks:
+            session.delete(task)
+        session.delete(project)
+        session.commit()
+
+
+def _delete_cascade(session_factory, project_id: int, batch_size: int) -> None:
+    with session_factory() as session:
+        ProjectRepository(session=session).delete(project_id)
+        session.commit()
+
+
+def _delete_chunked(session_factory, project_id: int, batch_size: int) -> None:
+    delete_project_in_chunks(project_id, batch_size, session_factory=session_factory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--orm-limit", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--url", default=None, help="Database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+
+    strategies = [
+        ("orm", _delete_orm),
+        ("cascade", _delete_cascade),
+        ("chunked", _delete_chunked),
+    ]
+    print(f"{'tasks':>8} " + " ".join(f"{name + ' (ms)':>14}" for name, _ in strategies))
+    for size in (int(s) for s in args.sizes.split(",")):
+        cells = []
+        for name, strategy in strategies:
+            if name == "orm" and size > args.orm_limit:
+                cells.append(f"{'-':>14}")
+                continue
+            engine = make_engine(args.url)
+            session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+            with session_factory() as session:
+                project_id = _seed(session, size)
+            with timed() as elapsed:
+                strategy(session_factory, project_id, args.batch_size)
+            cells.append(f"{elapsed[0] * 1000:>14.1f}")
+            engine.dispose()
+        print(f"{size:>8} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
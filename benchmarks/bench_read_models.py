@@ -0,0 +1,121 @@
+"""
+Measure memory allocated per GET request by the ORM and read-model paths.
+
+Usage:
+    python -m benchmarks.bench_read_models [--sizes 1,50,500] [--url URL]
+
+For a task list page of each size and for a single task, both paths load
+the data and encode the response body. The ORM path loads TaskORM
+entities and validates them into TaskRead models, as the handlers did
+before; the read-model path selects TaskView DTOs and encodes them with
+orjson. tracemalloc's peak for one request (after a warm-up run) is
+reported.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable
+
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.api.fast_json import fields_of, item_content, page_content
+from app.api.schemas import TaskPage, TaskRead
+from app.models import ProjectORM, TaskORM
+from app.repositories.task_repository import TaskRepository
+from benchmarks.common import make_engine
+
+Request = Callable[[Session, int, int], bytes]
+TASK_FIELDS = fields_of(TaskRead)
+
+
+def _seed(session: Session, count: int) -> int:
+    project = ProjectORM(name="bench", description="read model benchmark")
+    session.add(project)
+    session.flush()
+
+    now = datetime.utcnow()
+    session.execute(
+        insert(TaskORM),
+        [
+            {
+                "project_id": project.id,
+                "title": f"task {i}",
+                "description": "read model benchmark task",
+                "status": "todo",
+                "deadline": now + timedelta(days=i % 30),
+                "created_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    session.commit()
+    return project.id
+
+
+def _orm_list(session: Session, project_id: int, limit: int) -> bytes:
+    page = TaskRepository(session=session).list_by_project_page(project_id, limit)
+    model = TaskPage.model_validate({"items": page.items, "next_cursor": None})
+    return json.dumps(model.model_dump(mode="json")).encode("utf-8")
+
+
+def _view_list(session: Session, project_id: int, limit: int) -> bytes:
+    page = TaskRepository(session=session).list_by_project_view_page(project_id, limit)
+    return orjson.dumps(page_content(page.items, TASK_FIELDS, None))
+
+
+def _orm_get(session: Session, project_id: int, task_id: int) -> bytes:
+    task = TaskRepository(session=session).get_by_id(task_id)
+    return json.dumps(TaskRead.model_validate(task).model_dump(mode="json")).encode("utf-8")
+
+
+def _view_get(session: Session, project_id: int, task_id: int) -> bytes:
+    task = TaskRepository(session=session).get_view(task_id)
+    return orjson.dumps(item_content(task, TASK_FIELDS))
+
+
+def _measure(engine, request: Request, project_id: int, arg: int) -> float:
+    """Peak KiB allocated while serving one request."""
+    with Session(engine) as session:
+        request(session, project_id, arg)  # warm up statement caches
+    with Session(engine) as session:
+        tracemalloc.start()
+        try:
+            request(session, project_id, arg)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1,50,500", help="task list page sizes")
+    parser.add_argument("--url", default=None, help="Database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    engine = make_engine(args.url)
+    with Session(engine) as session:
+        project_id = _seed(session, max(sizes))
+
+    cases = [(f"list {size}", _orm_list, _view_list, size) for size in sizes]
+    cases.append(("get 1", _orm_get, _view_get, 1))
+
+    print(f"{'request':>10} {'ORM (KiB)':>10} {'view (KiB)':>11} {'saved':>6}")
+    for label, orm_path, view_path, arg in cases:
+        orm_kib = _measure(engine, orm_path, project_id, arg)
+        view_kib = _measure(engine, view_path, project_id, arg)
+        print(
+            f"{label:>10} {orm_kib:>10.1f} {view_kib:>11.1f} "
+            f"{1 - view_kib / orm_kib:>6.0%}"
+        )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
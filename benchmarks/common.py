@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from app.db.base import Base
+import app.models  # noqa: F401  # Ensure all ORM models are imported
+
+
+def make_engine(url: str | None = None, **engine_options: Any) -> Engine:
+    """
+    Create an engine with a fresh schema for a benchmark run.
+
+    Without a URL a throw-away SQLite file is used, so benchmarks can run
+    anywhere; pass a PostgreSQL URL to measure against the real database.
+    Extra keyword arguments are passed to create_engine.
+    """
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db", prefix="todo-bench-")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+
+    engine = create_engine(url, future=True, **engine_options)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@contextmanager
+def timed() -> Iterator[list[float]]:
+    """Measure wall-clock time of a block; the elapsed seconds are appended."""
+    result: list[float] = []
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.append(time.perf_counter() - start)
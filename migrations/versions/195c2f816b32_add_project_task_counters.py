@@ -0,0 +1,58 @@
+"""add denormalized task counters to projects
+
+Revision ID: 195c2f816b32
+Revises: 4537710f2bc9
+Create Date: 2025-12-04 16:02:18.448120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '195c2f816b32'
+down_revision: Union[str, Sequence[str], None] = '4537710f2bc9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = ("task_count", "todo_count", "doing_count", "done_count")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COUNTER_COLUMNS:
+        op.add_column(
+            "projects",
+            sa.Column(column, sa.Integer(), server_default="0", nullable=False),
+        )
+
+    # Backfill from the existing tasks
+    op.execute(
+        """
+        UPDATE projects SET
+            task_count = (
+                SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id
+            ),
+            todo_count = (
+                SELECT count(*) FROM tasks
+                WHERE tasks.project_id = projects.id AND tasks.status = 'todo'
+            ),
+            doing_count = (
+                SELECT count(*) FROM tasks
+                WHERE tasks.project_id = projects.id AND tasks.status = 'doing'
+            ),
+            done_count = (
+                SELECT count(*) FROM tasks
+                WHERE tasks.project_id = projects.id AND tasks.status = 'done'
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("projects") as batch_op:
+        for column in reversed(COUNTER_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,64 @@
+"""add covering index for task listing
+
+Revision ID: 4537710f2bc9
+Revises: 5dee97406630
+Create Date: 2025-12-01 10:31:57.203348
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4537710f2bc9'
+down_revision: Union[str, Sequence[str], None] = '5dee97406630'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same key as ix_tasks_project_id_id, plus the listed columns as
+    # INCLUDE payload on PostgreSQL so task lists can use index-only scans.
+    # Once it exists the plain composite index is redundant and is dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_listing",
+            "tasks",
+            ["project_id", "id"],
+            postgresql_include=[
+                "title",
+                "description",
+                "status",
+                "deadline",
+                "created_at",
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_project_id_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_id_id",
+            "tasks",
+            ["project_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_project_listing",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""add partial index on deadline of open tasks
+
+Revision ID: 5dee97406630
+Revises: 8adbf1e3394a
+Create Date: 2025-12-01 10:19:03.870214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5dee97406630'
+down_revision: Union[str, Sequence[str], None] = '8adbf1e3394a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only open tasks are ever scanned by deadline, so 'done' rows stay out
+    # of the index. The predicate must match app.models.task.OPEN_TASK_PREDICATE.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_open_deadline",
+            "tasks",
+            ["deadline"],
+            postgresql_where=sa.text("status <> 'done'"),
+            sqlite_where=sa.text("status <> 'done'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_open_deadline",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""add tasks (project_id, id) index
+
+Revision ID: 8adbf1e3394a
+Revises: e9f72a563870
+Create Date: 2025-12-01 10:12:41.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8adbf1e3394a'
+down_revision: Union[str, Sequence[str], None] = 'e9f72a563870'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_id_id",
+            "tasks",
+            ["project_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_project_id_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,32 @@
+"""add version stamp to projects
+
+Revision ID: a3c1e4f7b9d2
+Revises: 195c2f816b32
+Create Date: 2025-12-08 11:12:40.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c1e4f7b9d2'
+down_revision: Union[str, Sequence[str], None] = '195c2f816b32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "projects",
+        sa.Column("version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.drop_column("version")
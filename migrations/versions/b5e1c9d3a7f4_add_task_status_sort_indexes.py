@@ -0,0 +1,47 @@
+"""add status indexes for cross-project task queries sorted by deadline or creation
+
+Revision ID: b5e1c9d3a7f4
+Revises: f2b6d9a4c8e3
+Create Date: 2025-12-12 09:41:18.602157
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c9d3a7f4'
+down_revision: Union[str, Sequence[str], None] = 'f2b6d9a4c8e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_tasks_status_deadline": ["status", "deadline", "id"],
+    "ix_tasks_status_created": ["status", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
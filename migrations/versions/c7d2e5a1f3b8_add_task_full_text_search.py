@@ -0,0 +1,85 @@
+"""add full-text search over task titles and descriptions
+
+Revision ID: c7d2e5a1f3b8
+Revises: a3c1e4f7b9d2
+Create Date: 2025-12-09 09:41:17.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e5a1f3b8'
+down_revision: Union[str, Sequence[str], None] = 'a3c1e4f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # An expression index rather than a stored generated column: adding
+        # that column would rewrite tasks under an ACCESS EXCLUSIVE lock,
+        # while the index builds concurrently without blocking writes.
+        # The expression must match app.models.task_search.TASK_SEARCH_VECTOR.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_tasks_search_vector",
+                "tasks",
+                [
+                    sa.text(
+                        "(setweight(to_tsvector('english', title), 'A') || "
+                        "setweight(to_tsvector('english', description), 'B'))"
+                    )
+                ],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+            "title, description, content='tasks', content_rowid='id', "
+            "tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+            "INSERT INTO tasks_fts(rowid, title, description) "
+            "VALUES (new.id, new.title, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+            "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description "
+            "ON tasks BEGIN "
+            "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); "
+            "INSERT INTO tasks_fts(rowid, title, description) "
+            "VALUES (new.id, new.title, new.description); END"
+        )
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_tasks_search_vector",
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER tasks_fts_update")
+        op.execute("DROP TRIGGER tasks_fts_delete")
+        op.execute("DROP TRIGGER tasks_fts_insert")
+        op.execute("DROP TABLE tasks_fts")
@@ -0,0 +1,49 @@
+"""add indexes for cross-project task queries
+
+Revision ID: d4a8b2c6e1f9
+Revises: c7d2e5a1f3b8
+Create Date: 2025-12-09 15:22:08.913470
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8b2c6e1f9'
+down_revision: Union[str, Sequence[str], None] = 'c7d2e5a1f3b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_tasks_deadline_id": ["deadline", "id"],
+    "ix_tasks_created_id": ["created_at", "id"],
+    "ix_tasks_project_deadline": ["project_id", "deadline", "id"],
+    "ix_tasks_project_created": ["project_id", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,54 @@
+"""add status and open-task indexes for cross-project task queries
+
+Revision ID: f2b6d9a4c8e3
+Revises: d4a8b2c6e1f9
+Create Date: 2025-12-11 10:07:45.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d9a4c8e3'
+down_revision: Union[str, Sequence[str], None] = 'd4a8b2c6e1f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The predicate must match app.models.task.OPEN_TASK_PREDICATE.
+OPEN_TASK_PREDICATE = sa.text("status <> 'done'")
+
+INDEXES = {
+    "ix_tasks_status_id": (["status", "id"], None),
+    "ix_tasks_open_id": (["id"], OPEN_TASK_PREDICATE),
+    "ix_tasks_open_created": (["created_at", "id"], OPEN_TASK_PREDICATE),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, (columns, where) in INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_where=where,
+                sqlite_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
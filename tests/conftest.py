@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Generator
 
+# Tests never reach the real database, so don't try to warm its pool.
+os.environ.setdefault("DB_POOL_WARMUP", "false")
+# Each test rolls its data back, so cached project lookups would go stale.
+os.environ.setdefault("PROJECT_CACHE_SIZE", "0")
+
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
+from app.api.dependencies import get_session
+from app.api.main import create_app
 from app.db.base import Base
+from app.db.query_tracker import assert_max_queries
 import app.models  # noqa: F401  # Ensure all ORM models are imported
 
 
@@ -16,8 +27,15 @@ def engine():
     Create a dedicated in-memory SQLite engine for tests.
 
     This avoids touching the real PostgreSQL instance and keeps tests fast and isolated.
+    A single shared connection lets API tests reach the same database from
+    the threadpool that runs request handlers.
     """
-    engine = create_engine("sqlite:///:memory:", future=True)
+    engine = create_engine(
+        "sqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     Base.metadata.create_all(bind=engine)
     try:
         yield engine
@@ -40,3 +58,32 @@ def db_session(engine) -> Generator[Session, None, None]:
         session.rollback()
     finally:
         session.close()
+
+
+@pytest.fixture
+def client(db_session: Session) -> Generator[TestClient, None, None]:
+    """
+    Provide a TestClient for the web API bound to the test database session.
+    """
+    app = create_app()
+
+    def _override_get_session() -> Generator[Session, None, None]:
+        yield db_session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Pin how many SQL statements a block may run, e.g. one API request:
+
+        with query_budget(2):
+            client.get(f"/api/v1/projects/{project_id}")
+
+    Pass `max_repeats` to also fail when one statement shape runs more
+    often than that (an N+1 pattern).
+    """
+    return assert_max_queries
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.api.pagination import encode_cursor
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_task_list_answers_if_none_match_until_a_task_changes(
+    client: TestClient,
+    db_session,
+) -> None:
+    """A matching ETag should get 304; any task mutation should change the ETag."""
+    project = ProjectRepository(session=db_session).create(
+        name="ETag Project",
+        description="Project used by the conditional GET tests",
+    )
+    task = TaskRepository(session=db_session).create(
+        project_id=project.id,
+        title="Poll me",
+        description="Watched by a dashboard",
+    )
+    url = f"/api/v1/projects/{project.id}/tasks"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    # A different page of the same list has its own ETag.
+    assert client.get(url, params={"limit": 1}).headers["ETag"] != etag
+
+    patched = client.patch(f"{url}/{task.id}", json={"title": "Renamed"})
+    assert patched.status_code == 200
+
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["items"][0]["title"] == "Renamed"
+
+
+def test_project_page_etag_changes_with_its_next_cursor(
+    client: TestClient,
+    db_session,
+) -> None:
+    """A project added after a full page changes its next_cursor, so its ETag too."""
+    project_repo = ProjectRepository(session=db_session)
+    first = project_repo.create(name="Page One", description="")
+    second = project_repo.create(name="Page Two", description="")
+    params = {"limit": 2, "cursor": encode_cursor(first.id - 1)}
+
+    response = client.get("/api/v1/projects", params=params)
+    assert response.json()["next_cursor"] is None
+    etag = response.headers["ETag"]
+
+    project_repo.create(name="Page Three", description="")
+    response = client.get(
+        "/api/v1/projects", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["next_cursor"] == encode_cursor(second.id)
+
+
+def test_single_item_endpoints_emit_etags(client: TestClient, db_session) -> None:
+    """GET of one project or task should return it with a usable ETag."""
+    project = ProjectRepository(session=db_session).create(
+        name="Single Items",
+        description="Project used by the single-item GET tests",
+    )
+    task = TaskRepository(session=db_session).create(
+        project_id=project.id,
+        title="Single",
+        description="Fetched by id",
+    )
+
+    response = client.get(f"/api/v1/projects/{project.id}")
+    assert response.status_code == 200
+    assert response.json()["task_count"] == 1
+    etag = response.headers["ETag"]
+    assert (
+        client.get(
+            f"/api/v1/projects/{project.id}", headers={"If-None-Match": etag}
+        ).status_code
+        == 304
+    )
+
+    task_url = f"/api/v1/projects/{project.id}/tasks/{task.id}"
+    response = client.get(task_url)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Single"
+    etag = response.headers["ETag"]
+    assert client.get(task_url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(task_url, json={"status": "doing"})
+    assert client.get(task_url, headers={"If-None-Match": etag}).status_code == 200
+
+    assert client.get("/api/v1/projects/999999").status_code == 404
+    assert client.get(f"/api/v1/projects/{project.id}/tasks/999999").status_code == 404
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_list_project_tasks_walks_pages_with_cursor(
+    client: TestClient,
+    db_session,
+) -> None:
+    """Following next_cursor should return every task exactly once, in id order."""
+    project = ProjectRepository(session=db_session).create(
+        name="Paged Tasks Project",
+        description="Project used by the pagination tests",
+    )
+    task_repo = TaskRepository(session=db_session)
+    created_ids = [
+        task_repo.create(
+            project_id=project.id,
+            title=f"Task {i}",
+            description="Paged task",
+            deadline=None,
+        ).id
+        for i in range(5)
+    ]
+
+    seen_ids: list[int] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get(f"/api/v1/projects/{project.id}/tasks", params=params)
+        assert response.status_code == 200
+
+        body = response.json()
+        assert len(body["items"]) <= 2
+        seen_ids.extend(item["id"] for item in body["items"])
+
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen_ids == created_ids
+
+
+def test_list_projects_rejects_invalid_cursor(client: TestClient) -> None:
+    """A cursor that was not produced by the API should be a client error."""
+    response = client.get("/api/v1/projects", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+def test_list_projects_enforces_max_limit(client: TestClient) -> None:
+    """Limits above the configured maximum should be rejected."""
+    response = client.get("/api/v1/projects", params={"limit": 100000})
+
+    assert response.status_code == 422
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.repositories.project_repository import ProjectRepository
+
+
+def _create_project(db_session, name: str) -> int:
+    return ProjectRepository(session=db_session).create(
+        name=name,
+        description="Project used by the batch endpoint tests",
+    ).id
+
+
+def test_batch_create_inserts_all_items_in_order(client: TestClient, db_session) -> None:
+    """A valid batch should create every task and update the project counter."""
+    project_id = _create_project(db_session, "Batch Project")
+    items = [
+        {"title": f"Task {i}", "description": "Batch task"}
+        for i in range(3)
+    ]
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": items},
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [task["title"] for task in body["created"]] == ["Task 0", "Task 1", "Task 2"]
+    assert body["errors"] == []
+    assert ProjectRepository(session=db_session).get_by_id(project_id).task_count == 3
+
+
+def test_batch_create_all_or_nothing_reports_errors(client: TestClient, db_session) -> None:
+    """One invalid item should fail an all_or_nothing batch with per-item errors."""
+    project_id = _create_project(db_session, "Batch Project Strict")
+    items = [
+        {"title": "Valid", "description": "Fine"},
+        {"title": "x" * 40, "description": "Title too long for the service rules"},
+    ]
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": items},
+    )
+
+    assert response.status_code == 400
+    errors = response.json()["detail"]["errors"]
+    assert [error["index"] for error in errors] == [1]
+    assert ProjectRepository(session=db_session).get_by_id(project_id).task_count == 0
+
+
+def test_batch_create_partial_creates_valid_items(client: TestClient, db_session) -> None:
+    """partial mode should create the valid items and report the invalid ones."""
+    project_id = _create_project(db_session, "Batch Project Partial")
+    items = [
+        {"title": "Valid", "description": "Fine"},
+        {"title": "x" * 40, "description": "Title too long for the service rules"},
+        {"title": "Also valid", "description": "Fine", "deadline": "2030-01-02T00:00:00"},
+    ]
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": items, "mode": "partial"},
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [task["title"] for task in body["created"]] == ["Valid", "Also valid"]
+    assert [error["index"] for error in body["errors"]] == [1]
+
+
+def test_batch_create_respects_task_quota(client: TestClient, db_session) -> None:
+    """A batch that would exceed max_tasks_per_project should be rejected whole."""
+    project_id = _create_project(db_session, "Batch Project Quota")
+    items = [{"title": f"Task {i}", "description": "Quota"} for i in range(21)]
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": items},
+    )
+
+    assert response.status_code == 400
+    assert ProjectRepository(session=db_session).get_by_id(project_id).task_count == 0
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.api.dependencies import get_async_session
+from app.api.main import create_app
+from app.db.async_session import to_async_url
+from app.db.base import Base
+from app.repositories.unit_of_work import AsyncUnitOfWork
+from app.services.async_task_service import AsyncTaskService
+
+
+@pytest.fixture
+def async_engine(tmp_path: Path) -> Generator[AsyncEngine, None, None]:
+    """A file-backed aiosqlite engine, so every connection sees the same data."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+
+    async def create_schema() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+    try:
+        yield engine
+    finally:
+        asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def session_factory(async_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+
+def test_to_async_url_swaps_driver() -> None:
+    assert (
+        to_async_url("postgresql+psycopg2://u:p@db:5432/todo")
+        == "postgresql+asyncpg://u:p@db:5432/todo"
+    )
+    assert to_async_url("sqlite:///./todo.db") == "sqlite+aiosqlite:///./todo.db"
+    with pytest.raises(ValueError):
+        to_async_url("mysql://u:p@db/todo")
+
+
+def test_async_unit_of_work_commits_and_rolls_back(session_factory) -> None:
+    async def scenario() -> list[str]:
+        async with AsyncUnitOfWork(session_factory) as uow:
+            project = await uow.projects.create(name="Inbox", description="kept")
+            await uow.tasks.create(project.id, "First", "kept")
+
+        with pytest.raises(RuntimeError):
+            async with AsyncUnitOfWork(session_factory) as uow:
+                await uow.projects.create(name="Scratch", description="dropped")
+                raise RuntimeError("boom")
+
+        async with AsyncUnitOfWork(session_factory) as uow:
+            projects = await uow.projects.list_all()
+            tasks = await uow.tasks.list_by_project(projects[0].id)
+            assert [task.title for task in tasks] == ["First"]
+            assert projects[0].task_count == 1
+            return [project.name for project in projects]
+
+    assert asyncio.run(scenario()) == ["Inbox"]
+
+
+def test_async_task_service_enforces_quota(session_factory) -> None:
+    async def scenario() -> None:
+        async with AsyncUnitOfWork(session_factory) as uow:
+            project = await uow.projects.create(name="Small", description="")
+            service = AsyncTaskService(uow.session, max_tasks_per_project=1)
+            await service.create_task(project.id, "One", "", None)
+            with pytest.raises(Exception):
+                await service.create_task(project.id, "Two", "", None)
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def async_client(session_factory) -> Generator[TestClient, None, None]:
+    app = create_app(async_routes=True)
+
+    async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncUnitOfWork(session_factory) as uow:
+            yield uow.session
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_routes_round_trip(async_client: TestClient) -> None:
+    response = async_client.post(
+        "/api/v1/projects", json={"name": "Async", "description": "demo"}
+    )
+    assert response.status_code == 201
+    project_id = response.json()["id"]
+
+    created = async_client.post(
+        f"/api/v1/projects/{project_id}/tasks",
+        json={"title": "Write", "description": "docs"},
+    )
+    assert created.status_code == 201
+    task_id = created.json()["id"]
+
+    patched = async_client.patch(
+        f"/api/v1/projects/{project_id}/tasks/{task_id}",
+        json={"status": "doing"},
+    )
+    assert patched.status_code == 200
+    assert patched.json()["status"] == "doing"
+
+    page = async_client.get(f"/api/v1/projects/{project_id}/tasks").json()
+    assert [task["id"] for task in page["items"]] == [task_id]
+
+    listed = async_client.get("/api/v1/projects")
+    projects = listed.json()["items"]
+    assert projects[0]["doing_count"] == 1
+    cached = async_client.get(
+        "/api/v1/projects", headers={"If-None-Match": listed.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+    stats = async_client.get("/api/v1/projects/stats", params={"limit": 1}).json()
+    assert [row["project_id"] for row in stats["items"]] == [project_id]
+    assert stats["totals"]["doing_count"] == 1
+
+    assert (
+        async_client.delete(f"/api/v1/projects/{project_id}/tasks/{task_id}").status_code
+        == 204
+    )
+    assert async_client.get("/api/v1/projects/999/tasks").status_code == 404
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.autoclose_worker import (
+    AutocloseWorker,
+    LeaderLock,
+    claim_and_close_overdue,
+)
+from app.db.base import Base
+from app.models import ProjectORM
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_overdue_chunks_are_claimed_with_skip_locked() -> None:
+    stmt = TaskRepository._overdue_chunk_stmt(datetime(2030, 1, 1), 100, skip_locked=True)
+    assert "FOR UPDATE SKIP LOCKED" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE" not in str(stmt.compile(dialect=sqlite.dialect()))
+
+    plain = TaskRepository._overdue_chunk_stmt(datetime(2030, 1, 1), 100, skip_locked=False)
+    assert "FOR UPDATE" not in str(plain.compile(dialect=postgresql.dialect()))
+
+
+def test_worker_commits_and_clears_the_session_per_chunk(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'worker.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    now = datetime.utcnow()
+
+    with factory() as session:
+        project_repo = ProjectRepository(session=session)
+        task_repo = TaskRepository(session=session)
+        project_ids = []
+        for name in ("A", "B"):
+            project = project_repo.create(name=name, description="")
+            project_ids.append(project.id)
+            for i in range(3):
+                task_repo.create(project.id, f"Late {i}", "", now - timedelta(days=i + 1))
+            task_repo.create(project.id, "Future", "", now + timedelta(days=1))
+        session.commit()
+
+    sessions = []
+
+    def session_factory():
+        session = factory()
+        sessions.append(session)
+        return session
+
+    closed_ids = claim_and_close_overdue(now, batch_size=2, session_factory=session_factory)
+    assert len(closed_ids) == 6
+    # One session for the whole run, emptied after every chunk.
+    assert len(sessions) == 1
+    assert len(sessions[0].identity_map) == 0
+
+    with factory() as session:
+        for project_id in project_ids:
+            project = session.get(ProjectORM, project_id)
+            assert (project.todo_count, project.done_count) == (1, 3)
+
+    assert claim_and_close_overdue(now, batch_size=2, session_factory=factory) == []
+    engine.dispose()
+
+
+def test_only_the_leader_runs(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'leader.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    leader = LeaderLock(lock_id=42, engine=engine)
+    follower_lock = LeaderLock(lock_id=42, engine=engine)
+    follower = AutocloseWorker(leader_lock=follower_lock, session_factory=factory)
+
+    assert leader.try_acquire()
+    assert follower.run_once() is None
+    assert not follower_lock.held
+
+    leader.release()
+    assert follower.run_once() == []
+    assert follower_lock.held
+    follower_lock.release()
+    engine.dispose()
+
+
+def test_worker_survives_database_errors(tmp_path, caplog) -> None:
+    """A failing run is logged and retried at the next interval."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'flaky.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        project_id = ProjectRepository(session=session).create(
+            name="Flaky", description=""
+        ).id
+        TaskRepository(session=session).create(
+            project_id, "Late", "", datetime.utcnow() - timedelta(days=1)
+        )
+        session.commit()
+
+    failures = 2
+    closed = threading.Event()
+
+    def flaky_session_factory():
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise OperationalError("SELECT 1", {}, Exception("database is down"))
+        closed.set()
+        return factory()
+
+    worker = AutocloseWorker(interval_seconds=0.01, session_factory=flaky_session_factory)
+    thread = threading.Thread(target=worker.run_forever, daemon=True)
+    with caplog.at_level(logging.INFO, logger="app.commands.autoclose_worker"):
+        thread.start()
+        assert closed.wait(5)
+        worker.stop()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert caplog.text.count("Auto-close run failed") == 2
+    assert "Closed 1 overdue tasks." in caplog.text
+    with factory() as session:
+        assert session.get(ProjectORM, project_id).done_count == 1
+    engine.dispose()
+
+
+class DroppedConnection:
+    """A leader connection whose database server went away."""
+
+    invalidated = False
+
+    def execute(self, *args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("server closed the connection"))
+
+    def invalidate(self) -> None:
+        self.invalidated = True
+
+    def close(self) -> None:
+        pass
+
+
+def test_leader_steps_down_when_its_connection_drops() -> None:
+    """PostgreSQL frees the lock with the connection, so leadership ends too."""
+    engine = create_engine("sqlite://")
+    lock = LeaderLock(lock_id=42, engine=engine)
+    connection = DroppedConnection()
+    lock._connection = connection  # as if elected on PostgreSQL
+    assert lock.held
+
+    assert not lock.try_acquire()
+    assert not lock.held
+    assert connection.invalidated
+    engine.dispose()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+
+from app.db.pool import InstrumentedQueuePool, get_pool_stats, warm_pool
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(pooled_engine) -> None:
+    """Checkouts, in-use counts and timeouts should show up in the stats."""
+    connection = pooled_engine.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        pooled_engine.connect()
+
+    stats = get_pool_stats(pooled_engine)["stats"]
+    assert stats["checkouts"] == 1
+    assert stats["in_use"] == 1
+    assert stats["timeouts"] == 1
+
+    connection.close()
+    stats = get_pool_stats(pooled_engine)["stats"]
+    assert stats["in_use"] == 0
+    assert stats["checkins"] == 1
+
+
+def test_warm_pool_opens_connections_up_front(pooled_engine) -> None:
+    """Warming should open the pool's connections before any request needs them."""
+    assert warm_pool(pooled_engine, 1) == 1
+
+    stats = get_pool_stats(pooled_engine)
+    assert stats["checked_in"] == 1
+    assert stats["stats"]["connects"] == 1
+
+
+def test_pool_stats_endpoint(client: TestClient) -> None:
+    """The internal endpoint should describe the application's pool."""
+    response = client.get("/api/v1/internal/pool")
+
+    assert response.status_code == 200
+    assert "pool_class" in response.json()
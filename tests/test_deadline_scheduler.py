@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.autoclose_overdue import AUTOCLOSE_LAG
+from app.commands.deadline_scheduler import DeadlineScheduler
+from app.db.base import Base
+from app.models import TaskORM
+from app.repositories import deadline_events
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scheduler.db'}")
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        engine.dispose()
+
+
+def _seed(session_factory, deadlines, name: str = "Due") -> list[int]:
+    with session_factory() as session:
+        project = ProjectRepository(session=session).create(name=name, description="")
+        task_repo = TaskRepository(session=session)
+        ids = [
+            task_repo.create(project.id, f"Task {i}", "", deadline).id
+            for i, deadline in enumerate(deadlines)
+        ]
+        session.commit()
+    return ids
+
+
+def test_scheduler_sleeps_until_the_next_deadline(session_factory) -> None:
+    start = datetime(2030, 1, 1, 12, 0)
+    first, second = start + timedelta(minutes=10), start + timedelta(hours=2)
+    ids = _seed(session_factory, [second, first, None])
+
+    clock = FakeClock(start)
+    scheduler = DeadlineScheduler(
+        batch_size=1,
+        refresh_interval=None,
+        session_factory=session_factory,
+        clock=clock,
+    )
+    scheduler.refresh()
+    assert scheduler.next_wakeup() == first
+
+    statements: list[str] = []
+    engine = session_factory.kw["bind"]
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert scheduler.run_due() == 0
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == []
+
+    lag_count = AUTOCLOSE_LAG.count(job="deadline")
+    lag_sum = AUTOCLOSE_LAG.sum(job="deadline")
+    clock.now = first + timedelta(seconds=3)
+    assert scheduler.run_due() == 1
+    assert AUTOCLOSE_LAG.count(job="deadline") == lag_count + 1
+    assert AUTOCLOSE_LAG.sum(job="deadline") - lag_sum == pytest.approx(3)
+    assert scheduler.next_wakeup() == second
+
+    with session_factory() as session:
+        statuses = [session.get(TaskORM, task_id).status for task_id in ids]
+    assert statuses == ["todo", "done", "todo"]
+
+
+def test_committed_mutations_move_the_horizon(session_factory) -> None:
+    start = datetime(2030, 1, 1)
+    _seed(session_factory, [start + timedelta(days=3)])
+    scheduler = DeadlineScheduler(
+        refresh_interval=None,
+        session_factory=session_factory,
+        clock=FakeClock(start),
+    )
+    scheduler.refresh()
+
+    deadline_events.subscribe(scheduler.notify)
+    try:
+        with session_factory() as session:
+            project = ProjectRepository(session=session).create(name="Late", description="")
+            TaskRepository(session=session).create(
+                project.id, "Rolled back", "", start + timedelta(hours=1)
+            )
+            session.rollback()
+        assert scheduler.next_wakeup() == start + timedelta(days=3)
+
+        _seed(session_factory, [start + timedelta(days=1)], name="Sooner")
+        assert scheduler.next_wakeup() == start + timedelta(days=1)
+    finally:
+        deadline_events.unsubscribe(scheduler.notify)
+
+
+def test_scheduler_thread_closes_a_task_when_it_becomes_due(session_factory) -> None:
+    scheduler = DeadlineScheduler(refresh_interval=None, session_factory=session_factory)
+    lag_sum = AUTOCLOSE_LAG.sum(job="deadline")
+    scheduler.start()
+    try:
+        [task_id] = _seed(session_factory, [datetime.utcnow() + timedelta(seconds=0.2)])
+        status = None
+        for _ in range(50):
+            with session_factory() as session:
+                status = session.get(TaskORM, task_id).status
+            if status == "done":
+                break
+            time.sleep(0.05)
+    finally:
+        scheduler.stop(timeout=5)
+    assert status == "done"
+    assert 0 < AUTOCLOSE_LAG.sum(job="deadline") - lag_sum < 2
+
+
+def test_scheduler_thread_survives_database_errors(session_factory, caplog) -> None:
+    """A failing database is retried with backoff instead of ending the thread."""
+    failures = 3
+
+    def flaky_session_factory():
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise OperationalError("SELECT 1", {}, Exception("database is down"))
+        return session_factory()
+
+    [task_id] = _seed(session_factory, [datetime.utcnow() - timedelta(minutes=1)])
+    scheduler = DeadlineScheduler(
+        refresh_interval=None,
+        session_factory=flaky_session_factory,
+        retry_first_seconds=0.01,
+    )
+    with caplog.at_level(logging.ERROR, logger="app.commands.deadline_scheduler"):
+        scheduler.start()
+        try:
+            status = None
+            for _ in range(50):
+                with session_factory() as session:
+                    status = session.get(TaskORM, task_id).status
+                if status == "done":
+                    break
+                time.sleep(0.05)
+        finally:
+            scheduler.stop(timeout=5)
+
+    assert status == "done"
+    assert failures == 0
+    assert caplog.text.count("Deadline auto-close failed") == 3
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.export_ndjson import write_export
+from app.db.base import Base
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def _seed(session) -> None:
+    project_repo = ProjectRepository(session=session)
+    task_repo = TaskRepository(session=session)
+    for name in ("Export A", "Export B"):
+        project = project_repo.create(name=name, description="Exported")
+        rows = [
+            {"title": f"{name} {i}", "description": "", "deadline": None}
+            for i in range(3)
+        ]
+        task_repo.create_many(project.id, rows)
+
+
+def _records(body: bytes) -> list[dict]:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+def test_export_streams_projects_then_tasks_as_ndjson(
+    client: TestClient,
+    db_session,
+) -> None:
+    _seed(db_session)
+
+    response = client.get("/api/v1/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = _records(response.content)
+    types = [record["type"] for record in records]
+    assert types == ["project"] * 2 + ["task"] * 6
+    assert records[0]["name"] == "Export A"
+    assert records[0]["task_count"] == 3
+    assert records[2]["title"] == "Export A 0"
+    assert records[2]["created_at"]
+
+    compressed = client.get("/api/v1/export", params={"gzip": "true"})
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert _records(gzip.decompress(compressed.content)) == records
+
+
+def test_export_command_writes_in_small_batches(tmp_path) -> None:
+    """Batches smaller than the tables must still produce the full export."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with session_factory() as session:
+        _seed(session)
+        session.commit()
+
+    out = io.BytesIO()
+    write_export(out, batch_size=2, compress=True, session_factory=session_factory)
+    engine.dispose()
+
+    records = _records(gzip.decompress(out.getvalue()))
+    assert [record["type"] for record in records] == ["project"] * 2 + ["task"] * 6
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from app.api.schemas import ProjectPage, TaskPage
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_fast_list_responses_match_the_pydantic_models(
+    client: TestClient,
+    db_session,
+) -> None:
+    """The orjson path must produce exactly what TaskRead/ProjectRead would."""
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    project = project_repo.create(name="Fast JSON", description="Serializer test")
+    task_repo.create(project.id, "No deadline", "Plain")
+    task_repo.create(
+        project.id,
+        "With deadline",
+        "Has microseconds",
+        deadline=datetime(2030, 5, 17, 8, 30, 15, 123456),
+    )
+
+    response = client.get(f"/api/v1/projects/{project.id}/tasks")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    expected = TaskPage(items=task_repo.list_by_project(project.id))
+    assert response.json() == expected.model_dump(mode="json")
+
+    response = client.get("/api/v1/projects")
+    expected = ProjectPage(items=project_repo.list_all())
+    assert response.json() == expected.model_dump(mode="json")
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.export_ndjson import write_export
+from app.commands.import_data import (
+    _open_text,
+    import_records,
+    read_csv,
+    read_ndjson,
+)
+from app.db.base import Base
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+@pytest.fixture
+def make_session_factory(tmp_path):
+    """Build session factories for fresh SQLite files with the full schema."""
+    engines = []
+
+    def make(name: str):
+        engine = create_engine(f"sqlite:///{tmp_path / name}")
+        Base.metadata.create_all(bind=engine)
+        engines.append(engine)
+        return sessionmaker(bind=engine, expire_on_commit=False)
+
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+def test_csv_import_validates_rows_and_maintains_counters(make_session_factory) -> None:
+    session_factory = make_session_factory("import.db")
+    csv_text = (
+        "project,title,description,deadline,status\n"
+        "Inbox,Buy milk,,2030-01-01,todo\n"
+        "Inbox,Call Bob,Phone,,done\n"
+        "Work,Write report,Quarterly,,doing\n"
+        "Work,,Missing title,,todo\n"
+        "Work,Bad deadline,,01/02/2030,todo\n"
+        f"Work,{'x' * 31},Too long,,todo\n"
+        "Work,Bad status,,,blocked\n"
+    )
+
+    report = import_records(
+        read_csv(io.StringIO(csv_text)),
+        chunk_size=2,
+        session_factory=session_factory,
+    )
+
+    assert report.tasks == 3
+    assert [error.line for error in report.errors] == [5, 6, 7, 8]
+    assert report.rows_per_second > 0
+
+    with session_factory() as session:
+        inbox = ProjectRepository(session=session).get_by_name("Inbox")
+        assert (inbox.task_count, inbox.todo_count, inbox.done_count) == (2, 1, 1)
+        tasks = TaskRepository(session=session).list_by_project(inbox.id)
+        assert [task.title for task in tasks] == ["Buy milk", "Call Bob"]
+        assert tasks[0].deadline.year == 2030
+
+
+def test_export_can_be_imported_into_another_database(make_session_factory) -> None:
+    source = make_session_factory("source.db")
+    with source() as session:
+        project = ProjectRepository(session=session).create(
+            name="Migrated", description="From the old tenant"
+        )
+        created = TaskRepository(session=session).create_many(
+            project.id,
+            [
+                {"title": f"Task {i}", "description": "Moved", "deadline": None}
+                for i in range(5)
+            ],
+        )
+        created_at = sorted(task.created_at for task in created)
+        session.commit()
+
+    exported = io.BytesIO()
+    write_export(exported, batch_size=2, compress=False, session_factory=source)
+
+    target = make_session_factory("target.db")
+    lines = io.StringIO(exported.getvalue().decode("utf-8") + "not json\n")
+    report = import_records(read_ndjson(lines), chunk_size=3, session_factory=target)
+
+    assert (report.projects, report.tasks) == (1, 5)
+    assert [error.line for error in report.errors] == [7]
+
+    with target() as session:
+        migrated = ProjectRepository(session=session).get_by_name("Migrated")
+        assert migrated.description == "From the old tenant"
+        assert migrated.task_count == 5
+        tasks = TaskRepository(session=session).list_by_project(migrated.id)
+        assert sorted(task.created_at for task in tasks) == created_at
+
+
+def test_rejected_task_does_not_create_its_project(make_session_factory) -> None:
+    session_factory = make_session_factory("rejected.db")
+    records = [
+        (1, {"project": "Ghost", "title": "Bad", "created_at": "yesterday"}),
+        (2, {"project": "Real", "title": "Good", "created_at": "2030-01-01T08:00:00"}),
+    ]
+
+    report = import_records(records, chunk_size=10, session_factory=session_factory)
+
+    assert report.tasks == 1
+    assert [error.line for error in report.errors] == [1]
+    with session_factory() as session:
+        projects = ProjectRepository(session=session)
+        assert projects.get_by_name("Ghost") is None
+        assert projects.get_by_name("Real").task_count == 1
+
+
+def test_reading_stdin_leaves_it_open(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"project": "P", "title": "T"}\n', encoding="utf-8")
+    with open(path, encoding="utf-8") as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        with _open_text("-") as lines:
+            assert [record for _, record in read_ndjson(lines)] == [
+                {"project": "P", "title": "T"}
+            ]
+        assert not stdin.closed
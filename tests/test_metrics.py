@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.metrics import DB_STATEMENTS, HTTP_REQUESTS
+from app.commands.autoclose_overdue import AUTOCLOSE_CLOSED, AUTOCLOSE_LAG
+from app.commands.autoclose_worker import claim_and_close_overdue
+from app.db.base import Base
+from app.metrics import MetricsRegistry
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_registry_renders_prometheus_text() -> None:
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests.", ("path",))
+    latency = metrics.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    metrics.gauge("up", "Up.", callback=lambda: {(): 1})
+    metrics.counter("errors_total", "Errors.", callback=lambda: {(): 4})
+
+    requests.inc(path='/a"b')
+    requests.inc(2, path='/a"b')
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    assert metrics.counter("requests_total", "Requests.", ("path",)) is requests
+    assert metrics.render().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a\\"b"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+        "# HELP up Up.",
+        "# TYPE up gauge",
+        "up 1",
+        "# HELP errors_total Errors.",
+        "# TYPE errors_total counter",
+        "errors_total 4",
+    ]
+
+
+def test_requests_are_measured_per_route_template(client: TestClient, db_session) -> None:
+    project = ProjectRepository(session=db_session).create(name="Metrics", description="")
+    route = "/api/v1/projects/{project_id}"
+    labels = {"method": "GET", "route": route, "status": "200"}
+    requests_before = HTTP_REQUESTS.value(**labels)
+    statements_before = DB_STATEMENTS.value(route=route)
+
+    assert client.get(f"/api/v1/projects/{project.id}").status_code == 200
+    assert client.get("/no/such/path").status_code == 404
+
+    assert HTTP_REQUESTS.value(**labels) == requests_before + 1
+    assert DB_STATEMENTS.value(route=route) > statements_before
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert f'http_requests_total{{method="GET",route="{route}",status="200"}}' in body
+    assert 'route="unmatched",status="404"' in body
+    assert "http_request_duration_seconds_bucket" in body
+    assert 'db_pool_connections{state="checked_out"}' in body
+
+
+def test_autoclose_runs_are_measured(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    now = datetime.utcnow()
+    with factory() as session:
+        project = ProjectRepository(session=session).create(name="Late", description="")
+        task_repo = TaskRepository(session=session)
+        for hours in (1, 2):
+            task_repo.create(project.id, "Late", "", now - timedelta(hours=hours))
+        session.commit()
+
+    closed_before = AUTOCLOSE_CLOSED.value(job="worker")
+    lag_before = AUTOCLOSE_LAG.count(job="worker")
+    claim_and_close_overdue(now, batch_size=10, session_factory=factory)
+
+    assert AUTOCLOSE_CLOSED.value(job="worker") == closed_before + 2
+    assert AUTOCLOSE_LAG.count(job="worker") == lag_before + 2
+    engine.dispose()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.repositories.cache import LookupCache
+from app.repositories.project_repository import ProjectRepository
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lookup_cache_evicts_least_recently_used_and_expires() -> None:
+    """Entries beyond max_size are evicted LRU-first and reloaded after the TTL."""
+    clock = FakeClock()
+    cache = LookupCache(max_size=2, ttl=10, clock=clock)
+    loads: list[str] = []
+
+    def lookup(key: str) -> str:
+        return cache.get_or_load(key, lambda: loads.append(key) or key.upper())
+
+    assert lookup("a") == "A"
+    lookup("b")
+    lookup("a")  # hit, makes "b" the least recently used
+    lookup("c")  # evicts "b"
+    lookup("b")
+    assert loads == ["a", "b", "c", "b"]
+
+    clock.now = 11
+    lookup("b")
+    assert loads[-1] == "b"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 5
+    assert stats["evictions"] == 2
+
+
+def test_disabled_cache_always_loads() -> None:
+    cache = LookupCache(max_size=0, ttl=10)
+    loads = []
+    for _ in range(2):
+        cache.get_or_load("key", lambda: loads.append(1))
+    assert len(loads) == 2
+    assert cache.stats()["size"] == 0
+
+
+@pytest.fixture
+def cache() -> LookupCache:
+    return LookupCache(max_size=16, ttl=60)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        engine.dispose()
+
+
+def test_project_mutations_invalidate_cached_lookups_on_commit(
+    session_factory,
+    cache: LookupCache,
+) -> None:
+    """Entries change when the writer commits, never earlier and never stale."""
+    with session_factory() as session:
+        project = ProjectRepository(session=session, cache=cache).create(
+            name="Cached", description="Cache test"
+        )
+        session.commit()
+
+    with session_factory() as reader, session_factory() as writer:
+        readers = ProjectRepository(session=reader, cache=cache)
+        writers = ProjectRepository(session=writer, cache=cache)
+        assert readers.get_id_by_name("Cached") == project.id
+        assert readers.exists(project.id)
+
+        writers.update(project.id, "Renamed", "Cache test")
+        # The writer sees its own change; the others keep the committed state.
+        assert writers.get_id_by_name("Cached") is None
+        assert writers.get_id_by_name("Renamed") == project.id
+        assert readers.get_id_by_name("Cached") == project.id
+        assert cache.stats()["hits"] == 1
+
+        writer.commit()
+        reader.rollback()
+        assert readers.get_id_by_name("Cached") is None
+        assert readers.get_id_by_name("Renamed") == project.id
+
+        writers.delete(project.id)
+        writer.commit()
+        reader.rollback()
+        assert not readers.exists(project.id)
+        assert readers.get_id_by_name("Renamed") is None
+
+
+def test_missing_projects_are_not_cached(session_factory, cache: LookupCache) -> None:
+    """A lookup that finds nothing must not hide a project created later."""
+    with session_factory() as session:
+        projects = ProjectRepository(session=session, cache=cache)
+        assert projects.get_id_by_name("Later") is None
+        assert not projects.exists(1)
+    assert cache.stats()["size"] == 0
+
+    with session_factory() as session:
+        project = ProjectRepository(session=session, cache=cache).create(
+            name="Later", description="Created after a miss"
+        )
+        session.commit()
+
+    with session_factory() as session:
+        projects = ProjectRepository(session=session, cache=cache)
+        assert projects.get_id_by_name("Later") == project.id
+        assert projects.exists(project.id)
+
+
+def test_rolled_back_mutations_keep_cached_lookups(
+    session_factory,
+    cache: LookupCache,
+) -> None:
+    with session_factory() as session:
+        projects = ProjectRepository(session=session, cache=cache)
+        project = projects.create(name="Kept", description="Rollback test")
+        session.commit()
+        assert projects.get_id_by_name("Kept") == project.id
+
+        projects.update(project.id, "Discarded", "Rollback test")
+        session.rollback()
+        assert projects.get_id_by_name("Kept") == project.id
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.exceptions import BusinessRuleViolation, LimitExceededError
+from app.models import ProjectORM
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+
+
+@pytest.fixture
+def repos(db_session: Session) -> tuple[ProjectRepository, TaskRepository]:
+    return ProjectRepository(session=db_session), TaskRepository(session=db_session)
+
+
+def _counts(project_repo: ProjectRepository, project_id: int) -> tuple[int, int, int, int]:
+    project = project_repo.get_by_id(project_id)
+    return (
+        project.task_count,
+        project.todo_count,
+        project.doing_count,
+        project.done_count,
+    )
+
+
+def test_counters_follow_create_status_change_and_delete(repos) -> None:
+    """Project counters should track every task mutation."""
+    project_repo, task_repo = repos
+    project = project_repo.create(name="Counter Project", description="Counters")
+
+    first = task_repo.create(project.id, "First", "First task")
+    second = task_repo.create(project.id, "Second", "Second task")
+    assert _counts(project_repo, project.id) == (2, 2, 0, 0)
+
+    task_repo.update_status(first.id, "doing")
+    assert _counts(project_repo, project.id) == (2, 1, 1, 0)
+
+    task_repo.update_status(first.id, "done")
+    task_repo.update_status(first.id, "done")
+    assert _counts(project_repo, project.id) == (2, 1, 0, 1)
+
+    task_repo.delete(second.id)
+    assert _counts(project_repo, project.id) == (1, 0, 0, 1)
+
+
+def test_close_overdue_moves_counts_to_done(repos) -> None:
+    """Bulk auto-close should move the closed tasks' counts to 'done'."""
+    project_repo, task_repo = repos
+    now = datetime.utcnow()
+    project = project_repo.create(name="Counter Overdue", description="Counters")
+
+    overdue = task_repo.create(project.id, "Overdue", "Overdue", now - timedelta(days=1))
+    task_repo.update_status(overdue.id, "doing")
+    task_repo.create(project.id, "Overdue 2", "Overdue", now - timedelta(days=1))
+    task_repo.create(project.id, "Future", "Future", now + timedelta(days=1))
+
+    task_repo.close_overdue(now, batch_size=1)
+
+    assert _counts(project_repo, project.id) == (3, 1, 0, 2)
+
+
+def test_task_quota_is_enforced_from_counter(repos) -> None:
+    """Adding a task beyond max_tasks_per_project should be refused."""
+    project_repo, task_repo = repos
+    service = TaskService(
+        task_repo=task_repo,
+        project_repo=project_repo,
+        max_tasks_per_project=2,
+    )
+    project = project_repo.create(name="Quota Project", description="Quota")
+
+    service.add_task_to_project(project.id, "One", "One", None)
+    service.add_task_to_project(project.id, "Two", "Two", None)
+
+    with pytest.raises(BusinessRuleViolation):
+        service.add_task_to_project(project.id, "Three", "Three", None)
+
+    assert _counts(project_repo, project.id) == (2, 2, 0, 0)
+
+
+def test_project_quota_is_enforced_in_insert(repos) -> None:
+    """Creating a project beyond max_projects should be refused."""
+    project_repo, _task_repo = repos
+    existing = len(project_repo.list_all())
+    service = ProjectService(project_repo=project_repo, max_projects=existing + 1)
+
+    service.create_project(name="Last Allowed", description="Fits the quota")
+
+    with pytest.raises(BusinessRuleViolation):
+        service.create_project(name="One Too Many", description="Over the quota")
+
+    assert project_repo.get_by_name("One Too Many") is None
+
+
+def test_concurrent_project_creates_cannot_overshoot_the_limit(tmp_path) -> None:
+    """Racing creates should stop exactly at max_projects."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'limit.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    racers = 8
+    start = threading.Barrier(racers)
+
+    def create(i: int) -> bool:
+        with factory() as session:
+            start.wait()
+            try:
+                ProjectRepository(session=session).create(
+                    name=f"Racer {i}", description="Racing", max_projects=3
+                )
+            except LimitExceededError:
+                return False
+            session.commit()
+            return True
+
+    try:
+        with ThreadPoolExecutor(max_workers=racers) as pool:
+            created = list(pool.map(create, range(racers)))
+        with factory() as session:
+            total = session.scalar(select(func.count()).select_from(ProjectORM))
+    finally:
+        engine.dispose()
+
+    assert created.count(True) == 3
+    assert total == 3
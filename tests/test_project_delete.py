@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.delete_project import delete_project_in_chunks
+from app.db.base import Base
+from app.models import ProjectORM, TaskORM
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_project_delete_leaves_tasks_to_the_database_cascade(
+    db_session,
+    engine,
+) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    project = project_repo.create(name="Cascade", description="Many tasks")
+    TaskRepository(session=db_session).create_many(
+        project.id,
+        [{"title": f"Task {i}", "description": "", "deadline": None} for i in range(50)],
+    )
+    db_session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        project_repo.delete(project.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # One SELECT of the project and one DELETE; tasks are never loaded.
+    assert len(statements) == 2
+    remaining = select(func.count()).where(TaskORM.project_id == project.id)
+    assert db_session.execute(remaining).scalar_one() == 0
+
+
+def test_chunked_delete_keeps_counters_consistent(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'delete.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with session_factory() as session:
+        project = ProjectRepository(session=session).create(name="Huge", description="")
+        task_repo = TaskRepository(session=session)
+        task_repo.create_many(
+            project.id,
+            [{"title": f"Task {i}", "description": "", "deadline": None} for i in range(7)],
+        )
+        task_repo.delete_project_chunk(project.id, 3)
+        session.commit()
+        session.refresh(project)
+        assert (project.task_count, project.todo_count) == (4, 4)
+
+    def run() -> int:
+        return delete_project_in_chunks(
+            project.id, batch_size=3, session_factory=session_factory
+        )
+
+    assert run() == 4
+    # Running again after the project is gone is a no-op.
+    assert run() == 0
+
+    with session_factory() as session:
+        assert session.get(ProjectORM, project.id) is None
+        assert session.execute(select(func.count()).select_from(TaskORM)).scalar_one() == 0
+    engine.dispose()
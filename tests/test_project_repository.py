@@ -50,6 +50,27 @@ def test_create_project_with_duplicate_name_raises(
         )
 
 
+def test_duplicate_name_leaves_the_transaction_to_the_caller(
+    project_repo: ProjectRepository,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A rename that hits the unique index raises without rolling the session back."""
+    project_repo.create(name="Taken", description="First project")
+    project = project_repo.create(name="Free", description="Second project")
+    # As if "Taken" was committed by another request after the name check
+    monkeypatch.setattr(project_repo, "get_id_by_name", lambda name: None)
+
+    with pytest.raises(UniqueConstraintError):
+        project_repo.update(
+            project_id=project.id,
+            new_name="Taken",
+            new_description="Renamed",
+        )
+
+    assert db_session.in_transaction()
+
+
 def test_update_project_changes_name_and_description(
     project_repo: ProjectRepository,
 ) -> None:
@@ -114,3 +135,27 @@ def test_delete_project_cascades_to_tasks(
 
     remaining_tasks = task_repo.list_by_project(project.id)
     assert remaining_tasks == []
+
+
+def test_list_all_page_returns_next_key_until_last_page(
+    project_repo: ProjectRepository,
+) -> None:
+    """list_all_page should page by id and stop with next_key=None."""
+    created = [
+        project_repo.create(name=f"Paged Project {i}", description="Paging test")
+        for i in range(3)
+    ]
+    created_ids = {p.id for p in created}
+
+    seen_ids: list[int] = []
+    after_id = None
+    while True:
+        page = project_repo.list_all_page(limit=2, after_id=after_id)
+        assert len(page.items) <= 2
+        seen_ids.extend(p.id for p in page.items)
+        if page.next_key is None:
+            break
+        after_id = page.next_key
+
+    assert seen_ids == sorted(seen_ids)
+    assert created_ids <= set(seen_ids)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from tests.test_task_patch_delete import count_statements
+
+
+def test_stats_are_one_query_per_call(
+    client: TestClient,
+    db_session,
+    engine,
+) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    busy = project_repo.create(name="Busy", description="Has deadlines")
+    empty = project_repo.create(name="Empty", description="No tasks")
+
+    now = datetime.utcnow()
+    overdue = task_repo.create(busy.id, "Overdue", "", deadline=now - timedelta(days=2))
+    task_repo.create(busy.id, "Soon", "", deadline=now + timedelta(days=1))
+    task_repo.create(busy.id, "Later", "", deadline=now + timedelta(days=5))
+    done = task_repo.create(busy.id, "Done late", "", deadline=now - timedelta(days=3))
+    task_repo.update_status(done.id, "done")
+    task_repo.update_status(overdue.id, "doing")
+    task_repo.create(busy.id, "Someday", "")
+    db_session.flush()
+
+    with count_statements(engine) as statements:
+        response = client.get(f"/api/v1/projects/{busy.id}/stats")
+    assert response.status_code == 200
+    assert len(statements) == 1
+    body = response.json()
+    assert body["project_id"] == busy.id
+    counts = [body[name] for name in ("task_count", "todo_count", "doing_count", "done_count")]
+    assert counts == [5, 3, 1, 1]
+    assert body["overdue_count"] == 1
+    assert body["next_deadline"].startswith((now + timedelta(days=1)).date().isoformat())
+
+    with count_statements(engine) as statements:
+        response = client.get("/api/v1/projects/stats")
+    assert response.status_code == 200
+    assert len(statements) == 2
+    body = response.json()
+    by_id = {row["project_id"]: row for row in body["items"]}
+    assert by_id[empty.id]["task_count"] == 0
+    assert by_id[empty.id]["overdue_count"] == 0
+    assert by_id[empty.id]["next_deadline"] is None
+    assert body["totals"]["task_count"] == sum(row["task_count"] for row in body["items"])
+    assert body["totals"]["overdue_count"] >= 1
+    assert body["totals"]["next_deadline"] is not None
+
+    assert client.get("/api/v1/projects/999999/stats").status_code == 404
+
+
+def test_stats_are_paginated(client: TestClient, db_session, engine) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    projects = [
+        project_repo.create(name=f"Stats {i}", description="") for i in range(3)
+    ]
+    now = datetime.utcnow()
+    for project in projects:
+        task_repo.create(project.id, "Overdue", "", deadline=now - timedelta(days=1))
+    db_session.flush()
+
+    first = client.get("/api/v1/projects/stats", params={"limit": 2}).json()
+    assert [row["project_id"] for row in first["items"]] == [p.id for p in projects[:2]]
+    assert first["totals"]["task_count"] == 3
+    assert first["totals"]["overdue_count"] == 3
+
+    with count_statements(engine) as statements:
+        response = client.get(
+            "/api/v1/projects/stats",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+        )
+    assert len(statements) == 1
+    second = response.json()
+    assert [row["project_id"] for row in second["items"]] == [projects[2].id]
+    assert second["items"][0]["overdue_count"] == 1
+    assert second["next_cursor"] is None
+    assert second["totals"] is None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.models import TaskORM
+from app.models.task import OPEN_TASK_PREDICATE
+
+
+def _explain(session: Session, stmt) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN output for a statement as one string."""
+    compiled = stmt.compile(session.get_bind())
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {compiled}", params
+    )
+    return " | ".join(row[3] for row in rows)
+
+
+def test_list_by_project_uses_listing_index(db_session: Session) -> None:
+    """Listing a project's tasks should search the (project_id, id) index."""
+    stmt = (
+        select(TaskORM)
+        .where(TaskORM.project_id == 1)
+        .order_by(TaskORM.id)
+    )
+
+    plan = _explain(db_session, stmt)
+
+    assert "ix_tasks_project_listing" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_overdue_scan_uses_partial_deadline_index(db_session: Session) -> None:
+    """The overdue scan should use the partial index on open task deadlines."""
+    stmt = (
+        select(TaskORM)
+        .where(TaskORM.deadline.is_not(None))
+        .where(TaskORM.deadline < datetime.utcnow())
+        .where(text(OPEN_TASK_PREDICATE))
+        .order_by(TaskORM.deadline)
+    )
+
+    plan = _explain(db_session, stmt)
+
+    assert "ix_tasks_open_deadline" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_session
+from app.api.main import create_app
+from app.db.query_tracker import (
+    QueryBudgetExceeded,
+    assert_max_queries,
+    statement_shape,
+    track_queries,
+    tracked_job,
+)
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def _seed(db_session: Session) -> tuple[int, int]:
+    project = ProjectRepository(session=db_session).create(name="Budget", description="")
+    task = TaskRepository(session=db_session).create(project.id, "Alpha", "first", None)
+    db_session.flush()
+    return project.id, task.id
+
+
+def test_statement_shape_collapses_parameter_lists() -> None:
+    assert statement_shape(
+        "SELECT * FROM tasks\n  WHERE id IN (?, ?, ?)"
+    ) == statement_shape("SELECT * FROM tasks WHERE id IN (?)")
+    assert statement_shape(
+        "INSERT INTO t (a, b) VALUES (%(a_0)s, %(b_0)s), (%(a_1)s, %(b_1)s)"
+    ) == "INSERT INTO t (a, b) VALUES (?...)"
+    assert statement_shape("SELECT 1 WHERE id = $1") == "SELECT 1 WHERE id = $1"
+
+
+def test_repeated_shapes_are_reported_as_n_plus_one(db_session: Session, caplog) -> None:
+    projects = ProjectRepository(session=db_session)
+    ids = [projects.create(name=f"N+1 {i}", description="").id for i in range(3)]
+
+    with caplog.at_level(logging.WARNING, logger="app.db.query_tracker"):
+        with tracked_job("lookup") as stats:
+            for project_id in ids:
+                projects.get_view(project_id)
+
+    [(shape, count)] = stats.repeated(threshold=3).items()
+    assert count == 3 and shape.startswith("SELECT")
+    assert "[lookup] possible N+1: statement ran 3 times" in caplog.text
+
+
+def test_nested_trackers_see_their_own_block(db_session: Session) -> None:
+    projects = ProjectRepository(session=db_session)
+    project_id = projects.create(name="Nested", description="").id
+
+    with track_queries("outer") as outer:
+        projects.get_view(project_id)
+        with track_queries("inner") as inner:
+            projects.get_view(project_id)
+
+    assert (outer.count, inner.count) == (2, 1)
+
+
+def test_budget_failure_lists_statements(db_session: Session) -> None:
+    projects = ProjectRepository(session=db_session)
+    project_id = projects.create(name="Over", description="").id
+
+    with pytest.raises(QueryBudgetExceeded, match="at most 1 statement") as excinfo:
+        with assert_max_queries(1):
+            projects.get_view(project_id)
+            projects.get_view(project_id)
+    assert "2x SELECT" in str(excinfo.value)
+
+    with pytest.raises(QueryBudgetExceeded, match="more than 1 time"):
+        with assert_max_queries(10, max_repeats=1):
+            projects.get_view(project_id)
+            projects.get_view(project_id)
+
+
+# Statements per request for the main endpoints. Raising one of these
+# should be a deliberate change, not an accidental N+1.
+ENDPOINT_BUDGETS = [
+    ("GET", "/api/v1/projects", None, 1),
+    ("GET", "/api/v1/projects/{project_id}", None, 2),
+    ("GET", "/api/v1/projects/{project_id}/tasks", None, 2),
+    ("GET", "/api/v1/projects/{project_id}/tasks/{task_id}", None, 2),
+    ("GET", "/api/v1/projects/stats", None, 2),
+    ("GET", "/api/v1/projects/{project_id}/stats", None, 1),
+    ("GET", "/api/v1/tasks", None, 1),
+    ("GET", "/api/v1/tasks/search?q=alpha", None, 1),
+    ("POST", "/api/v1/projects", {"name": "Created", "description": "x"}, 2),
+    ("PUT", "/api/v1/projects/{project_id}", {"name": "Renamed", "description": "x"}, 3),
+    ("POST", "/api/v1/projects/{project_id}/tasks", {"title": "New", "description": "x"}, 3),
+    ("PATCH", "/api/v1/projects/{project_id}/tasks/{task_id}", {"title": "Renamed"}, 2),
+    ("DELETE", "/api/v1/projects/{project_id}/tasks/{task_id}", None, 2),
+]
+
+
+@pytest.mark.parametrize("method,path,body,budget", ENDPOINT_BUDGETS)
+def test_endpoint_query_budget(
+    client: TestClient,
+    db_session: Session,
+    query_budget,
+    method: str,
+    path: str,
+    body,
+    budget: int,
+) -> None:
+    project_id, task_id = _seed(db_session)
+    url = path.format(project_id=project_id, task_id=task_id)
+
+    with query_budget(budget, max_repeats=1):
+        response = client.request(method, url, json=body)
+
+    assert response.status_code < 400
+
+
+def test_debug_headers_report_request_statements(db_session: Session) -> None:
+    project_id, _ = _seed(db_session)
+    app = create_app(debug_queries=True)
+
+    def _override_get_session() -> Generator[Session, None, None]:
+        yield db_session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    with TestClient(app) as debug_client:
+        response = debug_client.get(f"/api/v1/projects/{project_id}")
+
+    assert response.status_code == 200
+    assert response.headers["x-db-query-count"] == "2"
+    assert float(response.headers["x-db-query-time-ms"]) >= 0
+    assert response.headers["x-db-repeated-queries"] == "0"
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import fields
+
+from fastapi.testclient import TestClient
+
+from app.api.schemas import ProjectRead, TaskRead
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.read_models import ProjectView, TaskView
+from app.repositories.task_repository import TaskRepository
+
+
+def test_read_models_select_the_response_columns() -> None:
+    project_fields = {field.name for field in fields(ProjectView)}
+    assert project_fields == set(ProjectRead.model_fields) | {"version"}
+    # closed_at isn't stored; responses carry it as null.
+    task_fields = {field.name for field in fields(TaskView)}
+    assert task_fields == set(TaskRead.model_fields) - {"closed_at"}
+
+
+def test_get_endpoints_serve_read_models_without_loading_entities(
+    client: TestClient,
+    db_session,
+) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    project = project_repo.create(name="Views", description="Read models")
+    task = task_repo.create(project.id, "Read me", "Single GET")
+    expected_project = ProjectRead.model_validate(project).model_dump(mode="json")
+    expected_task = TaskRead.model_validate(task).model_dump(mode="json")
+
+    db_session.expunge_all()
+    view = task_repo.get_view(task.id)
+    assert isinstance(view, TaskView)
+    assert len(db_session.identity_map) == 0
+
+    response = client.get(f"/api/v1/projects/{project.id}")
+    assert response.status_code == 200
+    assert response.json() == expected_project
+
+    response = client.get(f"/api/v1/projects/{project.id}/tasks/{task.id}")
+    assert response.status_code == 200
+    assert response.json() == expected_task
+
+    response = client.get(f"/api/v1/projects/{project.id + 1}/tasks/{task.id}")
+    assert response.status_code == 404
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.routing import RoutingSession
+from app.exceptions import NotFoundError
+from app.models import ProjectORM
+from app.repositories.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+def routed_session_factory(tmp_path):
+    """
+    Two SQLite files standing in for a primary and its replica.
+
+    The replica holds a project the primary does not, so a test can tell
+    which database served a read.
+    """
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+
+    with sessionmaker(bind=replica)() as session:
+        session.add(ProjectORM(name="Replica only", description="Seeded"))
+        session.commit()
+
+    try:
+        yield sessionmaker(
+            class_=RoutingSession,
+            bind=primary,
+            replicas=[replica],
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    finally:
+        primary.dispose()
+        replica.dispose()
+
+
+def test_reads_go_to_the_replica(routed_session_factory) -> None:
+    """List queries of a read-only unit of work should be served by the replica."""
+    with UnitOfWork(routed_session_factory) as uow:
+        names = [project.name for project in uow.projects.list_all()]
+        assert not uow.session.uses_primary
+
+    assert names == ["Replica only"]
+
+
+def test_writes_go_to_the_primary_and_stick(routed_session_factory) -> None:
+    """After a write the session should read its own writes from the primary."""
+    with UnitOfWork(routed_session_factory) as uow:
+        assert uow.projects.get_by_name("Replica only") is not None
+
+        project = uow.projects.create(name="Primary", description="Written")
+        uow.tasks.create(project.id, "Task", "Written")
+
+        assert uow.session.uses_primary
+        assert uow.projects.get_by_name("Replica only") is None
+        assert [p.name for p in uow.projects.list_all()] == ["Primary"]
+        assert [t.title for t in uow.tasks.list_by_project(project.id)] == ["Task"]
+
+    # A new unit of work starts on the replica again.
+    with UnitOfWork(routed_session_factory) as uow:
+        assert [p.name for p in uow.projects.list_all()] == ["Replica only"]
+
+
+def test_objects_read_from_the_replica_are_reloaded_before_a_write(
+    routed_session_factory,
+) -> None:
+    """A mutation must not act on a stale object loaded from the replica."""
+    with UnitOfWork(routed_session_factory) as uow:
+        stale = uow.projects.get_by_name("Replica only")
+        assert stale is not None
+
+        with pytest.raises(NotFoundError):
+            uow.projects.update(stale.id, "Renamed", "Only on the replica")
+
+
+def test_search_is_served_by_the_replica(routed_session_factory) -> None:
+    """Full-text search is a read and must not pin the session to the primary."""
+    with UnitOfWork(routed_session_factory) as uow:
+        page = uow.tasks.search("anything")
+        assert page.items == []
+        assert not uow.session.uses_primary
+        assert [p.name for p in uow.projects.list_all()] == ["Replica only"]
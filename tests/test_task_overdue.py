@@ -145,3 +145,33 @@ def test_auto_close_overdue_tasks_with_service(task_env):
 
     overdue_after = task_repo.list_overdue_open_tasks(now)
     assert overdue_after == []
+
+
+def test_close_overdue_closes_all_chunks_and_returns_ids(task_env):
+    """
+    close_overdue should close every overdue open task, even when the
+    backlog spans several chunks, and leave other tasks untouched.
+    """
+    project_repo, task_repo, _service = task_env
+    now = datetime.utcnow()
+
+    tasks = _create_sample_tasks(
+        project_repo,
+        task_repo,
+        now,
+        project_name="Overdue Project (bulk close test)",
+    )
+
+    closed_ids = task_repo.close_overdue(now, batch_size=1)
+
+    assert {
+        tasks["overdue_open_older"].id,
+        tasks["overdue_open_newer"].id,
+    } <= set(closed_ids)
+    assert tasks["future_task"].id not in closed_ids
+    assert tasks["no_deadline_task"].id not in closed_ids
+    assert tasks["done_task"].id not in closed_ids
+
+    assert task_repo.get_by_id(tasks["overdue_open_older"].id).status == "done"
+    assert task_repo.get_by_id(tasks["future_task"].id).status == "todo"
+    assert task_repo.list_overdue_open_tasks(now) == []
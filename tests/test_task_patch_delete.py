@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+@contextmanager
+def count_statements(engine):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_patch_and_delete_are_scoped_single_statements(
+    client: TestClient,
+    db_session,
+    engine,
+) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    project = project_repo.create(name="Patch", description="One round trip")
+    other = project_repo.create(name="Other", description="Not the owner")
+    task = task_repo.create(project.id, "Original", "Kept")
+    url = f"/api/v1/projects/{project.id}/tasks/{task.id}"
+
+    with count_statements(engine) as statements:
+        response = client.patch(url, json={"title": "  Renamed ", "status": "doing"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert response.json()["description"] == "Kept"
+    assert response.json()["status"] == "doing"
+    # status lock read, UPDATE ... RETURNING, counter/version update
+    assert len(statements) == 3
+
+    db_session.refresh(project)
+    assert (project.todo_count, project.doing_count) == (0, 1)
+
+    other_url = f"/api/v1/projects/{other.id}/tasks/{task.id}"
+    assert client.patch(other_url, json={"title": "Stolen"}).status_code == 404
+    # An invalid body on a foreign task is still a 404, as before.
+    assert client.patch(other_url, json={"status": "blocked"}).status_code == 404
+    assert client.patch(url, json={"status": "blocked"}).status_code == 400
+    assert client.delete(other_url).status_code == 404
+
+    with count_statements(engine) as statements:
+        assert client.delete(url).status_code == 204
+    # DELETE ... RETURNING, counter/version update
+    assert len(statements) == 2
+
+    db_session.refresh(project)
+    assert (project.task_count, project.doing_count) == (0, 0)
+    assert client.delete(url).status_code == 404
+    assert client.patch(url, json={}).status_code == 404
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_query import MAX_QUERY_PROJECTS, TaskFilter
+from app.repositories.task_repository import TaskRepository
+
+NOW = datetime(2030, 6, 10, 12, 0)
+
+
+def test_query_filters_across_projects_and_pages_by_keyset(
+    client: TestClient,
+    db_session,
+) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    projects = [
+        project_repo.create(name=f"Query {i}", description="") for i in range(3)
+    ]
+    due_this_week = []
+    for day, project in enumerate(projects * 2):
+        task = task_repo.create(
+            project.id, f"Due in {day}", "", deadline=NOW + timedelta(days=day)
+        )
+        task_repo.update_in_project(project.id, task.id, {"status": "doing"})
+        due_this_week.append(task.id)
+    late = task_repo.create(projects[0].id, "Late", "", deadline=NOW - timedelta(days=1))
+    task_repo.create(projects[1].id, "Someday", "")
+
+    params = {
+        "status": "doing",
+        "deadline_from": NOW.isoformat(),
+        "deadline_before": (NOW + timedelta(days=7)).isoformat(),
+        "sort": "deadline",
+        "limit": 4,
+    }
+    first = client.get("/api/v1/tasks", params=params).json()
+    second = client.get(
+        "/api/v1/tasks", params={**params, "cursor": first["next_cursor"]}
+    ).json()
+    assert second["next_cursor"] is None
+    ids = [item["id"] for item in first["items"] + second["items"]]
+    assert ids == due_this_week
+
+    descending = task_repo.query(
+        TaskFilter(project_ids=(projects[0].id,)), sort="created_at", descending=True
+    )
+    assert descending.items[0].id == late.id
+
+    overdue = task_repo.query(TaskFilter(overdue=True), now=NOW)
+    assert [task.id for task in overdue.items] == [late.id]
+
+    response = client.get("/api/v1/tasks", params={"sort": "title"})
+    assert response.status_code == 422
+    response = client.get("/api/v1/tasks", params={"sort": "deadline", "cursor": "Wzld"})
+    assert response.status_code == 400
+
+
+FILTERS = {
+    "none": TaskFilter(),
+    "status": TaskFilter(statuses=("done",)),
+    "statuses": TaskFilter(statuses=("doing", "todo")),
+    "project": TaskFilter(project_ids=(1,)),
+    "projects": TaskFilter(project_ids=(1, 2)),
+    "deadline": TaskFilter(deadline_from=NOW, deadline_before=NOW),
+    "created": TaskFilter(created_from=NOW, created_before=NOW),
+    "overdue": TaskFilter(overdue=True),
+}
+
+# Index that drives each (sort, filter) query; no plan may sort the rows
+# it selected ("TEMP B-TREE"). "SCAN tasks" is a scan in primary key
+# order that stops after the page. Several statuses or projects are
+# merged ranges of that index. Deadline ranges not sorted by deadline
+# and creation ranges not sorted by created_at are rejected.
+EXPECTED_PLANS = {
+    ("id", "none"): "SCAN tasks",
+    ("id", "status"): "ix_tasks_status_id",
+    ("id", "statuses"): "ix_tasks_status_id",
+    ("id", "project"): "ix_tasks_project_listing",
+    ("id", "projects"): "ix_tasks_project_listing",
+    ("id", "overdue"): "ix_tasks_open_id",
+    ("deadline", "none"): "ix_tasks_deadline_id",
+    ("deadline", "status"): "ix_tasks_status_deadline",
+    ("deadline", "statuses"): "ix_tasks_status_deadline",
+    ("deadline", "project"): "ix_tasks_project_deadline",
+    ("deadline", "projects"): "ix_tasks_project_deadline",
+    ("deadline", "deadline"): "ix_tasks_deadline_id",
+    ("deadline", "overdue"): "ix_tasks_open_deadline",
+    ("created_at", "none"): "ix_tasks_created_id",
+    ("created_at", "status"): "ix_tasks_status_created",
+    ("created_at", "statuses"): "ix_tasks_status_created",
+    ("created_at", "project"): "ix_tasks_project_created",
+    ("created_at", "projects"): "ix_tasks_project_created",
+    ("created_at", "created"): "ix_tasks_created_id",
+    ("created_at", "overdue"): "ix_tasks_open_created",
+}
+
+# With a keyset position, an unfiltered id-sorted page reads the primary
+# key range after it instead.
+EXPECTED_PAGED_PLANS = {
+    **EXPECTED_PLANS,
+    ("id", "none"): "INTEGER PRIMARY KEY",
+}
+
+
+@pytest.mark.parametrize("sort, filter_name", sorted(EXPECTED_PLANS))
+@pytest.mark.parametrize("paged", [False, True])
+def test_query_plans_use_a_matching_index(
+    db_session,
+    engine,
+    sort: str,
+    filter_name: str,
+    paged: bool,
+) -> None:
+    plans: list[str] = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            rows = cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" | ".join(row[3] for row in rows.fetchall()))
+
+    after = None
+    if paged:
+        after = (7,) if sort == "id" else (NOW, 7)
+
+    event.listen(engine, "before_cursor_execute", explain)
+    try:
+        TaskRepository(session=db_session).query(
+            FILTERS[filter_name], sort=sort, after=after, now=NOW
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", explain)
+
+    plans_by_key = EXPECTED_PAGED_PLANS if paged else EXPECTED_PLANS
+    plan = plans[-1]
+    assert plans_by_key[(sort, filter_name)] in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize(
+    "filter_name, sort",
+    [
+        ("deadline", "id"),
+        ("deadline", "created_at"),
+        ("created", "id"),
+        ("created", "deadline"),
+    ],
+)
+def test_time_ranges_in_another_order_are_rejected(
+    client: TestClient,
+    db_session,
+    filter_name: str,
+    sort: str,
+) -> None:
+    with pytest.raises(ValueError, match="must be sorted by deadline"):
+        TaskRepository(session=db_session).query(FILTERS[filter_name], sort=sort)
+
+    params = {f"{filter_name}_from": NOW.isoformat(), "sort": sort}
+    assert client.get("/api/v1/tasks", params=params).status_code == 422
+    params["sort"] = "deadline" if filter_name == "deadline" else "created_at"
+    assert client.get("/api/v1/tasks", params=params).status_code == 200
+
+
+def test_merged_statuses_and_projects_keep_the_page_order(db_session) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    projects = [
+        project_repo.create(name=f"Merge {i}", description="") for i in range(3)
+    ]
+    expected = []
+    for day in range(6):
+        project = projects[day % 3]
+        task = task_repo.create(
+            project.id, f"Day {day}", "", deadline=NOW + timedelta(days=day)
+        )
+        status = ("todo", "doing", "done")[day % 3]
+        if status != "todo":
+            task_repo.update_in_project(project.id, task.id, {"status": status})
+        if status != "done":
+            expected.append(task.id)
+
+    filters = TaskFilter(
+        statuses=("todo", "doing"), project_ids=tuple(p.id for p in projects)
+    )
+    for descending in (False, True):
+        ids, after = [], None
+        while True:
+            page = task_repo.query(
+                filters, sort="deadline", descending=descending, limit=3, after=after
+            )
+            ids += [task.id for task in page.items]
+            if page.next_key is None:
+                break
+            after = page.next_key
+        assert ids == (expected[::-1] if descending else expected)
+
+    by_status = task_repo.query(TaskFilter(statuses=("doing", "todo")), limit=100)
+    assert [task.id for task in by_status.items] == sorted(
+        task.id for task in by_status.items
+    )
+    assert set(expected) <= {task.id for task in by_status.items}
+
+    too_many = TaskFilter(project_ids=tuple(range(MAX_QUERY_PROJECTS + 1)))
+    with pytest.raises(ValueError, match="At most"):
+        task_repo.query(too_many)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def test_search_ranks_title_matches_and_tracks_changes(db_session) -> None:
+    project_repo = ProjectRepository(session=db_session)
+    task_repo = TaskRepository(session=db_session)
+    home = project_repo.create(name="Home", description="")
+    work = project_repo.create(name="Work", description="")
+    in_description = task_repo.create(home.id, "Errands", "Pick up milk and bread")
+    in_title = task_repo.create(home.id, "Buy milk", "Corner shop")
+    other_project = task_repo.create(work.id, "Milk budget", "Office kitchen")
+    task_repo.create(home.id, "Running", "Tie the shoes")
+
+    hits = task_repo.search("milk").items
+    assert [task.id for task in hits][-1] == in_description.id
+    assert {task.id for task in hits} == {
+        in_description.id,
+        in_title.id,
+        other_project.id,
+    }
+
+    scoped = task_repo.search("milk", project_id=home.id)
+    assert [task.id for task in scoped.items] == [in_title.id, in_description.id]
+
+    # Stemmed words match, and edits and deletes reach the index.
+    assert [task.title for task in task_repo.search("runs").items] == ["Running"]
+    task_repo.update_in_project(home.id, in_title.id, {"title": "Buy oat drink"})
+    task_repo.delete_in_project(work.id, other_project.id)
+    assert [task.id for task in task_repo.search("milk").items] == [in_description.id]
+    assert task_repo.search("  ?! ").items == []
+
+
+def test_search_endpoint_pages_through_ranked_results(
+    client: TestClient,
+    db_session,
+) -> None:
+    project = ProjectRepository(session=db_session).create(name="Paged", description="")
+    task_repo = TaskRepository(session=db_session)
+    for i in range(3):
+        task_repo.create(project.id, f"Report {i}", "Quarterly report")
+    ranked = task_repo.search("report").items
+
+    first = client.get("/api/v1/tasks/search", params={"q": "report", "limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()["items"]) == 2
+    cursor = first.json()["next_cursor"]
+
+    second = client.get(
+        "/api/v1/tasks/search",
+        params={"q": "report", "limit": 2, "cursor": cursor},
+    )
+    assert len(second.json()["items"]) == 1
+    assert second.json()["next_cursor"] is None
+    ids = [item["id"] for item in first.json()["items"] + second.json()["items"]]
+    assert ids == [task.id for task in ranked]
+
+    # The cursor is the (rank, id) position of the last task, not an offset.
+    rank, last_id = decode_cursor(cursor)
+    assert isinstance(rank, float) and last_id == ids[1]
+    invalid = client.get(
+        "/api/v1/tasks/search",
+        params={"q": "report", "cursor": encode_cursor(2)},
+    )
+    assert invalid.status_code == 400
+
+    assert client.get("/api/v1/tasks/search", params={"q": ""}).status_code == 422
@@ -66,3 +66,43 @@ def test_change_task_status_for_missing_task_raises(task_service):
 
     with pytest.raises(AppError):
         service.change_task_status(task_id=missing_task_id, new_status="done")
+
+
+def test_change_status_many_updates_only_tasks_of_the_project(task_service):
+    """
+    change_status_many should update the project's tasks in one go,
+    skip ids from other projects and keep the counters correct.
+    """
+    service, project_repo, task_repo = task_service
+
+    project = project_repo.create(name="Bulk Status", description="Board")
+    other = project_repo.create(name="Bulk Status Other", description="Board")
+    first = task_repo.create(project.id, "First", "Card")
+    second = task_repo.create(project.id, "Second", "Card")
+    foreign = task_repo.create(other.id, "Foreign", "Card")
+
+    updated = service.change_status_many(
+        task_ids=[second.id, first.id, foreign.id, first.id],
+        new_status="doing",
+        project_id=project.id,
+    )
+
+    assert [task.id for task in updated] == [first.id, second.id]
+    assert all(task.status == "doing" for task in updated)
+    assert task_repo.get_by_id(foreign.id).status == "todo"
+
+    refreshed = project_repo.get_by_id(project.id)
+    assert (refreshed.todo_count, refreshed.doing_count) == (0, 2)
+
+
+def test_change_status_many_rejects_unknown_status(task_service):
+    """An invalid status should be rejected before touching the database."""
+    service, project_repo, _task_repo = task_service
+    project = project_repo.create(name="Bulk Status Invalid", description="Board")
+
+    with pytest.raises(AppError):
+        service.change_status_many(
+            task_ids=[1],
+            new_status="archived",
+            project_id=project.id,
+        )
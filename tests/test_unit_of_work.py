@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def test_unit_of_work_commits_on_clean_exit(session_factory) -> None:
+    """Writes made through the repositories are committed once at the end."""
+    with UnitOfWork(session_factory) as uow:
+        project = uow.projects.create(name="UoW Commit", description="Committed")
+        uow.tasks.create(project.id, "Task", "Committed task")
+
+    with session_factory() as session:
+        stored = ProjectRepository(session=session).get_by_name("UoW Commit")
+        assert stored is not None
+        assert stored.task_count == 1
+        ProjectRepository(session=session).delete(stored.id)
+        session.commit()
+
+
+def test_unit_of_work_rolls_back_when_block_raises(session_factory) -> None:
+    """Nothing written inside a failing block should be persisted."""
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session_factory) as uow:
+            uow.projects.create(name="UoW Rollback", description="Rolled back")
+            raise RuntimeError("boom")
+
+    with session_factory() as session:
+        assert ProjectRepository(session=session).get_by_name("UoW Rollback") is None